@@ -1,7 +1,26 @@
 # coding: utf-8
 
+import os
+import abc
+import struct
+import pickle
+import socket
+import json
+import hashlib
+import tempfile
+import time
+import threading
+import http.server
+import html
 import random
 import math
+import bisect
+import itertools
+from collections import namedtuple, deque, OrderedDict
+from types import MappingProxyType
+import concurrent.futures
+from multiprocessing import shared_memory
+import numpy as np
 import pandas as pd
 import xlwt
 from openpyxl import Workbook
@@ -20,6 +39,13 @@ LIST_SCORING_DICE_VALUE = [1, 5]
 # List of associated score for scoring dice values
 LIST_SCORING_MULTIPLIER = [100, 50]
 
+# Minimum size in bits of a dice value occurrence in the packed occurrences of a roll
+OCCURRENCE_FIELD_BITS = 4
+# Above this number of dices to roll, the dices value occurrences are sampled from the multinomial distribution
+LARGE_POOL_NB_DICES = 15
+# Number of (game rules, nb dices, nb dices to roll) roll odds kept by the DiceGameTurn LRU cache
+ROLL_ODDS_CACHE_SIZE = 256
+
 # Trigger for multiple bonus
 TRIGGER_OCCURRENCE_FOR_BONUS = 3
 # Special bonus multiplier for multiple ace bonus
@@ -28,6 +54,99 @@ BONUS_VALUE_FOR_ACE_BONUS = 1000
 BONUS_VALUE_FOR_NORMAL_BONUS = 100
 
 
+# ----------------------< Snapshot constants  >-------------------------------------------------------------------------
+
+# Magic bytes and layout version of the DiceGameModel binary snapshots
+MODEL_SNAPSHOT_MAGIC = b'DGMS'
+MODEL_SNAPSHOT_VERSION = 1
+
+
+# ----------------------< Decision hints constants  >-------------------------------------------------------------------
+
+# Turn score horizon of the decision hints tables, as a multiple of the highest one roll marking threshold
+HINTS_HORIZON_RATIO = 4
+# Maximum number of score states of the decision hints tables, bounds the horizon of the sets that rarely bust
+HINTS_MAX_SCORE_STATE = 1024
+
+
+# ----------------------< Metrics constants  >--------------------------------------------------------------------------
+
+# Upper bounds in seconds of the decision latency histogram buckets
+METRICS_DECISION_LATENCY_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30, 60)
+# Period in seconds of the metrics file writer
+METRICS_FILE_INTERVAL = 15
+
+
+# ----------------------< Archive constants  >--------------------------------------------------------------------------
+
+# Magic bytes and layout version of the results archive index
+ARCHIVE_INDEX_MAGIC = b'DGRI'
+ARCHIVE_VERSION = 1
+# Seed of the archived runs done without seed (same bytes as the former int64 -1)
+ARCHIVE_NO_SEED = (1 << 64) - 1
+# Index record of an archived run
+ARCHIVE_INDEX_DTYPE = np.dtype([('ruleset', '<u8'), ('nb_dice', '<u2'), ('nb_turn', '<i8'), ('interval', '<i8'),
+                                ('seed', '<u8'), ('engine', 'S16'), ('created', '<f8'), ('offset', '<i8'),
+                                ('length', '<i8'), ('mean_turn_score', '<f8'), ('max_turn_score', '<f8')])
+
+
+# ----------------------< Distributed constants  >----------------------------------------------------------------------
+
+# Default address of the distributed coordinator
+DISTRIBUTED_HOST = '127.0.0.1'
+DISTRIBUTED_PORT = 47800
+# Period in seconds of the heartbeats sent by a worker while running a work unit
+DISTRIBUTED_HEARTBEAT_INTERVAL = 5
+# Silence in seconds after which the coordinator considers a busy worker lost and reissues its work unit
+DISTRIBUTED_WORKER_TIMEOUT = 30
+# Time in seconds a worker keeps retrying to reach the coordinator, and delay between the attempts
+DISTRIBUTED_CONNECT_TIMEOUT = 30
+DISTRIBUTED_CONNECT_RETRY_DELAY = 0.2
+# Period in seconds at which the coordinator checks for shutdown while waiting for workers
+DISTRIBUTED_ACCEPT_INTERVAL = 0.5
+
+
+# ----------------------< Analyses constants  >-------------------------------------------------------------------------
+
+# Number of buckets by distribution for the shared memory distributions
+SHARED_NB_BUCKETS = 1024
+# Size in bytes of a shared memory bucket (int64)
+SHARED_BUCKET_SIZE = 8
+
+# Default significant decimal digits of the HDR distributions
+HDR_SIGNIFICANT_DIGITS = 2
+
+# Significance level of the engine harness statistical tests, and minimum expected count of their cells
+HARNESS_ALPHA = 0.001
+HARNESS_MIN_EXPECTED = 5
+
+# Interval of the score distributions of the campaign aggregates
+CAMPAIGN_INTERVAL = 50
+
+# Number of turns by chunk of the turn record store
+RECORD_STORE_CHUNK_SIZE = 1 << 20
+# Size ratio between the roll chunks and the turn chunks of the turn record store
+ROLL_BY_TURN_CHUNK_RATIO = 4
+
+# Sampling period in seconds of the progress reporter
+PROGRESS_INTERVAL = 10
+
+# Number of games played in lockstep by the batch game engine
+BATCH_NB_GAME = 4096
+
+# Number of games played by a league task
+LEAGUE_BATCH_NB_GAME = 200
+# Maximum number of games of a league matchup before declaring it undecided
+LEAGUE_MAX_GAME_BY_MATCHUP = 20000
+
+# Maximum number of rows of a distribution table of the reports, and size in pixels of their histograms
+REPORT_TABLE_NB_ROWS = 100
+REPORT_SVG_WIDTH = 640
+REPORT_SVG_HEIGHT = 160
+# Quantiles of the summary table of the reports
+REPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+
 # ----------------------< Class handling roll statistics by individual turn >-------------------------------------------
 # constructor parameters :                  None
 #
@@ -44,6 +163,11 @@ BONUS_VALUE_FOR_NORMAL_BONUS = 100
 #   add_to_turn_nb_bonus()                  Accumulate the number of bonus during the turn
 #
 #   reset_statistics()
+#
+#   export_state()                          All the statistics in a tuple of int
+#   import_state(state)                     Restore the statistics from export_state() tuple
+#
+#   copy()                                  Independent copy of the statistics
 # ----------------------------------------------------------------------------------------------------------------------
 class DiceTurnStatistics:
     def __init__(self):
@@ -86,6 +210,19 @@ class DiceTurnStatistics:
         self._turn_nb_full_roll = 0
         self._turn_nb_bonus = 0
 
+    def export_state(self):
+        return self._turn_nb_roll, self._turn_nb_full_roll, self._turn_nb_bonus
+
+    def import_state(self, state):
+        self._turn_nb_roll, self._turn_nb_full_roll, self._turn_nb_bonus = state
+
+    def copy(self):
+        turn_statistics = DiceTurnStatistics.__new__(DiceTurnStatistics)
+        turn_statistics._turn_nb_roll = self._turn_nb_roll
+        turn_statistics._turn_nb_full_roll = self._turn_nb_full_roll
+        turn_statistics._turn_nb_bonus = self._turn_nb_bonus
+        return turn_statistics
+
 
 # ----------------------< Class handling full games statistics >--------------------------------------------------------
 # constructor parameters :                  None
@@ -110,6 +247,11 @@ class DiceTurnStatistics:
 #       ( player_index, dice_set)
 #
 #   reset_statistics()
+#
+#   export_state()                          All the statistics in a tuple of int
+#   import_state(state)                     Restore the statistics from export_state() tuple
+#
+#   copy()                                  Independent copy of the statistics
 # ----------------------------------------------------------------------------------------------------------------------
 class DiceGameStatistics:
     def __init__(self):
@@ -245,13 +387,37 @@ class DiceGameStatistics:
         self._sigma_scoring = 0
         self._sigma_non_scoring = 0
 
+    def export_state(self):
+        return (self._max_turn_scoring, self._max_turn_scoring_player_index,
+                self._max_turn_loss, self._max_turn_loss_player_index,
+                self._longest_turn, self._longest_turn_player_index,
+                self._nb_scoring_turn, self._nb_non_scoring_turn,
+                self._sigma_scoring, self._sigma_non_scoring)
+
+    def import_state(self, state):
+        (self._max_turn_scoring, self._max_turn_scoring_player_index,
+         self._max_turn_loss, self._max_turn_loss_player_index,
+         self._longest_turn, self._longest_turn_player_index,
+         self._nb_scoring_turn, self._nb_non_scoring_turn,
+         self._sigma_scoring, self._sigma_non_scoring) = state
+
+    def copy(self):
+        # All the attributes are int -> a shallow copy is independent
+        game_statistics = DiceGameStatistics.__new__(DiceGameStatistics)
+        game_statistics.__dict__.update(self.__dict__)
+        return game_statistics
+
 
 # ----------------------< Class handling game dice turns >--------------------------------------------------------------
 # constructor parameters :
 #   nb_dices                                Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   rng                                     Random generator with a randint() method (default->random module)
 #
 # getters :
 #
+#   rng()                                   Random generator used to roll the dices, None for the random module
+#                                               (also a setter)
+#   nb_dices()                              Total number of dices in the game set
 #   nb_dices_to_roll()                      Number of dices to roll for next throw
 #   scoring_dices_list()                    List of tuple (# of occurrence, value) for all the scoring dices
 #   nb_scoring_dices()                      Number of non scoring dices after last throw
@@ -262,12 +428,52 @@ class DiceGameStatistics:
 #   turn_lost_score()                       Total score lost during the turn
 #   turn_statistics()                       roll statistics for the current turn
 #   its_lost_roll()                         Status after the last throw, True for a lost turn
+#   packed_occurrences()                    (scoring, non scoring) dices value occurrences packed in int, hashable
+#                                               key of the roll status
+#   bust_probability()                      Probability that rolling the nb_dices_to_roll dices does not score
+#   expected_roll_score()                   Expected score of rolling the nb_dices_to_roll dices, 0 for a non
+#                                               scoring roll
+#   next_state_distribution()               Read only {(roll_score, next nb_dices_to_roll): probability} of rolling
+#                                               the nb_dices_to_roll dices, (0, 0) for a non scoring roll
 #
 # public methods :
 #
 #   roll_dices_and_count_roll_score()       Roll the dices and count the score done
 #
 #   prepare_for_next_turn()                 Prepare for a new turn
+#
+#   export_state()                          Roll and turn status, occurrence lists and turn statistics in a tuple
+#   import_state(state)                     Restore the status from export_state() tuple
+#
+#   copy()                                  Independent copy of the dice set, sharing the random generator
+#
+# Large pools : a roll of more than LARGE_POOL_NB_DICES dices samples its occurrence list directly, side by side with
+# binomial draws of rng.random(), and is scored from the counts without the rules table, so its cost does not depend
+# on the number of dices. Such rolls consume the random generator differently from the per dice rolls (see
+# DiceGameEngineHarness for their statistical checks).
+#
+# class methods :
+#
+#   count_occurrence_score                  Score a dices value occurrence list with the game rules
+#       (dices_value_occurrence_list)           -->  (roll_score, nb_bonus, scoring occurrence list,
+#                                                     non scoring occurrence list)
+#   sample_occurrence_list(nb_dices,        Occurrence list of a roll of nb_dices sampled from the multinomial
+#       random_function)                        distribution with random_function() uniform in [0, 1)
+#   rules_key()                             Game rules parameters in a hashable tuple
+#   roll_score_granularity()                Score step of the game rules (gcd of all the roll scores)
+#   roll_outcome_distribution(nb_dices)     Outcome probabilities of a roll of nb_dices, enumerated exactly up to
+#                                               LARGE_POOL_NB_DICES dices, computed side by side above
+#                                               -->  {(roll_score, nb_non_scoring_dices): probability}
+#   roll_odds(nb_dices, nb_dices_to_roll)   Exact odds of rolling nb_dices_to_roll dices of a set of nb_dices
+#                                               -->  (bust probability, expected roll score,
+#                                                     read only next state distribution)
+#
+# Above LARGE_POOL_NB_DICES dices the outcomes are not enumerated (C(nb_dices + 5, 5) occurrence lists) : since the
+# roll score and the number of non scoring dices are sums of per side functions of the side occurrence, their
+# distribution is built side by side over the sequential binomial share of the remaining dices, in
+# O(nb_dices^2 * nb scores) float operations. The roll odds are computed from roll_outcome_distribution() on first
+# request and kept in a LRU cache of
+# ROLL_ODDS_CACHE_SIZE entries, keyed by game rules, shared by all the instances and threads.
 # ----------------------------------------------------------------------------------------------------------------------
 class DiceGameTurn:
     # Class constants defining the game rules parameters for all instances
@@ -279,12 +485,28 @@ class DiceGameTurn:
     _bonus_value_for_ace_bonus = BONUS_VALUE_FOR_ACE_BONUS
     _bonus_value_for_normal_bonus = BONUS_VALUE_FOR_NORMAL_BONUS
 
-    def __init__(self, nb_dices=DEFAULT_DICES_NB):
+    # Roll scoring tables by rules class and occurrence field size
+    _packed_roll_table_dict = dict()
+
+    # LRU cache of the roll odds {(game rules, nb dices, nb dices to roll): roll odds}
+    _roll_odds_cache = OrderedDict()
+    _roll_odds_cache_lock = threading.Lock()
+
+    def __init__(self, nb_dices=DEFAULT_DICES_NB, rng=None):
         self._nb_dices = nb_dices
+        # None stands for the random module, which keeps the instance picklable
+        self._rng = rng
+
+        # Dices value occurrences packed in an int, one field of occurrence_bits by side (side 1 in the low bits)
+        self._occurrence_bits = max(OCCURRENCE_FIELD_BITS, nb_dices.bit_length())
+        self._side_increment_list = [1 << (side_index * self._occurrence_bits) for side_index in range(self._nb_side)]
+        self._roll_table = self._packed_roll_table(self._occurrence_bits)
 
         self._turn_statistics = DiceTurnStatistics()
-        self._non_scoring_occurrence_list = [0] * self._nb_side
-        self._scoring_occurrence_list = [0] * self._nb_side
+        self._non_scoring_occurrences = 0
+        self._scoring_occurrences = 0
+        self._nb_non_scoring_dices = 0
+        self._nb_scoring_dices = 0
         self._its_lost_roll = False
 
         self._roll_score = 0
@@ -301,42 +523,66 @@ class DiceGameTurn:
         output_str += str(self.turn_statistics)
         return output_str
 
+    @property
+    def rng(self):
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        self._rng = rng
+
+    @property
+    def nb_dices(self):
+        return self._nb_dices
+
     @property
     def nb_dices_to_roll(self):
         if self._its_lost_roll:
             # If it's a lost roll -> no remaining dice to roll
             return 0
 
-        if self._turn_score == 0 or self.nb_non_scoring_dices == 0:
+        if self._turn_score == 0 or self._nb_non_scoring_dices == 0:
             # If first roll of a turn or if all dices scored -> all dices should be rolled
             return self._nb_dices
 
         # Last turn was a scoring one -> Next roll will use the remaining non scoring dices
-        return self.nb_non_scoring_dices
+        return self._nb_non_scoring_dices
+
+    @property
+    def packed_occurrences(self):
+        return self._scoring_occurrences, self._non_scoring_occurrences
+
+    @property
+    def bust_probability(self):
+        return self.roll_odds(self._nb_dices, self.nb_dices_to_roll)[0]
+
+    @property
+    def expected_roll_score(self):
+        return self.roll_odds(self._nb_dices, self.nb_dices_to_roll)[1]
+
+    @property
+    def next_state_distribution(self):
+        return self.roll_odds(self._nb_dices, self.nb_dices_to_roll)[2]
 
     @property
     def scoring_dices_list(self):
         # Create a list of tuple (# of value occurrence, value) for all the scoring dices
         return [(Occurrence, Index + 1,) for Index, Occurrence in
-                enumerate(self._scoring_occurrence_list) if Occurrence > 0]
+                enumerate(self._unpack_occurrences(self._scoring_occurrences)) if Occurrence > 0]
 
     @property
     def non_scoring_dices_list(self):
         # Create a list of tuple (# of value occurrence, value) for all the non scoring dices
         return [(Occurrence, Index + 1,) for Index, Occurrence in
-                enumerate(self._non_scoring_occurrence_list) if Occurrence > 0]
+                enumerate(self._unpack_occurrences(self._non_scoring_occurrences)) if Occurrence > 0]
 
     @property
     def nb_scoring_dices(self):
-        # nb of dices by categories it's the sum of the dices value occurrence
-        # e.g. for this occurrence [ 0, 1, 1, 0, 0, 2] -> 4 dices
-        return sum(self._scoring_occurrence_list)
+        return self._nb_scoring_dices
 
     @property
     def nb_non_scoring_dices(self):
-        # nb of dices by categories it's the sum of the dices value occurrence
-        # e.g. for this occurrence [ 0, 1, 1, 0, 0, 2] -> 4 dices
-        return sum(self._non_scoring_occurrence_list)
+        return self._nb_non_scoring_dices
 
     @property
     def roll_score(self):
@@ -358,81 +604,60 @@ class DiceGameTurn:
     def its_lost_roll(self):
         return self._its_lost_roll
 
-    def roll_dices_and_count_roll_score(self):
-        def roll_dices():
-            def random_roll_generator():
-                # generator of nb_dice_roll random values in interval [0..nb_side[
-                dice_index = 0
-                while dice_index < self.nb_dices_to_roll:
-                    yield random.randint(0, self._nb_side - 1)
-                    dice_index += 1
-
-            # ----<Update the list of dices values occurrence by rolling all the dices who should be rolled>------------
-            # dices_value_occurrence_list is in the scope of all this set of helper functions
-            for random_side_index in random_roll_generator():
-                dices_value_occurrence_list[random_side_index] += 1
-
-            self._turn_statistics.increment_turn_nb_roll()
+    def _unpack_occurrences(self, packed_occurrences):
+        # e.g. with 4 bits fields 0x200110 -> [ 0, 1, 1, 0, 0, 2]
+        field_mask = (1 << self._occurrence_bits) - 1
+        return [(packed_occurrences >> (side_index * self._occurrence_bits)) & field_mask
+                for side_index in range(self._nb_side)]
 
-        def count_roll_score():
-            def count_bonus_roll_score():
-                # Compute score from bonus based on the multiple detection trigger level
-                # dices_value_occurrence_list is in the scope of all this set of helper functions
+    def _pack_occurrences(self, occurrence_list):
+        return sum(occurrence << (side_index * self._occurrence_bits)
+                   for side_index, occurrence in enumerate(occurrence_list))
 
-                bonus_occurrence_trigger = self._trigger_occurrence_for_bonus
-
-                # Test all the occurrences to detect bonus trigger values
-                for side_index, dices_occurrence in enumerate(dices_value_occurrence_list):
-
-                    nb_bonus = dices_occurrence // bonus_occurrence_trigger
-                    if nb_bonus > 0:
-                        # if there is a bonus
-
-                        #  select bonus multiplier for ace or other dice value
-                        bonus_multiplier = self._bonus_value_for_ace_bonus if side_index == 0 \
-                            else self._bonus_value_for_normal_bonus
-
-                        # Update roll score (index 0 reflect occurrence for value 1 ...)
-                        self._roll_score += nb_bonus * bonus_multiplier * (side_index + 1)
-
-                        # Update potential remainder (7 occurrences with trigger at 3 -> 1 occurrence)
-                        dices_value_occurrence_list[side_index] %= bonus_occurrence_trigger
-
-                        # Update scoring and non scoring dices occurrence list
-                        self._non_scoring_occurrence_list[side_index] = dices_value_occurrence_list[side_index]
-                        self._scoring_occurrence_list[side_index] = nb_bonus * bonus_occurrence_trigger
-
-                        # Update turn statistics
-                        self._turn_statistics.add_to_turn_nb_bonus(nb_bonus)
-                    else:
-                        # Update scoring and non scoring dices occurrence list for no bonus case
-                        self._scoring_occurrence_list[side_index] = 0
-                        self._non_scoring_occurrence_list[side_index] = dices_occurrence
-
-            def count_non_bonus_roll_score():
-                # For all the potential scoring values and multiplier from the rules in class constants
-                # dices_value_occurrence_list is in the scope of all this set of helper functions
-
-                for scoring_dice_value, scoring_multiplier in zip(self._list_scoring_dice_value,
-                                                                  self._list_scoring_multiplier):
-
-                    scoring_dice_index = scoring_dice_value - 1  # index 0 reflect occurrence for value 1 ...
-                    dice_occurrence_to_test = dices_value_occurrence_list[scoring_dice_index]
-
-                    if dice_occurrence_to_test > 0:
-                        # if there is a scoring dice occurrence
-
-                        # Update roll score
-                        self._roll_score += dice_occurrence_to_test * scoring_multiplier
-
-                        # Update scoring and non scoring dices occurrence list
-                        self._non_scoring_occurrence_list[scoring_dice_index] = 0
-                        self._scoring_occurrence_list[scoring_dice_index] += dice_occurrence_to_test
-
-            # ----<Count roll score>------------------------------------------------------------------------------------
-            self._roll_score = 0
-            count_bonus_roll_score()
-            count_non_bonus_roll_score()
+    def roll_dices_and_count_roll_score(self):
+        def roll_dices():
+            # ----<Pack the dices value occurrences by rolling all the dices who should be rolled>----------------------
+            randint = self._rng.randint if self._rng is not None else random.randint
+            side_increment_list = self._side_increment_list
+            max_side_index = self._nb_side - 1
+
+            packed_occurrences = 0
+            for _ in range(nb_dices_to_roll):
+                packed_occurrences += side_increment_list[randint(0, max_side_index)]
+
+            return packed_occurrences
+
+        def count_large_pool_roll_score():
+            # ----<Sample the occurrences and score them from the counts, too many combinations for the table>---------
+            roll_score, nb_bonus, scoring_occurrence_list, non_scoring_occurrence_list = self.count_occurrence_score(
+                self.sample_occurrence_list(nb_dices_to_roll,
+                                            self._rng.random if self._rng is not None else random.random))
+
+            self._roll_score = roll_score
+            self._scoring_occurrences = self._pack_occurrences(scoring_occurrence_list)
+            self._nb_scoring_dices = sum(scoring_occurrence_list)
+            self._non_scoring_occurrences = self._pack_occurrences(non_scoring_occurrence_list)
+            self._nb_non_scoring_dices = sum(non_scoring_occurrence_list)
+
+            if nb_bonus > 0:
+                self._turn_statistics.add_to_turn_nb_bonus(nb_bonus)
+
+        def count_roll_score(packed_occurrences):
+            # ----<Score the roll from the rules table, filled on first meeting of an occurrence combination>----------
+            roll_outcome = self._roll_table.get(packed_occurrences)
+            if roll_outcome is None:
+                roll_score, nb_bonus, scoring_occurrence_list, non_scoring_occurrence_list = \
+                    self.count_occurrence_score(self._unpack_occurrences(packed_occurrences))
+                roll_outcome = (roll_score, nb_bonus,
+                                self._pack_occurrences(scoring_occurrence_list), sum(scoring_occurrence_list),
+                                self._pack_occurrences(non_scoring_occurrence_list), sum(non_scoring_occurrence_list))
+                self._roll_table[packed_occurrences] = roll_outcome
+
+            (self._roll_score, nb_bonus, self._scoring_occurrences, self._nb_scoring_dices,
+             self._non_scoring_occurrences, self._nb_non_scoring_dices) = roll_outcome
+
+            if nb_bonus > 0:
+                self._turn_statistics.add_to_turn_nb_bonus(nb_bonus)
 
         def update_roll_status():
             # Scoring or non scoring roll status
@@ -451,12 +676,12 @@ class DiceGameTurn:
                 self._turn_statistics.increment_turn_nb_full_roll()
 
         # ----<Roll dices, count roll score and update roll status>-----------------------------------------------------
-
-        # dices_value_occurrence_list is in the scope of all this set of helper functions
-        dices_value_occurrence_list = [0] * self._nb_side
-
-        roll_dices()
-        count_roll_score()
+        nb_dices_to_roll = self.nb_dices_to_roll
+        self._turn_statistics.increment_turn_nb_roll()
+        if nb_dices_to_roll > LARGE_POOL_NB_DICES:
+            count_large_pool_roll_score()
+        else:
+            count_roll_score(roll_dices())
         update_roll_status()
 
     def prepare_for_next_turn(self):
@@ -466,13 +691,264 @@ class DiceGameTurn:
         self._turn_statistics.reset_statistics()
         self._its_lost_roll = False
 
+    def export_state(self):
+        return ((int(self._its_lost_roll), self._roll_score, self._turn_score, self._turn_lost_score)
+                + tuple(self._unpack_occurrences(self._scoring_occurrences))
+                + tuple(self._unpack_occurrences(self._non_scoring_occurrences))
+                + self._turn_statistics.export_state())
+
+    def import_state(self, state):
+        nb_side = self._nb_side
+        its_lost_roll, self._roll_score, self._turn_score, self._turn_lost_score = state[:4]
+        self._its_lost_roll = bool(its_lost_roll)
+        self._scoring_occurrences = self._pack_occurrences(state[4:4 + nb_side])
+        self._nb_scoring_dices = sum(state[4:4 + nb_side])
+        self._non_scoring_occurrences = self._pack_occurrences(state[4 + nb_side:4 + 2 * nb_side])
+        self._nb_non_scoring_dices = sum(state[4 + nb_side:4 + 2 * nb_side])
+        self._turn_statistics.import_state(state[4 + 2 * nb_side:])
+
+    def copy(self):
+        # The packed occurrences are int -> only the turn statistics need a copy
+        dice_set = self.__class__.__new__(self.__class__)
+        dice_set.__dict__.update(self.__dict__)
+        dice_set._turn_statistics = self._turn_statistics.copy()
+        return dice_set
+
+    @classmethod
+    def _packed_roll_table(cls, occurrence_bits):
+        # {packed roll occurrences: (roll score, nb bonus, packed scoring occurrences, nb scoring dices,
+        #                            packed non scoring occurrences, nb non scoring dices)}, shared by rules class
+        return DiceGameTurn._packed_roll_table_dict.setdefault((cls, occurrence_bits), dict())
+
+    @classmethod
+    def count_occurrence_score(cls, dices_value_occurrence_list):
+        # Same rules as roll_dices_and_count_roll_score() but working on a given occurrence list
+        # e.g. for this occurrence [ 3, 0, 0, 0, 1, 1] -> 1050 pts, 1 bonus, 4 scoring dices and 1 non scoring dice
+        remaining_occurrence_list = list(dices_value_occurrence_list)
+        scoring_occurrence_list = [0] * cls._nb_side
+        roll_score = 0
+        nb_bonus = 0
+
+        # Bonus for multiple dices value
+        for side_index, dices_occurrence in enumerate(remaining_occurrence_list):
+            side_nb_bonus = dices_occurrence // cls._trigger_occurrence_for_bonus
+            if side_nb_bonus > 0:
+                bonus_multiplier = cls._bonus_value_for_ace_bonus if side_index == 0 \
+                    else cls._bonus_value_for_normal_bonus
+
+                roll_score += side_nb_bonus * bonus_multiplier * (side_index + 1)
+                nb_bonus += side_nb_bonus
+
+                remaining_occurrence_list[side_index] %= cls._trigger_occurrence_for_bonus
+                scoring_occurrence_list[side_index] = side_nb_bonus * cls._trigger_occurrence_for_bonus
+
+        # Remaining scoring dices value
+        for scoring_dice_value, scoring_multiplier in zip(cls._list_scoring_dice_value, cls._list_scoring_multiplier):
+            scoring_dice_index = scoring_dice_value - 1
+            roll_score += remaining_occurrence_list[scoring_dice_index] * scoring_multiplier
+            scoring_occurrence_list[scoring_dice_index] += remaining_occurrence_list[scoring_dice_index]
+            remaining_occurrence_list[scoring_dice_index] = 0
+
+        return roll_score, nb_bonus, scoring_occurrence_list, remaining_occurrence_list
+
+    @staticmethod
+    def _binomial_variate(nb_trial, probability, random_function):
+        # Inversion of the binomial distribution, the cumulative sum starting from the mode and alternating above
+        # and below it : O(standard deviation) steps instead of O(nb_trial)
+        if nb_trial == 0 or probability <= 0:
+            return 0
+        if probability >= 1:
+            return nb_trial
+
+        odds = probability / (1 - probability)
+        mode = min(int((nb_trial + 1) * probability), nb_trial)
+        mode_probability = math.exp(math.lgamma(nb_trial + 1) - math.lgamma(mode + 1) -
+                                    math.lgamma(nb_trial - mode + 1) + mode * math.log(probability) +
+                                    (nb_trial - mode) * math.log(1 - probability))
+
+        remaining = random_function() - mode_probability
+        upper_index = lower_index = mode
+        upper_probability = lower_probability = mode_probability
+        while remaining >= 0:
+            if upper_index < nb_trial:
+                upper_probability *= (nb_trial - upper_index) / (upper_index + 1) * odds
+                upper_index += 1
+                remaining -= upper_probability
+                if remaining < 0:
+                    return upper_index
+            if lower_index > 0:
+                lower_probability *= lower_index / (nb_trial - lower_index + 1) / odds
+                lower_index -= 1
+                remaining -= lower_probability
+                if remaining < 0:
+                    return lower_index
+            if upper_index == nb_trial and lower_index == 0:
+                # Only the rounding of the probabilities sum is left
+                break
+        return mode
+
+    @classmethod
+    def sample_occurrence_list(cls, nb_dices, random_function):
+        # Each side takes a binomial share of the dices remaining for it and the next sides
+        occurrence_list = [0] * cls._nb_side
+        nb_remaining_dices = nb_dices
+        for side_index in range(cls._nb_side - 1):
+            occurrence_list[side_index] = cls._binomial_variate(nb_remaining_dices, 1 / (cls._nb_side - side_index),
+                                                                random_function)
+            nb_remaining_dices -= occurrence_list[side_index]
+        occurrence_list[-1] = nb_remaining_dices
+        return occurrence_list
+
+    @classmethod
+    def rules_key(cls):
+        return (cls._nb_side, tuple(cls._list_scoring_dice_value), tuple(cls._list_scoring_multiplier),
+                cls._trigger_occurrence_for_bonus, cls._bonus_value_for_ace_bonus, cls._bonus_value_for_normal_bonus)
+
+    @classmethod
+    def roll_score_granularity(cls):
+        # All the roll scores are multiples of the gcd of the scoring multipliers and of the bonus values
+        score_granularity = cls._bonus_value_for_ace_bonus
+        for scoring_multiplier in cls._list_scoring_multiplier:
+            score_granularity = math.gcd(score_granularity, scoring_multiplier)
+        for side_index in range(1, cls._nb_side):
+            score_granularity = math.gcd(score_granularity, cls._bonus_value_for_normal_bonus * (side_index + 1))
+        return score_granularity
+
+    @classmethod
+    def _side_outcome_list(cls, side_index, dices_occurrence):
+        # (roll score, nb non scoring dices) of dices_occurrence dices of one side, the rules being per side
+        occurrence_list = [0] * cls._nb_side
+        occurrence_list[side_index] = dices_occurrence
+        roll_score, _, _, non_scoring_occurrence_list = cls.count_occurrence_score(occurrence_list)
+        return roll_score, non_scoring_occurrence_list[side_index]
+
+    @classmethod
+    def _large_pool_outcome_distribution(cls, nb_dices):
+        nb_side = cls._nb_side
+        score_granularity = cls.roll_score_granularity()
+        side_outcome_table = [[cls._side_outcome_list(side_index, dices_occurrence)
+                               for dices_occurrence in range(nb_dices + 1)] for side_index in range(nb_side)]
+
+        # Bounds of the (score step, nb non scoring dices) plane : best score by dice and worst non scoring sum
+        max_score_step = nb_dices * max(roll_score / dices_occurrence for side_outcome_list in side_outcome_table
+                                        for dices_occurrence, (roll_score, _) in enumerate(side_outcome_list)
+                                        if dices_occurrence > 0) // score_granularity
+        max_nb_non_scoring = min(nb_dices, sum(max(nb_non_scoring for _, nb_non_scoring in side_outcome_list)
+                                               for side_outcome_list in side_outcome_table))
+        log_factorial_array = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, nb_dices + 1)))))
+
+        # probability_array[remaining dices, score step, nb non scoring dices] of the sides already drawn, the sides
+        # are drawn from the lowest scoring so the reached part of the plane (score_reach, non_scoring_reach) grows late
+        probability_array = np.zeros((nb_dices + 1, int(max_score_step) + 1, max_nb_non_scoring + 1))
+        probability_array[nb_dices, 0, 0] = 1.0
+        score_reach = non_scoring_reach = 0
+        side_order = sorted(range(nb_side), key=lambda side_index: side_outcome_table[side_index][nb_dices][0])
+        for side_rank, side_index in enumerate(side_order):
+            next_probability_array = np.zeros_like(probability_array)
+            next_score_reach = next_non_scoring_reach = 0
+            # Share of the remaining dices showing this side, the last side takes them all
+            probability = 1 / (nb_side - side_rank)
+            for dices_occurrence in range(nb_dices + 1):
+                roll_score, nb_non_scoring = side_outcome_table[side_index][dices_occurrence]
+                score_step = roll_score // score_granularity
+                score_end = min(score_step + score_reach + 1, probability_array.shape[1])
+                non_scoring_end = min(nb_non_scoring + non_scoring_reach + 1, probability_array.shape[2])
+                next_score_reach = max(next_score_reach, score_end - 1)
+                next_non_scoring_reach = max(next_non_scoring_reach, non_scoring_end - 1)
+
+                if side_rank == nb_side - 1:
+                    # Only the states with exactly dices_occurrence remaining dices end here
+                    next_probability_array[0, score_step:score_end, nb_non_scoring:non_scoring_end] += \
+                        probability_array[dices_occurrence, :score_end - score_step, :non_scoring_end - nb_non_scoring]
+                    continue
+
+                remaining_array = np.arange(dices_occurrence, nb_dices + 1)
+                weight_array = np.exp(log_factorial_array[remaining_array] - log_factorial_array[dices_occurrence] -
+                                      log_factorial_array[remaining_array - dices_occurrence] +
+                                      dices_occurrence * math.log(probability) +
+                                      (remaining_array - dices_occurrence) * math.log(1 - probability))
+                next_probability_array[:nb_dices + 1 - dices_occurrence, score_step:score_end,
+                                       nb_non_scoring:non_scoring_end] += \
+                    probability_array[dices_occurrence:, :score_end - score_step,
+                                      :non_scoring_end - nb_non_scoring] * weight_array[:, None, None]
+            probability_array = next_probability_array
+            score_reach, non_scoring_reach = next_score_reach, next_non_scoring_reach
+
+        score_step_array, nb_non_scoring_array = np.nonzero(probability_array[0])
+        return {(int(score_step) * score_granularity, int(nb_non_scoring)): float(probability_array[0][score_step,
+                                                                                                    nb_non_scoring])
+                for score_step, nb_non_scoring in zip(score_step_array.tolist(), nb_non_scoring_array.tolist())}
+
+    @classmethod
+    def roll_outcome_distribution(cls, nb_dices):
+        if nb_dices > LARGE_POOL_NB_DICES:
+            return cls._large_pool_outcome_distribution(nb_dices)
+
+        def occurrence_list_generator(nb_remaining_dices, nb_remaining_side):
+            # generator of all the occurrence lists of nb_remaining_dices on nb_remaining_side sides
+            if nb_remaining_side == 1:
+                yield [nb_remaining_dices]
+                return
+
+            for dices_occurrence in range(nb_remaining_dices + 1):
+                for occurrence_list in occurrence_list_generator(nb_remaining_dices - dices_occurrence,
+                                                                 nb_remaining_side - 1):
+                    yield [dices_occurrence] + occurrence_list
+
+        # ----<Multinomial probability of every occurrence list, grouped by score and remaining dices>-----------------
+        outcome_distribution = dict()
+        nb_roll_outcome = cls._nb_side ** nb_dices
+
+        for dices_value_occurrence_list in occurrence_list_generator(nb_dices, cls._nb_side):
+            nb_permutation = math.factorial(nb_dices)
+            for dices_occurrence in dices_value_occurrence_list:
+                nb_permutation //= math.factorial(dices_occurrence)
+
+            roll_score, _, _, non_scoring_occurrence_list = cls.count_occurrence_score(dices_value_occurrence_list)
+            outcome_key = (roll_score, sum(non_scoring_occurrence_list))
+            outcome_distribution[outcome_key] = outcome_distribution.get(outcome_key, 0) + nb_permutation
+
+        return {outcome_key: nb_permutation / nb_roll_outcome
+                for outcome_key, nb_permutation in outcome_distribution.items()}
+
+    @classmethod
+    def roll_odds(cls, nb_dices, nb_dices_to_roll):
+        cache_key = (cls.rules_key(), nb_dices, nb_dices_to_roll)
+        with DiceGameTurn._roll_odds_cache_lock:
+            roll_odds = DiceGameTurn._roll_odds_cache.get(cache_key)
+            if roll_odds is not None:
+                DiceGameTurn._roll_odds_cache.move_to_end(cache_key)
+                return roll_odds
+
+        # ----<Computed out of the lock, two threads may compute the same odds but store the same values>--------------
+        next_state_distribution = dict()
+        for (roll_score, nb_non_scoring_dices), probability in cls.roll_outcome_distribution(nb_dices_to_roll).items():
+            # After a scoring roll, all the dices are rolled again if they all scored
+            if roll_score == 0:
+                next_state = (0, 0)
+            else:
+                next_state = (roll_score, nb_non_scoring_dices if nb_non_scoring_dices > 0 else nb_dices)
+            next_state_distribution[next_state] = next_state_distribution.get(next_state, 0) + probability
+
+        roll_odds = (next_state_distribution.get((0, 0), 0.0),
+                     sum(probability * roll_score for (roll_score, _), probability in next_state_distribution.items()),
+                     MappingProxyType(next_state_distribution))
+
+        with DiceGameTurn._roll_odds_cache_lock:
+            DiceGameTurn._roll_odds_cache[cache_key] = roll_odds
+            if len(DiceGameTurn._roll_odds_cache) > ROLL_ODDS_CACHE_SIZE:
+                DiceGameTurn._roll_odds_cache.popitem(last=False)
+        return roll_odds
+
 
 # ----------------------< Class handling players status a statistics >--------------------------------------------------
 # constructor parameters :
 #   players_names_list                      List of players name
+#   rng                                     Random generator with a shuffle() method (default->random module)
 #
 # getters :
 #
+#   rng()                                   Random generator used to shuffle the players order (also a setter)
 #   best_score()                            Current best total score
 #   player_rank()                           Current player rank
 #   index_of_player_with_best_score()       Index of the player with best total score (rank 1)
@@ -499,10 +975,19 @@ class DiceGameTurn:
 #                                                                 'nb_full_roll': , 'total_lost_score': ,
 #                                                                 'nb_bonus': }
 #   reset_status()
+#
+#   export_state()                          Players names (in playing order) and a flat tuple of all the players
+#                                               totals --> (names list, (score, nb_roll, nb_full_roll,
+#                                               total_lost_score, nb_bonus) * nb players)
+#   import_state(names_list, totals)        Restore the players from export_state()
+#
+#   copy()                                  Independent copy of the players, names list included
 # ----------------------------------------------------------------------------------------------------------------------
 class DiceGamePlayers:
-    def __init__(self, players_names_list):
+    def __init__(self, players_names_list, rng=None):
         self._nb_players = len(players_names_list)
+        # None stands for the random module, which keeps the instance picklable
+        self._rng = rng
 
         self._players_names_list = players_names_list
         self._players_score_list = [0] * self._nb_players
@@ -527,6 +1012,14 @@ class DiceGamePlayers:
     def __len__(self):
         return self._nb_players
 
+    @property
+    def rng(self):
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        self._rng = rng
+
     def player_name(self, player_index):
         return self._players_names_list[player_index]
 
@@ -590,7 +1083,7 @@ class DiceGamePlayers:
 
     def reset_status(self):
         def shuffle_players_order():
-            random.shuffle(self._players_names_list)
+            (self._rng if self._rng is not None else random).shuffle(self._players_names_list)
 
         # ----<Reset players statistics and shuffle player name list >--------------------------------------------------
         self._players_score_list = [0] * self._nb_players
@@ -601,12 +1094,46 @@ class DiceGamePlayers:
 
         shuffle_players_order()
 
+    def export_state(self):
+        totals = []
+        for player_index in range(self._nb_players):
+            totals += (self._players_score_list[player_index],
+                       self._player_total_nb_roll[player_index],
+                       self._player_total_nb_full_roll[player_index],
+                       self._player_total_lost_score[player_index],
+                       self._player_total_nb_bonus[player_index])
+        return self._players_names_list, tuple(totals)
+
+    def import_state(self, names_list, totals):
+        # The names list is updated in place as it can be shared with the caller
+        self._players_names_list[:] = names_list
+        self._players_score_list = list(totals[0::5])
+        self._player_total_nb_roll = list(totals[1::5])
+        self._player_total_nb_full_roll = list(totals[2::5])
+        self._player_total_lost_score = list(totals[3::5])
+        self._player_total_nb_bonus = list(totals[4::5])
+
+    def copy(self):
+        players = DiceGamePlayers.__new__(DiceGamePlayers)
+        players._nb_players = self._nb_players
+        players._rng = self._rng
+        players._players_names_list = self._players_names_list[:]
+        players._players_score_list = self._players_score_list[:]
+        players._player_total_nb_roll = self._player_total_nb_roll[:]
+        players._player_total_nb_full_roll = self._player_total_nb_full_roll[:]
+        players._player_total_lost_score = self._player_total_lost_score[:]
+        players._player_total_nb_bonus = self._player_total_nb_bonus[:]
+        return players
+
 
 # ----------------------< Class handling player level turn >------------------------------------------------------------
 # constructor parameters :
 #   players_names_list                      List of players name
 #   nb_dices                                Total number of dices in the game set (default->DEFAULT_DICES_NB)
 #   target_score                            Target score to win (default->DEFAULT_TARGET_SCORE)
+#   rng                                     Random generator for the dices and the players order (default->random)
+#   players_dice_rng                        {player name: random generator} to give each player its own dices stream
+#                                               (default->None, all the players share rng)
 #
 # getters :
 #
@@ -632,12 +1159,53 @@ class DiceGamePlayers:
 #   update_status_and_game_statistics()      Update current player global statistics from the result of the turn
 #
 #   reset_game()
+#
+#   fork(rng, players_dice_rng, share_rng)  Cheap what-if copy of the model : the dice set is copied, the players
+#                                               and the game statistics are shared until one of the models updates
+#                                               them (copy on write). The forked model uses rng and
+#                                               players_dice_rng (default->new generators seeded from a copy of the
+#                                               model ones and the fork number, so the model dices stream is left
+#                                               untouched), or the model ones if share_rng is True. Raise
+#                                               TypeError when a model generator has no getstate() and no rng
+#                                               is given
+#
+#   to_bytes()                              Versioned binary snapshot of the whole game state, players order included
+#                                               (the random generators are not part of the snapshot)
+#
+# class methods :
+#
+#   from_bytes(snapshot, rng,               New model restored from a to_bytes() snapshot
+#       players_dice_rng)
+#
+# Snapshot layout (little endian) :
+#   header                                  magic, version, nb players, nb dices, target score, there is a winner,
+#                                               current player index, turn index
+#   dices set                               its lost roll, roll score, turn score, turn lost score,
+#                                               scoring occurrences, non scoring occurrences, turn statistics
+#   game statistics                         DiceGameStatistics.export_state() values
+#   players totals                          (score, nb roll, nb full roll, total lost score, nb bonus) by player
+#   players names                           (length, utf-8 bytes) by player, in playing order
 # ----------------------------------------------------------------------------------------------------------------------
 class DiceGameModel:
-    def __init__(self, players_names_list, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE):
-        self._players = DiceGamePlayers(players_names_list)
-        self._dice_set = DiceGameTurn(nb_dices)
+    # Precompiled snapshot layouts
+    _snapshot_header = struct.Struct('<4sBHHqBHI')
+    _snapshot_dice_set = struct.Struct('<B3q' + str(2 * NB_DICE_SIDE) + 'H3I')
+    _snapshot_game_statistics = struct.Struct('<10q')
+    _snapshot_name_length = struct.Struct('<H')
+    _snapshot_players_totals_dict = dict()
+
+    def __init__(self, players_names_list, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE, rng=None,
+                 players_dice_rng=None):
+        self._players = DiceGamePlayers(players_names_list, rng)
+        self._dice_set = DiceGameTurn(nb_dices, rng)
         self._game_statistics = DiceGameStatistics()
+        self._rng = rng
+        self._players_dice_rng = players_dice_rng
+
+        # True when the players and the game statistics may be shared with a forked model
+        self._its_shared_game_status = False
+        # Number of forks with derived random generators, keeps the forks streams distinct and reproducible
+        self._nb_fork = 0
 
         self._target_score = target_score
         self._there_is_a_winner = False
@@ -709,7 +1277,20 @@ class DiceGameModel:
         if self._current_player_index == 0:
             self._turn_index += 1
 
+        if self._players_dice_rng is not None:
+            self._dice_set.rng = self._players_dice_rng[self.turn_player_name]
+
+    def _own_game_status(self):
+        # Copy on write of the players and game statistics shared with a forked model
+        if self._its_shared_game_status:
+            self._players = self._players.copy()
+            self._players.rng = self._rng
+            self._game_statistics = self._game_statistics.copy()
+            self._its_shared_game_status = False
+
     def update_status_and_game_statistics(self):
+        self._own_game_status()
+
         # ----<End of a player turn :  statistics update>---------------------------------------------------------------
         self._players.update_player_statistics(self._current_player_index, self._dice_set)
         self._game_statistics.update_game_statistics(self._current_player_index, self._dice_set)
@@ -721,12 +1302,245 @@ class DiceGameModel:
         self._current_player_index %= len(self._players)
 
     def reset_game(self):
+        self._own_game_status()
+
         self._players.reset_status()
         self._game_statistics.reset_statistics()
         self._current_player_index = 0
         self._turn_index = 0
         self._there_is_a_winner = False
 
+    @staticmethod
+    def _fork_rng(rng, nb_fork, rng_index):
+        # New generator seeded from a copy of rng state, so drawing the seed does not advance rng itself
+        source = rng if rng is not None else random
+        if not hasattr(source, 'getstate'):
+            raise TypeError('cannot derive a reproducible fork generator from ' + type(source).__name__ +
+                            ' (no getstate()), pass rng and players_dice_rng to fork() or share_rng=True')
+
+        state_copy = random.Random()
+        state_copy.setstate(source.getstate())
+        return random.Random(state_copy.getrandbits(64) ^ (nb_fork << 16) ^ rng_index)
+
+    def fork(self, rng=None, players_dice_rng=None, share_rng=False):
+        if rng is None and not share_rng:
+            self._nb_fork += 1
+            rng = self._fork_rng(self._rng, self._nb_fork, 0)
+            if self._players_dice_rng is not None:
+                players_dice_rng = {player_name: self._fork_rng(player_rng, self._nb_fork, rng_index + 1)
+                                    for rng_index, (player_name, player_rng) in
+                                    enumerate(self._players_dice_rng.items())}
+
+        model = DiceGameModel.__new__(DiceGameModel)
+        model.__dict__.update(self.__dict__)
+
+        # ----<Turn level status is always copied, game level status is shared until updated>--------------------------
+        model._dice_set = self._dice_set.copy()
+
+        if rng is not None:
+            # New random generators for the forked model, the copied dice set keeps the model ones if shared
+            model._rng = rng
+            model._players_dice_rng = players_dice_rng
+            if players_dice_rng is not None:
+                model._dice_set.rng = players_dice_rng[self.turn_player_name]
+            else:
+                model._dice_set.rng = rng
+
+        self._its_shared_game_status = True
+        model._its_shared_game_status = True
+
+        return model
+
+    @classmethod
+    def _snapshot_players_totals(cls, nb_players):
+        if nb_players not in cls._snapshot_players_totals_dict:
+            cls._snapshot_players_totals_dict[nb_players] = struct.Struct('<' + str(5 * nb_players) + 'q')
+        return cls._snapshot_players_totals_dict[nb_players]
+
+    def to_bytes(self):
+        names_list, totals = self._players.export_state()
+        snapshot_part_list = [
+            self._snapshot_header.pack(MODEL_SNAPSHOT_MAGIC, MODEL_SNAPSHOT_VERSION, len(names_list),
+                                       self._dice_set.nb_dices, self._target_score, self._there_is_a_winner,
+                                       self._current_player_index, self._turn_index),
+            self._snapshot_dice_set.pack(*self._dice_set.export_state()),
+            self._snapshot_game_statistics.pack(*self._game_statistics.export_state()),
+            self._snapshot_players_totals(len(names_list)).pack(*totals)]
+
+        for player_name in names_list:
+            encoded_name = player_name.encode('utf-8')
+            snapshot_part_list.append(self._snapshot_name_length.pack(len(encoded_name)))
+            snapshot_part_list.append(encoded_name)
+
+        return b''.join(snapshot_part_list)
+
+    @classmethod
+    def from_bytes(cls, snapshot, rng=None, players_dice_rng=None):
+        (magic, version, nb_players, nb_dices, target_score, there_is_a_winner, current_player_index,
+         turn_index) = cls._snapshot_header.unpack_from(snapshot, 0)
+
+        if magic != MODEL_SNAPSHOT_MAGIC:
+            raise ValueError('not a dice game model snapshot')
+        if version != MODEL_SNAPSHOT_VERSION:
+            raise ValueError('unsupported dice game model snapshot version : ' + str(version))
+
+        # ----<Fixed size parts>----------------------------------------------------------------------------------------
+        offset = cls._snapshot_header.size
+        dice_set_state = cls._snapshot_dice_set.unpack_from(snapshot, offset)
+        offset += cls._snapshot_dice_set.size
+        game_statistics_state = cls._snapshot_game_statistics.unpack_from(snapshot, offset)
+        offset += cls._snapshot_game_statistics.size
+        snapshot_players_totals = cls._snapshot_players_totals(nb_players)
+        players_totals = snapshot_players_totals.unpack_from(snapshot, offset)
+        offset += snapshot_players_totals.size
+
+        # ----<Players names>-------------------------------------------------------------------------------------------
+        names_list = []
+        for _ in range(nb_players):
+            name_length, = cls._snapshot_name_length.unpack_from(snapshot, offset)
+            offset += cls._snapshot_name_length.size
+            names_list.append(bytes(snapshot[offset:offset + name_length]).decode('utf-8'))
+            offset += name_length
+
+        # ----<Restore the model>---------------------------------------------------------------------------------------
+        model = cls(names_list, nb_dices, target_score, rng, players_dice_rng)
+        model._dice_set.import_state(dice_set_state)
+        model._game_statistics.import_state(game_statistics_state)
+        model._players.import_state(names_list, players_totals)
+        model._there_is_a_winner = bool(there_is_a_winner)
+        model._current_player_index = current_player_index
+        model._turn_index = turn_index
+        # A game saved mid-turn resumes on the dice stream of the player whose turn it is, as fork() does
+        if players_dice_rng is not None:
+            model._dice_set.rng = players_dice_rng[model.turn_player_name]
+
+        return model
+
+
+# ----------------------< Class handling decision hints tables >--------------------------------------------------------
+# constructor parameters :
+#   nb_dices                                Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#
+# getters :
+#
+#   nb_dices()                              Total number of dices in the game set
+#   score_granularity()                     Score step of the game rules (gcd of all the roll scores)
+#
+# public methods :
+#
+#   bust_probability(nb_dices_to_roll)      Probability of a non scoring roll
+#   expected_roll_score(nb_dices_to_roll)   Expected roll score, 0 for a non scoring roll
+#   expected_gain                           Expected turn score change if the player rolls again once
+#       (turn_score, nb_dices_to_roll)
+#   mark_score(nb_dices_to_roll)            Turn score from which marking maximizes the expected turn score
+#   should_mark(turn_score, nb_dices_to_roll)
+#                                           True if marking maximizes the expected turn score
+#
+# The tables are computed once by game rules and number of dices, and shared by all the instances. The marking
+# scores come from the optimal stopping of a single turn (roll again while it raises the expected turn score) and
+# ignore the target score of the game. The turn scores are explored up to HINTS_HORIZON_RATIO times the highest one
+# roll marking threshold, within HINTS_MAX_SCORE_STATE score steps : a mark score at the horizon means rolling again
+# is better up to there (sets of 7 dices or more, whose rolls rarely or never bust).
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameDecisionHints:
+    # Class reference to the dice turn rules used for the tables
+    _dice_game_turn_class = DiceGameTurn
+
+    # {(game rules, nb dices): (bust probability list, expected roll score list, mark score list)}
+    _hints_tables_dict = dict()
+
+    def __init__(self, nb_dices=DEFAULT_DICES_NB):
+        self._nb_dices = nb_dices
+        self._score_granularity = self._dice_game_turn_class.roll_score_granularity()
+
+        tables_key = (self._dice_game_turn_class.rules_key(), nb_dices)
+        if tables_key not in self._hints_tables_dict:
+            self._hints_tables_dict[tables_key] = self._compute_tables()
+
+        self._bust_probability_list, self._expected_roll_score_list, self._mark_score_list = \
+            self._hints_tables_dict[tables_key]
+
+    def __str__(self):
+        output_str = ''
+        for nb_dices_to_roll in range(1, self._nb_dices + 1):
+            output_str += str(nb_dices_to_roll) + ' dices to roll : '
+            output_str += 'bust ' + '{:.1%}'.format(self._bust_probability_list[nb_dices_to_roll])
+            output_str += ', expected roll score ' + '{:.1f}'.format(self._expected_roll_score_list[nb_dices_to_roll])
+            output_str += ', mark from ' + str(self._mark_score_list[nb_dices_to_roll]) + '\n'
+        return output_str
+
+    @property
+    def nb_dices(self):
+        return self._nb_dices
+
+    @property
+    def score_granularity(self):
+        return self._score_granularity
+
+    def bust_probability(self, nb_dices_to_roll):
+        return self._bust_probability_list[nb_dices_to_roll]
+
+    def expected_roll_score(self, nb_dices_to_roll):
+        return self._expected_roll_score_list[nb_dices_to_roll]
+
+    def expected_gain(self, turn_score, nb_dices_to_roll):
+        # A scoring roll adds its score, a non scoring roll loses the whole turn score
+        return self._expected_roll_score_list[nb_dices_to_roll] - \
+            self._bust_probability_list[nb_dices_to_roll] * turn_score
+
+    def mark_score(self, nb_dices_to_roll):
+        return self._mark_score_list[nb_dices_to_roll]
+
+    def should_mark(self, turn_score, nb_dices_to_roll):
+        return turn_score >= self._mark_score_list[nb_dices_to_roll]
+
+    def _compute_tables(self):
+        # Tables are indexed by the number of dices to roll, index 0 is unused
+        nb_dices = self._nb_dices
+        granularity = self._score_granularity
+
+        roll_outcome_list = [None]
+        bust_probability_list = [1.0]
+        expected_roll_score_list = [0.0]
+        for nb_dices_to_roll in range(1, nb_dices + 1):
+            bust_probability, expected_roll_score, next_state_distribution = \
+                self._dice_game_turn_class.roll_odds(nb_dices, nb_dices_to_roll)
+            # Scoring outcomes only : (probability array, roll score step array, nb dices to roll next array)
+            scoring_outcome_list = [(probability, roll_score // granularity, nb_next_dices)
+                                    for (roll_score, nb_next_dices), probability in next_state_distribution.items()
+                                    if roll_score > 0]
+            roll_outcome_list.append(tuple(np.array(outcome_field) for outcome_field in zip(*scoring_outcome_list)))
+            bust_probability_list.append(bust_probability)
+            expected_roll_score_list.append(expected_roll_score)
+
+        # ----<Optimal stopping by decreasing turn score, marking is assumed beyond the horizon>----------------------
+        # A roll that can not bust has no one roll marking threshold (9 dices or more with the default rules), and
+        # the threshold grows as 1 / bust probability, so the horizon is capped to HINTS_MAX_SCORE_STATE states
+        one_roll_mark_score = max(expected_roll_score / bust_probability for expected_roll_score, bust_probability
+                                  in zip(expected_roll_score_list[1:], bust_probability_list[1:])
+                                  if bust_probability > 0)
+        nb_score_state = min(int(HINTS_HORIZON_RATIO * one_roll_mark_score) // granularity + 1, HINTS_MAX_SCORE_STATE)
+
+        # turn_value[score state, nb dices to roll] : expected final turn score with an optimal play, the states
+        # beyond the horizon hold their marked score
+        max_score_step = max(int(roll_outcome[1].max()) for roll_outcome in roll_outcome_list[1:])
+        turn_value = np.repeat((np.arange(nb_score_state + max_score_step + 1) * float(granularity))[:, None],
+                               nb_dices + 1, axis=1)
+        mark_score_list = [0] * (nb_dices + 1)
+        for score_state in range(nb_score_state - 1, -1, -1):
+            turn_score = score_state * granularity
+            for nb_dices_to_roll in range(1, nb_dices + 1):
+                probability_array, score_step_array, nb_next_dices_array = roll_outcome_list[nb_dices_to_roll]
+                roll_again_value = float(np.dot(probability_array,
+                                                turn_value[score_state + score_step_array, nb_next_dices_array]))
+
+                turn_value[score_state, nb_dices_to_roll] = max(turn_score, roll_again_value)
+                if roll_again_value > turn_score and mark_score_list[nb_dices_to_roll] == 0:
+                    # Highest turn score where rolling again is better -> marking from the next score step
+                    mark_score_list[nb_dices_to_roll] = turn_score + granularity
+
+        return bust_probability_list, expected_roll_score_list, mark_score_list
+
 
 # ----------------------< Class handling dice game view >---------------------------------------------------------------
 # static methods :
@@ -734,6 +1548,8 @@ class DiceGameModel:
 #       (dice_game_model, verbose)
 #   print_roll_status                       View last roll status (Score, dices ...)
 #       (dice_game_model, verbose)
+#   print_decision_hint                     Bust probability, expected gain and marking score before a roll choice
+#       (dice_game_model, decision_hints, verbose)
 #   print_lost_turn_message                 Message for lost turn
 #       (dice_game_model, verbose)
 #   print_win_turn_message                  Message for win turn
@@ -767,6 +1583,19 @@ class DiceGameView:
             output_str += 'remaining dice to roll : ' + str(dice_turn.nb_dices_to_roll)
             print(output_str)
 
+    @staticmethod
+    def print_decision_hint(dice_game_model, decision_hints, verbose):
+        if verbose:
+            turn_score = dice_game_model.turn_score
+            nb_dices_to_roll = dice_game_model.dices_set.nb_dices_to_roll
+            output_str = 'hint : bust ' + '{:.1%}'.format(decision_hints.bust_probability(nb_dices_to_roll))
+            output_str += ', expected gain if you roll again ' + \
+                          '{:+.0f}'.format(decision_hints.expected_gain(turn_score, nb_dices_to_roll))
+            output_str += ', mark from ' + str(decision_hints.mark_score(nb_dices_to_roll))
+            output_str += ' with ' + str(nb_dices_to_roll) + ' dices to roll'
+            output_str += ' (mark)' if decision_hints.should_mark(turn_score, nb_dices_to_roll) else ' (roll)'
+            print(output_str)
+
     @staticmethod
     def print_lost_turn_message(dice_game_model, verbose):
         if verbose:
@@ -848,20 +1677,64 @@ class DiceGameView:
 #                                              - if == 0 : random 50/50 choice to mark or not
 #                                              - if > 0  : mark if turn score >= choice_critter_value
 #                                              - if < 0  : mark if number of dice to roll < abs(choice_critter_value)
+#                                              - if callable : mark if choice_critter_value(dice_game_model) is True
+#                                           or {player name: choice_critter_value} for a strategy by player
+#   rng                                     Random generator for the dices, the players order and the random choice
+#                                               (default->random module)
+#   players_dice_rng                        {player name: random generator} for a dices stream by player
+#                                               (default->None)
+#   decision_hints                          Print a decision hint before each interactive roll choice if True
+#                                               (default->False)
+#   metrics                                 DiceGameMetrics counting the turns, games and decisions (default->None)
+#   campaign                                DiceGameCampaign folding each finished game (default->None), the
+#                                               strategies are named after choice_critter_value, or after the
+#                                               players in interactive mode
+#   decision_source                         Source of the interactive roll choices, 'n' to mark (default->None,
+#                                               input()) :
+#                                              - file like object (file, pipe, sys.stdin) : one choice by line
+#                                              - callable : choice = decision_source(prompt)
+#                                              - iterable : one choice by item
+#   decision_log                            File like object receiving each interactive choice on its own line, a
+#                                               decision_source to replay the session with the same rng
+#                                               (default->None)
 #
 # public methods :
 #   run_full_game()                          Run a full dice game
+#
+# static methods :
+#   decision_reader(decision_source)         Callable (prompt) --> choice reading decision_source, raising EOFError
+#                                               once the source is exhausted as input() does
 # ----------------------------------------------------------------------------------------------------------------------
 class DiceGameController:
     def __init__(self, players_names_list, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE, verbose=True,
-                 interactive=True, choice_critter_value=0):
+                 interactive=True, choice_critter_value=0, rng=None, players_dice_rng=None, decision_hints=False,
+                 metrics=None, campaign=None, decision_source=None, decision_log=None):
 
         self._dice_game_view = DiceGameView()
-        self._dice_game_model = DiceGameModel(players_names_list, nb_dices, target_score)
+        self._dice_game_model = DiceGameModel(players_names_list, nb_dices, target_score, rng, players_dice_rng)
         self._verbose = verbose
+        # None stands for the random module, which keeps the instance picklable
+        self._rng = rng
 
         self._interactive = interactive
         self._choice_critter_value = choice_critter_value
+        self._read_decision = self.decision_reader(decision_source)
+        self._decision_log = decision_log
+
+        # Tables are shared by game rules, the hints only cost a few lookups during the game
+        self._decision_hints = DiceGameDecisionHints(nb_dices) if decision_hints else None
+        self._metrics = metrics
+
+        self._campaign = campaign
+        if interactive:
+            self._campaign_strategy_dict = None
+        elif isinstance(choice_critter_value, dict):
+            self._campaign_strategy_dict = {player_name: DiceGameCampaign.strategy_name(player_choice_critter_value)
+                                            for player_name, player_choice_critter_value
+                                            in choice_critter_value.items()}
+        else:
+            self._campaign_strategy_dict = {player_name: DiceGameCampaign.strategy_name(choice_critter_value)
+                                            for player_name in players_names_list}
 
     def __str__(self):
         output_str = 'verbose mode : ' + str(self._verbose)
@@ -874,6 +1747,33 @@ class DiceGameController:
     def get_model(self):
         return self._dice_game_model
 
+    @staticmethod
+    def decision_reader(decision_source):
+        if decision_source is None:
+            return input
+
+        if hasattr(decision_source, 'readline'):
+            def read_decision_line(prompt):
+                decision_line = decision_source.readline()
+                if not decision_line:
+                    raise EOFError('decision source exhausted')
+                return decision_line.strip()
+
+            return read_decision_line
+
+        if callable(decision_source):
+            return decision_source
+
+        decision_iterator = iter(decision_source)
+
+        def next_decision(prompt):
+            try:
+                return next(decision_iterator)
+            except StopIteration:
+                raise EOFError('decision source exhausted') from None
+
+        return next_decision
+
     def run_full_game(self):
 
         def manage_player_turn():
@@ -887,18 +1787,33 @@ class DiceGameController:
 
                 if self._interactive:
                     # Interactive : player make the choice
-                    return input('roll dices ? [y/n] ') == 'n'
-                elif self._choice_critter_value == 0:
+                    if self._decision_hints is not None:
+                        self._dice_game_view.print_decision_hint(self._dice_game_model, self._decision_hints,
+                                                                 self._verbose)
+                    decision = self._read_decision('roll dices ? [y/n] ')
+                    if self._decision_log is not None:
+                        self._decision_log.write(decision + '\n')
+                    return decision == 'n'
+
+                choice_critter_value = self._choice_critter_value
+                if isinstance(choice_critter_value, dict):
+                    # Strategy by player
+                    choice_critter_value = choice_critter_value[self._dice_game_model.turn_player_name]
+
+                if callable(choice_critter_value):
+                    # Custom policy
+                    return choice_critter_value(self._dice_game_model)
+                elif choice_critter_value == 0:
                     # Random choice (50/50)
-                    return random.randint(1, 1000) % 2 == 0
-                elif self._choice_critter_value > 0:
+                    return (self._rng if self._rng is not None else random).randint(1, 1000) % 2 == 0
+                elif choice_critter_value > 0:
                     # Choice based on the turn score level threshold
                     turn_score = self._dice_game_model.turn_score
-                    return turn_score >= self._choice_critter_value
+                    return turn_score >= choice_critter_value
                 else:
                     # Choice based on the remaining dice to roll threshold
                     nb_dices_to_roll = self._dice_game_model.dices_set.nb_dices_to_roll
-                    return nb_dices_to_roll < abs(self._choice_critter_value)
+                    return nb_dices_to_roll < abs(choice_critter_value)
 
             # ----<Player turn>-----------------------------------------------------------------------------------------
 
@@ -917,7 +1832,14 @@ class DiceGameController:
 
                 if model.can_we_roll_again:
                     # If no fail and no game wining -> we can roll again
-                    if player_choose_to_mark():
+                    if metrics is None:
+                        its_mark_choice = player_choose_to_mark()
+                    else:
+                        decision_start_time = time.perf_counter()
+                        its_mark_choice = player_choose_to_mark()
+                        metrics.observe_decision_latency(time.perf_counter() - decision_start_time)
+
+                    if its_mark_choice:
                         # it's a scoring roll -> end turn
                         view.print_win_turn_message(model, self._verbose)
                         roll_again = False
@@ -931,203 +1853,3454 @@ class DiceGameController:
 
             # End of a turn management
             model.update_status_and_game_statistics()
+            if metrics is not None:
+                turn_statistics = model.dices_set.turn_statistics
+                metrics.count_turn(turn_statistics.turn_nb_roll, turn_statistics.turn_nb_full_roll,
+                                   turn_statistics.turn_nb_bonus, model.dices_set.its_lost_roll)
             view.print_turn_final_players_status(model, self._verbose)
             model.prepare_for_next_player_turn()
 
         # ----<Handle full game>----------------------------------------------------------------------------------------
         model = self._dice_game_model
         view = self._dice_game_view
-
-        model.reset_game()
-        while not model.there_is_a_winner:
-            manage_player_turn()
+        metrics = self._metrics
+
+        if metrics is not None:
+            metrics.open_table()
+        try:
+            model.reset_game()
+            while not model.there_is_a_winner:
+                manage_player_turn()
+        finally:
+            if metrics is not None:
+                metrics.close_table()
+
+        if metrics is not None:
+            metrics.count_game()
+        if self._campaign is not None:
+            self._campaign.fold_game(model, self._campaign_strategy_dict)
 
         view.print_final_status(self._dice_game_model, self._verbose)
 
 
-# ----------------------< Class handling game stats >---------------------------------------------------------------
+# ----------------------< Class handling the campaign aggregates of a strategy or a seat >------------------------------
 # constructor parameters :
-#   nb_dice                                     List of players name
-#   nb_turn                                     Total number of dices in the game set (default->DEFAULT_DICES_NB)
-#   interval                                    Target score to win (default->DEFAULT_TARGET_SCORE)
+#   interval                                    Interval of the score distributions
+#   distribution_factory                        Callable (distribution name, interval) --> distribution
+#                                                   (default->OccurrenceDistribution)
+#
+# getters :
+#
+#   nb_game()                                   Number of games played
+#   nb_win()                                    Number of games won
+#   win_rate()                                  Share of the games won
+#   mean_game_length()                          Mean number of turns of the games played
+#   mean_nb_roll()                              Mean number of rolls by game
+#   mean_nb_full_roll()                         Mean number of full rolls by game
+#   mean_nb_bonus()                             Mean number of bonus by game
+#   score_distribution()                        Distribution of the final total scores
+#   lost_score_distribution()                   Distribution of the total scores lost in a game
+#   max_turn_scoring()                          Maximum score done in a turn
+#   longest_turn()                              Longest turn, in number of rolls
+#   max_turn_loss()                             Maximum score lost in a turn
 #
 # public methods :
 #
-#   launch_analyse()                             Launch nb_turn turn and update the stats
-#   print_occurrence_distribution()              Print the occurrence dict
+#   fold_player(player_status, its_winner,      Add the totals of a player at the end of a game, the turn maxima are
+#       game_length, max_turn_scoring,              the ones this player did during the game (0 otherwise)
+#       longest_turn, max_turn_loss)
+#   merge(other)                                Add the aggregates of another campaign --> self
 # ----------------------------------------------------------------------------------------------------------------------
-class DiceGameStatisticsAnalyse:
-    def __init__(self, nb_turn, interval, nb_dice=DEFAULT_DICES_NB):
-        self._nb_dice = nb_dice
-        self._nb_turn = nb_turn
-        self._interval = interval
+class DiceGameCampaignAggregate:
+    def __init__(self, interval, distribution_factory=None):
+        if distribution_factory is None:
+            distribution_factory = default_distribution_factory
+
+        self._nb_game = 0
+        self._nb_win = 0
+        self._sigma_game_length = 0
+        self._sigma_nb_roll = 0
+        self._sigma_nb_full_roll = 0
+        self._sigma_nb_bonus = 0
 
-        self._dice_game_turn = DiceGameTurn(nb_dice)
+        self._score_distribution = distribution_factory('score', interval)
+        self._lost_score_distribution = distribution_factory('lost_score', interval)
 
         self._max_turn_scoring = 0
-        self._mean_scoring = 0
-        self._max_nb_roll = 0
-        self._max_bonus = 0
-        self._score_distribution = OccurrenceDistribution(interval)
+        self._longest_turn = 0
+        self._max_turn_loss = 0
 
     def __str__(self):
-        output_str = 'Score max : ' + str(self._max_turn_scoring)
-        output_str += '\nScore moyen : ' + str(self._mean_scoring)
-        output_str += '\nPlus grand nombre de lancer : ' + str(self._max_nb_roll)
-        output_str += '\nPlus grand nombre de bonus : ' + str(self._max_bonus)
-        self.pretty_print_occurrence_distribution()
+        output_str = str(self._nb_game) + ' games, ' + str(self._nb_win) + ' wins'
+        output_str += ', mean score ' + str(self._score_distribution.get_mean())
+        output_str += ', mean lost score ' + str(self._lost_score_distribution.get_mean())
+        output_str += ', mean game length ' + str(self.mean_game_length)
+        output_str += ', max turn scoring ' + str(self._max_turn_scoring)
+        output_str += ', longest turn ' + str(self._longest_turn)
+        output_str += ', max turn loss ' + str(self._max_turn_loss)
         return output_str
 
-    def launch_analyse(self):
-        def play_until_fail():
-            self._dice_game_turn.roll_dices_and_count_roll_score()
-            while self._dice_game_turn.roll_score != 0:
-                self._dice_game_turn.roll_dices_and_count_roll_score()
-
-        turn_index = 0
-        while turn_index < self._nb_turn:
-
-            play_until_fail()
-
-            turn_score = self._dice_game_turn.turn_lost_score
+    def _mean_by_game(self, sigma):
+        return sigma / self._nb_game if self._nb_game > 0 else 0
 
-            # Update our attributes depending on the score and bonus number made
-            if turn_score > self._max_turn_scoring:
-                self._max_turn_scoring = turn_score
-
-            if self._dice_game_turn.turn_statistics.turn_nb_roll > self._max_nb_roll:
-                self._max_nb_roll = self._dice_game_turn.turn_statistics.turn_nb_roll
+    @property
+    def nb_game(self):
+        return self._nb_game
 
-            if self._dice_game_turn.turn_statistics.turn_nb_bonus > self._max_bonus:
-                self._max_bonus = self._dice_game_turn.turn_statistics.turn_nb_bonus
+    @property
+    def nb_win(self):
+        return self._nb_win
 
-            self._mean_scoring += turn_score
-            self._score_distribution.push(turn_score)
+    @property
+    def win_rate(self):
+        return self._mean_by_game(self._nb_win)
 
-            turn_index += 1
+    @property
+    def mean_game_length(self):
+        return self._mean_by_game(self._sigma_game_length)
 
-            # Reset all the turn's parameters to 0
-            self._dice_game_turn.prepare_for_next_turn()
+    @property
+    def mean_nb_roll(self):
+        return self._mean_by_game(self._sigma_nb_roll)
 
-        self._mean_scoring /= self._nb_turn
+    @property
+    def mean_nb_full_roll(self):
+        return self._mean_by_game(self._sigma_nb_full_roll)
 
-    def pretty_print_occurrence_distribution(self):
-        pretty_occurrence_distribution = dict(sorted(self._score_distribution._occurrence_distribution.items()))
+    @property
+    def mean_nb_bonus(self):
+        return self._mean_by_game(self._sigma_nb_bonus)
 
-        print('Tableau d\'occurences : ')
-        for key in pretty_occurrence_distribution:
-            if key == 0:
-                print('{0 :', end='')
-            else:
-                interval_from = (key - 1) * self._score_distribution.interval + 1
-                interval_to = key * self._score_distribution.interval
-                print('{', interval_from, '->', interval_to, " :", end='')
+    @property
+    def score_distribution(self):
+        return self._score_distribution
 
-            print(' ', pretty_occurrence_distribution[key] / self._nb_turn, '},', end='')
+    @property
+    def lost_score_distribution(self):
+        return self._lost_score_distribution
 
-        print('\n')
+    @property
+    def max_turn_scoring(self):
+        return self._max_turn_scoring
 
+    @property
+    def longest_turn(self):
+        return self._longest_turn
 
-# ----------------------< Class handling game stats >---------------------------------------------------------------
+    @property
+    def max_turn_loss(self):
+        return self._max_turn_loss
+
+    def fold_player(self, player_status, its_winner, game_length, max_turn_scoring=0, longest_turn=0,
+                    max_turn_loss=0):
+        self._nb_game += 1
+        if its_winner:
+            self._nb_win += 1
+        self._sigma_game_length += game_length
+        self._sigma_nb_roll += player_status['nb_roll']
+        self._sigma_nb_full_roll += player_status['nb_full_roll']
+        self._sigma_nb_bonus += player_status['nb_bonus']
+
+        self._score_distribution.push(player_status['score'])
+        self._lost_score_distribution.push(player_status['total_lost_score'])
+
+        self._max_turn_scoring = max(self._max_turn_scoring, max_turn_scoring)
+        self._longest_turn = max(self._longest_turn, longest_turn)
+        self._max_turn_loss = max(self._max_turn_loss, max_turn_loss)
+
+    def merge(self, other):
+        self._nb_game += other._nb_game
+        self._nb_win += other._nb_win
+        self._sigma_game_length += other._sigma_game_length
+        self._sigma_nb_roll += other._sigma_nb_roll
+        self._sigma_nb_full_roll += other._sigma_nb_full_roll
+        self._sigma_nb_bonus += other._sigma_nb_bonus
+
+        self._score_distribution.merge(other._score_distribution)
+        self._lost_score_distribution.merge(other._lost_score_distribution)
+
+        self._max_turn_scoring = max(self._max_turn_scoring, other._max_turn_scoring)
+        self._longest_turn = max(self._longest_turn, other._longest_turn)
+        self._max_turn_loss = max(self._max_turn_loss, other._max_turn_loss)
+        return self
+
+
+# ----------------------< Class handling cross game campaign aggregates >-----------------------------------------------
 # constructor parameters :
-#   nb_dice                                     List of players name
-#   nb_turn                                     Total number of dices in the game set (default->DEFAULT_DICES_NB)
-#   interval                                    Target score to win (default->DEFAULT_TARGET_SCORE)
+#   interval                                    Interval of the score distributions (default->CAMPAIGN_INTERVAL)
+#   distribution_factory                        Callable (distribution name, interval) --> distribution
+#                                                   (default->OccurrenceDistribution)
+#
+# getters :
+#
+#   nb_game()                                   Number of games folded
+#   mean_game_length()                          Mean number of turns by game
+#   nb_scoring_turn()                           Number of scoring turns of all the games
+#   nb_non_scoring_turn()                       Number of non scoring turns of all the games
+#   mean_scoring_turn()                         Mean score of the scoring turns
+#   mean_non_scoring_turn()                     Mean lost score of the non scoring turns
+#   max_turn_scoring()                          Maximum score done in a turn and strategy, seat of the performer
+#                                                   --> {'strategy': , 'seat': , 'value': }
+#   longest_turn()                              Longest turn and strategy, seat of the performer
+#                                                   --> {'strategy': , 'seat': , 'value': }
+#   max_turn_loss()                             Maximum score lost in a turn and strategy, seat of the performer
+#                                                   --> {'strategy': , 'seat': , 'value': }
+#   strategy_aggregates()                       {strategy name: DiceGameCampaignAggregate}
+#   seat_aggregates()                           {seat index: DiceGameCampaignAggregate}, seat 0 plays first
 #
 # public methods :
 #
-#   launch_analyse()                             Launch nb_turn turn and update the stats
-#   print_occurrence_distribution()              Print the occurrence dict
+#   fold_game(model, strategy_by_player)        Fold a finished game of a DiceGameModel, before its next reset_game()
+#                                                   strategy_by_player : {player name: strategy name}
+#                                                   (default->None, the strategy is the player name)
+#   merge(other)                                Add the aggregates of another campaign of same interval --> self
+#
+# static methods :
+#
+#   strategy_name(choice_critter_value)         Strategy name of a DiceGameController choice_critter_value
+#
+# The games are folded in fixed size counters and distributions, so the memory only depends on the number of
+# strategies and seats, whatever the number of games. The campaigns of parallel work units are merged with merge().
 # ----------------------------------------------------------------------------------------------------------------------
-class DiceGameDistributionAnalyse:
-    def __init__(self, nb_turn, interval, nb_dice=DEFAULT_DICES_NB):
-        self._nb_dice = nb_dice
-        self._nb_turn = nb_turn
+class DiceGameCampaign:
+    def __init__(self, interval=CAMPAIGN_INTERVAL, distribution_factory=None):
         self._interval = interval
+        self._distribution_factory = distribution_factory
 
-        self._dice_game_turn = DiceGameTurn(nb_dice)
+        self._nb_game = 0
+        self._sigma_game_length = 0
+        self._nb_scoring_turn = 0
+        self._nb_non_scoring_turn = 0
+        self._sigma_scoring = 0
+        self._sigma_non_scoring = 0
+        self._max_turn_scoring = {'strategy': None, 'seat': None, 'value': 0}
+        self._longest_turn = {'strategy': None, 'seat': None, 'value': 0}
+        self._max_turn_loss = {'strategy': None, 'seat': None, 'value': 0}
 
-        self._roll_score_distribution = OccurrenceDistribution(interval)
-        self._turn_score_distribution = OccurrenceDistribution(interval)
-        self._turn_nb_roll_distribution = OccurrenceDistribution(1)
-        self._turn_nb_full_roll_distribution = OccurrenceDistribution(1)
-        self._turn_nb_bonus_distribution = OccurrenceDistribution(1)
-        self._turn_nb_dices_fail_distribution = OccurrenceDistribution(1)
-        self._turn_nb_dice_to_roll_distribution = OccurrenceDistribution(1)
+        self._strategy_aggregate_dict = dict()
+        self._seat_aggregate_dict = dict()
 
-    @property
-    def nb_turn(self):
-        return self._nb_turn
+    def __str__(self):
+        output_str = str(self._nb_game) + ' games, mean game length ' + str(self.mean_game_length) + '\n'
+        for strategy, aggregate in self._strategy_aggregate_dict.items():
+            output_str += 'strategy ' + str(strategy) + ' : ' + str(aggregate) + '\n'
+        for seat, aggregate in sorted(self._seat_aggregate_dict.items()):
+            output_str += 'seat #' + str(seat) + ' : ' + str(aggregate) + '\n'
+        return output_str
 
     @property
-    def roll_score_distribution(self):
-        return self._roll_score_distribution
+    def nb_game(self):
+        return self._nb_game
 
     @property
-    def turn_score_distribution(self):
-        return self._turn_score_distribution
+    def mean_game_length(self):
+        return self._sigma_game_length / self._nb_game if self._nb_game > 0 else 0
 
     @property
-    def turn_nb_roll_distribution(self):
-        return self._turn_nb_roll_distribution
+    def nb_scoring_turn(self):
+        return self._nb_scoring_turn
 
     @property
-    def turn_nb_full_roll_distribution(self):
-        return self._turn_nb_full_roll_distribution
+    def nb_non_scoring_turn(self):
+        return self._nb_non_scoring_turn
 
     @property
-    def turn_nb_bonus_distribution(self):
-        return self._turn_nb_bonus_distribution
+    def mean_scoring_turn(self):
+        return self._sigma_scoring / self._nb_scoring_turn if self._nb_scoring_turn > 0 else 0
 
     @property
-    def turn_nb_dices_fail_distribution(self):
-        return self._turn_nb_dices_fail_distribution
+    def mean_non_scoring_turn(self):
+        return self._sigma_non_scoring / self._nb_non_scoring_turn if self._nb_non_scoring_turn > 0 else 0
 
     @property
-    def turn_nb_dice_to_roll_distribution(self):
-        return self._turn_nb_dice_to_roll_distribution
-
-    def launch_analyse(self):
-        def play_until_fail():
-            nb_dice_to_roll = self._dice_game_turn.nb_dices_to_roll
-            self._turn_nb_dice_to_roll_distribution.push(nb_dice_to_roll)
-
-            self._dice_game_turn.roll_dices_and_count_roll_score()
-
-            roll_score = self._dice_game_turn.roll_score
-            self._roll_score_distribution.push(roll_score)
+    def max_turn_scoring(self):
+        return dict(self._max_turn_scoring)
 
-            while self._dice_game_turn.roll_score != 0:
-                nb_dice_to_roll = self._dice_game_turn.nb_dices_to_roll
-                self._turn_nb_dice_to_roll_distribution.push(nb_dice_to_roll)
+    @property
+    def longest_turn(self):
+        return dict(self._longest_turn)
 
-                self._dice_game_turn.roll_dices_and_count_roll_score()
+    @property
+    def max_turn_loss(self):
+        return dict(self._max_turn_loss)
 
-                # Case it's a lost roll, we push the nb_dice of this roll
-                if self._dice_game_turn.roll_score == 0:
-                    self._turn_nb_dices_fail_distribution.push(nb_dice_to_roll)
+    @property
+    def strategy_aggregates(self):
+        return self._strategy_aggregate_dict
 
-                roll_score = self._dice_game_turn.roll_score
-                self._roll_score_distribution.push(roll_score)
+    @property
+    def seat_aggregates(self):
+        return self._seat_aggregate_dict
 
-        turn_index = 0
-        while turn_index < self._nb_turn:
-            play_until_fail()
+    @staticmethod
+    def strategy_name(choice_critter_value):
+        if callable(choice_critter_value):
+            return getattr(choice_critter_value, '__name__', repr(choice_critter_value))
+        return str(choice_critter_value)
+
+    def _get_aggregate(self, aggregate_dict, key):
+        if key not in aggregate_dict:
+            aggregate_dict[key] = DiceGameCampaignAggregate(self._interval, self._distribution_factory)
+        return aggregate_dict[key]
+
+    def fold_game(self, model, strategy_by_player=None):
+        def update_max(campaign_max, value, player_index):
+            if value > campaign_max['value']:
+                campaign_max.update(strategy=strategy_list[player_index], seat=player_index, value=value)
+
+        # ----<Game level statistics : the maxima keep their performer, the counters and sums are added>---------------
+        players = model.players
+        game_statistics = model.game_statistics
+        game_length = model.turn_index
+        strategy_list = [players.player_name(player_index) if strategy_by_player is None
+                         else strategy_by_player[players.player_name(player_index)]
+                         for player_index in range(len(players))]
+
+        self._nb_game += 1
+        self._sigma_game_length += game_length
+
+        nb_scoring_turn, nb_non_scoring_turn, sigma_scoring, sigma_non_scoring = game_statistics.export_state()[6:]
+        self._nb_scoring_turn += nb_scoring_turn
+        self._nb_non_scoring_turn += nb_non_scoring_turn
+        self._sigma_scoring += sigma_scoring
+        self._sigma_non_scoring += sigma_non_scoring
+
+        max_turn_scoring = game_statistics.max_turn_scoring
+        longest_turn = game_statistics.longest_turn
+        max_turn_loss = game_statistics.max_turn_loss
+        update_max(self._max_turn_scoring, max_turn_scoring['value'], max_turn_scoring['player_index'])
+        update_max(self._longest_turn, longest_turn['value'], longest_turn['player_index'])
+        update_max(self._max_turn_loss, max_turn_loss['value'], max_turn_loss['player_index'])
+
+        # ----<Player level totals, by strategy and by seat (index in the playing order)>-------------------------------
+        winner_index = players.index_of_player_with_best_score
+        for player_index in range(len(players)):
+            player_status = players.player_status(player_index)
+            player_maxima = (max_turn_scoring['value'] if max_turn_scoring['player_index'] == player_index else 0,
+                             longest_turn['value'] if longest_turn['player_index'] == player_index else 0,
+                             max_turn_loss['value'] if max_turn_loss['player_index'] == player_index else 0)
+
+            for aggregate_dict, key in ((self._strategy_aggregate_dict, strategy_list[player_index]),
+                                        (self._seat_aggregate_dict, player_index)):
+                self._get_aggregate(aggregate_dict, key).fold_player(
+                    player_status, player_index == winner_index, game_length, *player_maxima)
+
+    def merge(self, other):
+        def merge_max(campaign_max, other_max):
+            if other_max['value'] > campaign_max['value']:
+                campaign_max.update(other_max)
+
+        if other._interval != self._interval:
+            raise ValueError('cannot merge campaigns of interval ' + str(self._interval) + ' and ' +
+                             str(other._interval))
+
+        self._nb_game += other._nb_game
+        self._sigma_game_length += other._sigma_game_length
+        self._nb_scoring_turn += other._nb_scoring_turn
+        self._nb_non_scoring_turn += other._nb_non_scoring_turn
+        self._sigma_scoring += other._sigma_scoring
+        self._sigma_non_scoring += other._sigma_non_scoring
+
+        merge_max(self._max_turn_scoring, other._max_turn_scoring)
+        merge_max(self._longest_turn, other._longest_turn)
+        merge_max(self._max_turn_loss, other._max_turn_loss)
+
+        for aggregate_dict, other_aggregate_dict in ((self._strategy_aggregate_dict, other._strategy_aggregate_dict),
+                                                     (self._seat_aggregate_dict, other._seat_aggregate_dict)):
+            for key, other_aggregate in other_aggregate_dict.items():
+                self._get_aggregate(aggregate_dict, key).merge(other_aggregate)
+        return self
+
+
+# ----------------------< Records emitted by the turn simulation >------------------------------------------------------
+# RollRecord                                    Emitted after each roll
+#   nb_dices_to_roll                                Number of dices rolled
+#   roll_score                                      Score of the roll, 0 for the failing roll
+#
+# TurnRecord                                    Emitted at the end of each turn (the turn is played until fail)
+#   turn_score                                      Score accumulated before the failing roll
+#   nb_roll                                         Number of rolls during the turn
+#   nb_full_roll                                    Number of full rolls during the turn
+#   nb_bonus                                        Number of multiple dices bonus during the turn
+#   nb_dices_fail                                   Number of dices rolled on the failing roll
+#
+# GameRecord                                    Emitted at the end of each full game
+#   nb_turn                                         Number of turns of the game
+#   winner_name                                     Name of the winner
+#   players_names                                   Players names, in playing order
+#   players_scores                                  Players total scores, in playing order
+#
+# ROLL_RECORD_DTYPE, TURN_RECORD_DTYPE          NumPy structured types of the roll and turn records chunks
+# ----------------------------------------------------------------------------------------------------------------------
+RollRecord = namedtuple('RollRecord', ['nb_dices_to_roll', 'roll_score'])
+TurnRecord = namedtuple('TurnRecord', ['turn_score', 'nb_roll', 'nb_full_roll', 'nb_bonus', 'nb_dices_fail'])
+GameRecord = namedtuple('GameRecord', ['nb_turn', 'winner_name', 'players_names', 'players_scores'])
+
+ROLL_RECORD_DTYPE = np.dtype([(field, np.int64) for field in RollRecord._fields])
+TURN_RECORD_DTYPE = np.dtype([(field, np.int64) for field in TurnRecord._fields])
+
+
+# ----------------------< Classes collecting the turn simulation records >----------------------------------------------
+# A collector is any object with a collect_roll(roll_record) and/or a collect_turn(turn_record) method.
+# A single field collector can instead expose a value_sink(value) callable, the simulation then pushes the field value
+# to it directly without an intermediate collect call.
+#
+# DiceRecordCollector(field)                    Abstract base class of the single field collectors, the field name
+#                                                   selects roll records (RollRecord fields) or turn records
+#                                                   (TurnRecord fields), subclasses define _collect(record)
+#                                                   --> field(), field_index(), its_roll_field()
+# MaxCollector(field)                           Maximum value of the field                  --> value()
+# MomentsCollector(field)                       Count, sum and sum of squares of the field  --> count(), mean(),
+#                                                                                               variance()
+# HistogramCollector(field, distribution)       Push the field in a distribution            --> distribution()
+# CallbackCollector                             Call custom callbacks with the records
+#   (roll_callback=None, turn_callback=None)
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceRecordCollector(abc.ABC):
+    def __init__(self, field):
+        self._field = field
+
+        # The collect method is bound to the record level of the field, so the simulation only calls it when needed
+        if field in RollRecord._fields:
+            self._field_index = RollRecord._fields.index(field)
+            self._its_roll_field = True
+            self.collect_roll = self._collect
+        elif field in TurnRecord._fields:
+            self._field_index = TurnRecord._fields.index(field)
+            self._its_roll_field = False
+            self.collect_turn = self._collect
+        else:
+            raise ValueError('unknown record field : ' + str(field))
+
+    @property
+    def field(self):
+        return self._field
+
+    @property
+    def field_index(self):
+        return self._field_index
+
+    @property
+    def its_roll_field(self):
+        return self._its_roll_field
+
+    @abc.abstractmethod
+    def _collect(self, record):
+        # Handle a record of the field level, defined by each collector
+        pass
+
+
+class MaxCollector(DiceRecordCollector):
+    def __init__(self, field):
+        super().__init__(field)
+        self._value = 0
+
+    def __str__(self):
+        return 'max ' + self._field + ' : ' + str(self._value)
+
+    @property
+    def value(self):
+        return self._value
+
+    def _collect(self, record):
+        if record[self._field_index] > self._value:
+            self._value = record[self._field_index]
+
+    def merge(self, other):
+        self._value = max(self._value, other._value)
+        return self
+
+
+class MomentsCollector(DiceRecordCollector):
+    def __init__(self, field):
+        super().__init__(field)
+        self._count = 0
+        self._sigma = 0
+        self._sigma_square = 0
+
+    def __str__(self):
+        return 'mean ' + self._field + ' : ' + str(self.mean) + ' (' + str(self._count) + ' values)'
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def mean(self):
+        if self._count == 0:
+            return 0
+        return self._sigma / self._count
+
+    @property
+    def variance(self):
+        if self._count == 0:
+            return 0
+        return self._sigma_square / self._count - self.mean ** 2
+
+    def _collect(self, record):
+        value = record[self._field_index]
+        self._count += 1
+        self._sigma += value
+        self._sigma_square += value * value
+
+    def merge(self, other):
+        self._count += other._count
+        self._sigma += other._sigma
+        self._sigma_square += other._sigma_square
+        return self
+
+
+class HistogramCollector(DiceRecordCollector):
+    def __init__(self, field, distribution):
+        super().__init__(field)
+        self._distribution = distribution
+        self._push = distribution.push
+        self.value_sink = distribution.push
+
+    @property
+    def distribution(self):
+        return self._distribution
+
+    def _collect(self, record):
+        self._push(record[self._field_index])
+
+
+class CallbackCollector:
+    def __init__(self, roll_callback=None, turn_callback=None):
+        if roll_callback is not None:
+            self.collect_roll = roll_callback
+        if turn_callback is not None:
+            self.collect_turn = turn_callback
+
+
+# ----------------------< Class handling the turn simulation pipeline >-------------------------------------------------
+# constructor parameters :
+#   nb_dice                                     Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   rng                                         Random generator of the dices (default->random module)
+#
+# getters :
+#
+#   dice_game_turn()                            Dice turn used by the simulation
+#   nb_turn_done()                              Number of turns simulated since the creation
+#
+# public methods :
+#
+#   register_collector(collector)               Register a collector for the next runs --> collector
+#   run(nb_turn)                                Play nb_turn turns until fail, emitting the records to the collectors
+#
+#   iter_rolls(nb_turn=None)                    Lazily play nb_turn turns (endless if None) --> RollRecord generator
+#   iter_turns(nb_turn=None)                    Lazily play nb_turn turns (endless if None) --> TurnRecord generator
+#   iter_roll_chunks(chunk_size, nb_turn=None)  Same as iter_rolls() by blocks of ROLL_RECORD_DTYPE arrays
+#   iter_turn_chunks(chunk_size, nb_turn=None)  Same as iter_turns() by blocks of TURN_RECORD_DTYPE arrays
+#
+# The generators do not emit the records to the registered collectors.
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceTurnSimulation:
+    def __init__(self, nb_dice=DEFAULT_DICES_NB, rng=None):
+        self._dice_game_turn = DiceGameTurn(nb_dice, rng)
+
+        self._roll_collect_list = []
+        self._turn_collect_list = []
+        self._roll_value_sink_list = []
+        self._turn_value_sink_list = []
+        self._nb_turn_done = 0
+
+    @property
+    def dice_game_turn(self):
+        return self._dice_game_turn
+
+    @property
+    def nb_turn_done(self):
+        return self._nb_turn_done
+
+    def register_collector(self, collector):
+        value_sink = getattr(collector, 'value_sink', None)
+        if value_sink is not None:
+            # Single field collector : the field value is pushed directly to the sink
+            if collector.its_roll_field:
+                self._roll_value_sink_list.append((collector.field_index, value_sink))
+            else:
+                self._turn_value_sink_list.append((collector.field_index, value_sink))
+            return collector
+
+        collect_roll = getattr(collector, 'collect_roll', None)
+        if collect_roll is not None:
+            self._roll_collect_list.append(collect_roll)
+
+        collect_turn = getattr(collector, 'collect_turn', None)
+        if collect_turn is not None:
+            self._turn_collect_list.append(collect_turn)
+
+        return collector
+
+    def run(self, nb_turn):
+        # Local references to keep the per roll work to the strict minimum
+        dice_game_turn = self._dice_game_turn
+        turn_statistics = dice_game_turn.turn_statistics
+        roll_dices_and_count_roll_score = dice_game_turn.roll_dices_and_count_roll_score
+        prepare_for_next_turn = dice_game_turn.prepare_for_next_turn
+        roll_collect_list = tuple(self._roll_collect_list)
+        turn_collect_list = tuple(self._turn_collect_list)
+        roll_value_sink_list = tuple(self._roll_value_sink_list)
+        turn_value_sink_list = tuple(self._turn_value_sink_list)
+        # Records are built without the namedtuple constructor call overhead
+        new_record = tuple.__new__
+
+        for _ in range(nb_turn):
+            # Play until fail
+            roll_score = -1
+            while roll_score != 0:
+                nb_dices_to_roll = dice_game_turn.nb_dices_to_roll
+                roll_dices_and_count_roll_score()
+                roll_score = dice_game_turn.roll_score
+
+                if roll_collect_list or roll_value_sink_list:
+                    roll_record = new_record(RollRecord, (nb_dices_to_roll, roll_score))
+                    for field_index, value_sink in roll_value_sink_list:
+                        value_sink(roll_record[field_index])
+                    for collect_roll in roll_collect_list:
+                        collect_roll(roll_record)
+
+            turn_record = new_record(TurnRecord, (dice_game_turn.turn_lost_score,
+                                                  turn_statistics.turn_nb_roll,
+                                                  turn_statistics.turn_nb_full_roll,
+                                                  turn_statistics.turn_nb_bonus,
+                                                  nb_dices_to_roll))
+            for field_index, value_sink in turn_value_sink_list:
+                value_sink(turn_record[field_index])
+            for collect_turn in turn_collect_list:
+                collect_turn(turn_record)
+
+            # Reset all the turn's parameters to 0
+            prepare_for_next_turn()
+            self._nb_turn_done += 1
+
+    def iter_rolls(self, nb_turn=None):
+        dice_game_turn = self._dice_game_turn
+        new_record = tuple.__new__
+
+        for _ in itertools.count() if nb_turn is None else range(nb_turn):
+            roll_score = -1
+            while roll_score != 0:
+                nb_dices_to_roll = dice_game_turn.nb_dices_to_roll
+                dice_game_turn.roll_dices_and_count_roll_score()
+                roll_score = dice_game_turn.roll_score
+
+                yield new_record(RollRecord, (nb_dices_to_roll, roll_score))
+
+            dice_game_turn.prepare_for_next_turn()
+            self._nb_turn_done += 1
+
+    def iter_turns(self, nb_turn=None):
+        dice_game_turn = self._dice_game_turn
+        turn_statistics = dice_game_turn.turn_statistics
+        new_record = tuple.__new__
+
+        for _ in itertools.count() if nb_turn is None else range(nb_turn):
+            roll_score = -1
+            while roll_score != 0:
+                nb_dices_to_roll = dice_game_turn.nb_dices_to_roll
+                dice_game_turn.roll_dices_and_count_roll_score()
+                roll_score = dice_game_turn.roll_score
+
+            turn_record = new_record(TurnRecord, (dice_game_turn.turn_lost_score,
+                                                  turn_statistics.turn_nb_roll,
+                                                  turn_statistics.turn_nb_full_roll,
+                                                  turn_statistics.turn_nb_bonus,
+                                                  nb_dices_to_roll))
+
+            dice_game_turn.prepare_for_next_turn()
+            self._nb_turn_done += 1
+
+            yield turn_record
+
+    @staticmethod
+    def _iter_chunks(record_iterator, chunk_size, record_dtype):
+        # Only one chunk is built at a time, the next one is filled when the consumer asks for it
+        while True:
+            chunk = np.fromiter(itertools.islice(record_iterator, chunk_size), dtype=record_dtype)
+            if len(chunk) == 0:
+                return
+            yield chunk
+
+    def iter_roll_chunks(self, chunk_size, nb_turn=None):
+        return self._iter_chunks(self.iter_rolls(nb_turn), chunk_size, ROLL_RECORD_DTYPE)
+
+    def iter_turn_chunks(self, chunk_size, nb_turn=None):
+        return self._iter_chunks(self.iter_turns(nb_turn), chunk_size, TURN_RECORD_DTYPE)
+
+
+# ----------------------< Lazy simulation generators >------------------------------------------------------------------
+# iter_rolls(nb_dice, nb_turn)                  RollRecord generator of a new DiceTurnSimulation
+# iter_turns(nb_dice, nb_turn)                  TurnRecord generator of a new DiceTurnSimulation
+# iter_turn_chunks(chunk_size, nb_dice,         TURN_RECORD_DTYPE blocks generator of a new DiceTurnSimulation
+#   nb_turn)
+# iter_games(players_names_list, nb_dices,      GameRecord generator of non interactive games, endless if nb_game
+#   target_score, choice_critter_value,             is None, the games are also folded in campaign if given
+#   nb_game, campaign)
+# ----------------------------------------------------------------------------------------------------------------------
+def iter_rolls(nb_dice=DEFAULT_DICES_NB, nb_turn=None):
+    return DiceTurnSimulation(nb_dice).iter_rolls(nb_turn)
+
+
+def iter_turns(nb_dice=DEFAULT_DICES_NB, nb_turn=None):
+    return DiceTurnSimulation(nb_dice).iter_turns(nb_turn)
+
+
+def iter_turn_chunks(chunk_size, nb_dice=DEFAULT_DICES_NB, nb_turn=None):
+    return DiceTurnSimulation(nb_dice).iter_turn_chunks(chunk_size, nb_turn)
+
+
+def iter_games(players_names_list, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE,
+               choice_critter_value=0, nb_game=None, campaign=None):
+    dice_controller = DiceGameController(list(players_names_list), nb_dices, target_score, verbose=False,
+                                         interactive=False, choice_critter_value=choice_critter_value,
+                                         campaign=campaign)
+    model = dice_controller.get_model
+    players = model.players
+
+    for _ in itertools.count() if nb_game is None else range(nb_game):
+        dice_controller.run_full_game()
+
+        yield GameRecord(model.turn_index,
+                         players.leader_status,
+                         tuple(players.player_name(player_index) for player_index in range(len(players))),
+                         tuple(players.player_score(player_index) for player_index in range(len(players))))
+
+
+# ----------------------< Class handling a chunked column store of records >--------------------------------------------
+# constructor parameters :
+#   record_dtype                                 NumPy structured type of the records
+#   chunk_size                                   Number of records by preallocated chunk
+#   spill_directory                              Directory of the memory-mapped .npy chunk files, in memory if None
+#   file_prefix                                  Prefix of the chunk files names
+#
+# public methods :
+#
+#   append(record)                               Write a record (tuple) in the current chunk
+#   iter_arrays()                                Generator of the filled part of each chunk
+#   array()                                      All the records in a single array, loaded in RAM even when spilled
+#   close()                                      Drop the records and delete the spilled chunk files
+#
+# The chunk files are written in a private directory created in spill_directory on the first chunk, so lists
+# sharing a spill_directory never overwrite each other. close() deletes the files and the private directory.
+# ----------------------------------------------------------------------------------------------------------------------
+class RecordChunkList:
+    def __init__(self, record_dtype, chunk_size, spill_directory=None, file_prefix='records'):
+        self._record_dtype = record_dtype
+        self._chunk_size = chunk_size
+        self._spill_directory = spill_directory
+        self._file_prefix = file_prefix
+        # Private directory of the chunk files, created with the first spilled chunk
+        self._spill_path = None
+
+        # Full chunks are kept as arrays (in memory) or as file paths (spilled)
+        self._full_chunk_list = []
+        self._chunk = None
+        # Count at chunk size so the first append allocates the first chunk
+        self._chunk_count = chunk_size
+        self._nb_record = 0
+
+    def __len__(self):
+        if self._chunk is None:
+            return 0
+        return self._nb_record + self._chunk_count
+
+    def _new_chunk(self):
+        if self._chunk is not None:
+            self._nb_record += self._chunk_count
+            if self._spill_directory is None:
+                self._full_chunk_list.append(self._chunk)
+            else:
+                # The chunk is already in its file, only the OS page cache holds it from now
+                self._chunk.flush()
+                self._full_chunk_list.append(self._chunk.filename)
+
+        if self._spill_directory is None:
+            self._chunk = np.zeros(self._chunk_size, dtype=self._record_dtype)
+        else:
+            if self._spill_path is None:
+                self._spill_path = tempfile.mkdtemp(prefix=self._file_prefix + '_', dir=self._spill_directory)
+            file_path = os.path.join(self._spill_path,
+                                     self._file_prefix + '_' + str(len(self._full_chunk_list)).zfill(6) + '.npy')
+            self._chunk = np.lib.format.open_memmap(file_path, mode='w+', dtype=self._record_dtype,
+                                                    shape=(self._chunk_size,))
+        self._chunk_count = 0
+
+    def append(self, record):
+        if self._chunk_count == self._chunk_size:
+            self._new_chunk()
+
+        self._chunk[self._chunk_count] = record
+        self._chunk_count += 1
+
+    def iter_arrays(self):
+        for full_chunk in self._full_chunk_list:
+            if self._spill_directory is None:
+                yield full_chunk
+            else:
+                yield np.load(full_chunk, mmap_mode='r')
+
+        if self._chunk is not None and self._chunk_count > 0:
+            yield self._chunk[:self._chunk_count]
+
+    def array(self):
+        array_list = list(self.iter_arrays())
+        if len(array_list) == 0:
+            return np.zeros(0, dtype=self._record_dtype)
+        return np.concatenate(array_list)
+
+    def close(self):
+        if self._spill_path is not None:
+            file_path_list = list(self._full_chunk_list)
+            if self._chunk is not None:
+                file_path_list.append(self._chunk.filename)
+            # Unmapped before the files are deleted
+            self._chunk = None
+            for file_path in file_path_list:
+                os.remove(file_path)
+            os.rmdir(self._spill_path)
+            self._spill_path = None
+
+        self._full_chunk_list = []
+        self._chunk = None
+        self._chunk_count = self._chunk_size
+        self._nb_record = 0
+
+
+# ----------------------< Class storing the per turn and per roll records >---------------------------------------------
+# constructor parameters :
+#   chunk_size                                   Number of turns by chunk (default->RECORD_STORE_CHUNK_SIZE), the roll
+#                                                   chunks are ROLL_BY_TURN_CHUNK_RATIO times larger
+#   spill_directory                              Directory of the memory-mapped .npy chunk files, in memory if None
+#   record_rolls                                 Also store one row by roll if True (default->True)
+#
+# The store is a collector for DiceTurnSimulation (see DiceGameDistributionAnalyse record_store parameter).
+#
+# getters :
+#
+#   nb_turn()                                    Number of stored turns
+#   nb_roll()                                    Number of stored rolls
+#
+# public methods :
+#
+#   turn_array()                                 All turns in a TURN_STORE_DTYPE array
+#   roll_array()                                 All rolls in a ROLL_STORE_DTYPE array
+#   turn_dataframe()                             All turns in a pandas DataFrame, one column by field
+#   roll_dataframe()                             All rolls in a pandas DataFrame, one column by field
+#   iter_turn_dataframes()                       Generator of one DataFrame by chunk of turns, for bounded RAM
+#   iter_roll_dataframes()                       Generator of one DataFrame by chunk of rolls, for bounded RAM
+#   close()                                      Drop the records and delete the spilled chunk files (also on exit
+#                                                   of a with block)
+#
+# Stores sharing a spill_directory each write in their own private directory in it. The whole run getters
+# (turn_array, roll_array, turn_dataframe, roll_dataframe) concatenate every chunk in RAM, spilled chunks included,
+# so with a spill_directory they defeat the bounded RAM budget. Large runs are read with the iter_*_dataframes
+# generators, which hold one chunk at a time (rolls are about 3.5 times the turns).
+# ----------------------------------------------------------------------------------------------------------------------
+TURN_STORE_DTYPE = np.dtype([('turn_index', np.int64)] + TURN_RECORD_DTYPE.descr)
+ROLL_STORE_DTYPE = np.dtype([('turn_index', np.int64)] + ROLL_RECORD_DTYPE.descr)
+
+
+class DiceTurnRecordStore:
+    def __init__(self, chunk_size=RECORD_STORE_CHUNK_SIZE, spill_directory=None, record_rolls=True):
+        self._turn_chunk_list = RecordChunkList(TURN_STORE_DTYPE, chunk_size, spill_directory, 'turn_records')
+        self._roll_chunk_list = RecordChunkList(ROLL_STORE_DTYPE, chunk_size * ROLL_BY_TURN_CHUNK_RATIO,
+                                                spill_directory, 'roll_records')
+        self._nb_turn = 0
+
+        if record_rolls:
+            self.collect_roll = self._collect_roll
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @property
+    def nb_turn(self):
+        return self._nb_turn
+
+    @property
+    def nb_roll(self):
+        return len(self._roll_chunk_list)
+
+    def _collect_roll(self, roll_record):
+        # The roll belongs to the turn being played
+        self._roll_chunk_list.append((self._nb_turn,) + roll_record)
+
+    def collect_turn(self, turn_record):
+        self._turn_chunk_list.append((self._nb_turn,) + turn_record)
+        self._nb_turn += 1
+
+    def turn_array(self):
+        return self._turn_chunk_list.array()
+
+    def roll_array(self):
+        return self._roll_chunk_list.array()
+
+    def turn_dataframe(self):
+        return pd.DataFrame(self.turn_array())
+
+    def roll_dataframe(self):
+        return pd.DataFrame(self.roll_array())
+
+    def iter_turn_dataframes(self):
+        for turn_array in self._turn_chunk_list.iter_arrays():
+            yield pd.DataFrame(turn_array)
+
+    def iter_roll_dataframes(self):
+        for roll_array in self._roll_chunk_list.iter_arrays():
+            yield pd.DataFrame(roll_array)
+
+    def close(self):
+        self._turn_chunk_list.close()
+        self._roll_chunk_list.close()
+        self._nb_turn = 0
+
+
+# ----------------------< Class handling the metrics of games and simulations >-----------------------------------------
+# constructor parameters :
+#   prefix                                      Prefix of the metrics names (default->'dice')
+#
+# getters :
+#
+#   counters()                                  Current totals summed over all the threads --> {name: value}
+#   http_address()                              (host, port) of the metrics HTTP thread, None if not started
+#
+# public methods :
+#
+#   count_turn                                  Count a finished turn
+#       (nb_roll, nb_full_roll, nb_bonus, its_lost_turn)
+#   count_game()                                Count a finished game
+#   observe_decision_latency(seconds)           Add a mark or roll again decision duration to the histogram
+#   open_table() / close_table()                Update the active tables gauge
+#   collect_turn(turn_record)                   Collector entry point, count a DiceTurnSimulation turn
+#
+#   render(consumer='render')                   Prometheus text format of all the metrics, the rates are computed
+#                                                   since the previous render of the same consumer
+#   start_http_server(port, host='127.0.0.1')   Serve render() on http://host:port/metrics from a daemon thread
+#                                                   --> (host, port)
+#   start_file_writer(path, interval)           Write render() to path every interval seconds from a daemon thread
+#                                                   (default->METRICS_FILE_INTERVAL)
+#   stop()                                      Stop the HTTP and file writer threads (last file written on stop)
+#
+# Each thread counts in its own slot, so the game and simulation threads never take a lock. The slots are only
+# summed when the metrics are read. The rates are computed between two consecutive render() calls of a consumer :
+# the HTTP server uses one consumer by scraping host and each file writer its own, so they never shorten each other
+# rates window. Prometheus can also compute rate() from the _total counters.
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameMetrics:
+    # Counters names, index in the thread slots
+    counter_names = ('rolls', 'turns', 'busts', 'full_rolls', 'bonus', 'games', 'active_tables')
+    _rolls_index, _turns_index, _busts_index, _full_rolls_index, _bonus_index, _games_index, _active_tables_index = \
+        range(len(counter_names))
+
+    def __init__(self, prefix='dice'):
+        self._prefix = prefix
+        self._latency_buckets = METRICS_DECISION_LATENCY_BUCKETS
+
+        # Thread slot : counters, latency buckets counts (+Inf bucket included) and latency sum
+        self._latency_index = len(self.counter_names)
+        self._latency_sum_index = self._latency_index + len(self._latency_buckets) + 1
+        self._slot_size = self._latency_sum_index + 1
+
+        self._thread_local = threading.local()
+        self._slot_list = []
+        self._slot_list_lock = threading.Lock()
+
+        # Previous render (time, counters) of each consumer for the rates, the first window starts at creation
+        self._render_lock = threading.Lock()
+        self._creation_time = time.monotonic()
+        self._previous_sample_dict = dict()
+
+        self._http_server = None
+        self._http_thread = None
+        self._file_writer_thread = None
+        self._file_writer_stop_event = None
+
+    def __str__(self):
+        return ', '.join(name + ' : ' + str(value) for name, value in self.counters.items())
+
+    def _thread_slot(self):
+        try:
+            return self._thread_local.slot
+        except AttributeError:
+            # First count of the thread : the only time a lock is taken
+            slot = [0] * self._slot_size
+            with self._slot_list_lock:
+                self._slot_list.append(slot)
+            self._thread_local.slot = slot
+            return slot
+
+    def _sum_slots(self):
+        sum_slot = [0] * self._slot_size
+        for slot in list(self._slot_list):
+            for slot_index, value in enumerate(slot):
+                sum_slot[slot_index] += value
+        return sum_slot
+
+    @property
+    def counters(self):
+        return dict(zip(self.counter_names, self._sum_slots()))
+
+    @property
+    def http_address(self):
+        if self._http_server is None:
+            return None
+        return self._http_server.server_address
+
+    def count_turn(self, nb_roll, nb_full_roll, nb_bonus, its_lost_turn):
+        slot = self._thread_slot()
+        slot[self._rolls_index] += nb_roll
+        slot[self._turns_index] += 1
+        slot[self._full_rolls_index] += nb_full_roll
+        slot[self._bonus_index] += nb_bonus
+        if its_lost_turn:
+            slot[self._busts_index] += 1
+
+    def collect_turn(self, turn_record):
+        # A simulated turn is played until fail -> always a bust
+        slot = self._thread_slot()
+        slot[self._rolls_index] += turn_record[1]
+        slot[self._turns_index] += 1
+        slot[self._busts_index] += 1
+        slot[self._full_rolls_index] += turn_record[2]
+        slot[self._bonus_index] += turn_record[3]
+
+    def count_game(self):
+        self._thread_slot()[self._games_index] += 1
+
+    def open_table(self):
+        self._thread_slot()[self._active_tables_index] += 1
+
+    def close_table(self):
+        self._thread_slot()[self._active_tables_index] -= 1
+
+    def observe_decision_latency(self, seconds):
+        slot = self._thread_slot()
+        bucket_index = self._latency_index
+        for bucket_upper_bound in self._latency_buckets:
+            if seconds <= bucket_upper_bound:
+                break
+            bucket_index += 1
+        slot[bucket_index] += 1
+        slot[self._latency_sum_index] += seconds
+
+    def render(self, consumer='render'):
+        def add_metric(name, metric_type, help_str, value_list):
+            metric_name = self._prefix + '_' + name
+            output_line_list.append('# HELP ' + metric_name + ' ' + help_str)
+            output_line_list.append('# TYPE ' + metric_name + ' ' + metric_type)
+            for suffix, labels, value in value_list:
+                output_line_list.append(metric_name + suffix + labels + ' ' + repr(value))
+
+        def ratio(numerator, denominator):
+            return numerator / denominator if denominator > 0 else 0.0
+
+        # ----<Totals and rates since the previous render of the same consumer>-----------------------------------------
+        with self._render_lock:
+            # Summed under the lock, so the samples of a consumer are ordered and its rates never negative
+            sum_slot = self._sum_slots()
+            counters = dict(zip(self.counter_names, sum_slot))
+            render_time = time.monotonic()
+            previous_render_time, previous_counters = self._previous_sample_dict.get(
+                consumer, (self._creation_time, dict.fromkeys(self.counter_names, 0)))
+            elapsed_time = render_time - previous_render_time
+            rates = {name: ratio(counters[name] - previous_counters[name], elapsed_time)
+                     for name in ('rolls', 'turns', 'games')}
+            self._previous_sample_dict[consumer] = (render_time, counters)
+
+        # ----<Prometheus text format>----------------------------------------------------------------------------------
+        output_line_list = []
+        add_metric('rolls_total', 'counter', 'Number of dice rolls.', [('', '', counters['rolls'])])
+        add_metric('turns_total', 'counter', 'Number of finished turns.', [('', '', counters['turns'])])
+        add_metric('busts_total', 'counter', 'Number of turns lost on a non scoring roll.',
+                   [('', '', counters['busts'])])
+        add_metric('full_rolls_total', 'counter', 'Number of rolls with all the dices scoring.',
+                   [('', '', counters['full_rolls'])])
+        add_metric('bonus_total', 'counter', 'Number of multiple dices bonus.', [('', '', counters['bonus'])])
+        add_metric('games_total', 'counter', 'Number of finished games.', [('', '', counters['games'])])
+
+        for name in ('rolls', 'turns', 'games'):
+            add_metric(name + '_per_second', 'gauge',
+                       'Finished ' + name + ' by second since the previous scrape of the same consumer.',
+                       [('', '', rates[name])])
+
+        add_metric('bust_rate', 'gauge', 'Busts by turn.', [('', '', ratio(counters['busts'], counters['turns']))])
+        add_metric('full_roll_rate', 'gauge', 'Full rolls by roll.',
+                   [('', '', ratio(counters['full_rolls'], counters['rolls']))])
+        add_metric('bonus_rate', 'gauge', 'Bonus by roll.', [('', '', ratio(counters['bonus'], counters['rolls']))])
+        add_metric('active_tables', 'gauge', 'Number of games being played.', [('', '', counters['active_tables'])])
+
+        latency_bucket_list = []
+        cumulative_count = 0
+        for bucket_offset, bucket_upper_bound in enumerate(self._latency_buckets + ('+Inf',)):
+            cumulative_count += sum_slot[self._latency_index + bucket_offset]
+            latency_bucket_list.append(('_bucket', '{le="' + str(bucket_upper_bound) + '"}', cumulative_count))
+        latency_bucket_list.append(('_sum', '', float(sum_slot[self._latency_sum_index])))
+        latency_bucket_list.append(('_count', '', cumulative_count))
+        add_metric('decision_latency_seconds', 'histogram', 'Duration of the mark or roll again decisions.',
+                   latency_bucket_list)
+
+        return '\n'.join(output_line_list) + '\n'
+
+    def start_http_server(self, port, host='127.0.0.1'):
+        metrics = self
+
+        class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                # Each scraping host gets its own rates window
+                body = metrics.render('http:' + self.client_address[0]).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._http_server = http.server.ThreadingHTTPServer((host, port), MetricsRequestHandler)
+        self._http_thread = threading.Thread(target=self._http_server.serve_forever, name='dice-metrics-http',
+                                             daemon=True)
+        self._http_thread.start()
+        return self._http_server.server_address
+
+    def start_file_writer(self, path, interval=METRICS_FILE_INTERVAL):
+        def write_file():
+            # Written aside then renamed, so a reader never sees a partial file
+            temporary_path = path + '.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as metrics_file:
+                metrics_file.write(self.render('file:' + path))
+            os.replace(temporary_path, path)
+
+        def file_writer_loop():
+            while not stop_event.wait(interval):
+                write_file()
+            write_file()
+
+        stop_event = threading.Event()
+        self._file_writer_stop_event = stop_event
+        self._file_writer_thread = threading.Thread(target=file_writer_loop, name='dice-metrics-file', daemon=True)
+        self._file_writer_thread.start()
+
+    def stop(self):
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_thread.join()
+            self._http_server = None
+            self._http_thread = None
+
+        if self._file_writer_thread is not None:
+            self._file_writer_stop_event.set()
+            self._file_writer_thread.join()
+            self._file_writer_thread = None
+            self._file_writer_stop_event = None
+
+
+# ----------------------< Class reporting the progress of long runs >---------------------------------------------------
+# constructor parameters :
+#   nb_total                                    Total number of turns (or games) of the run
+#   interval                                    Sampling period in seconds (default->PROGRESS_INTERVAL)
+#   callback                                    Callable(ProgressRecord) called at each sample
+#                                                   (default->print_progress, one line on the standard output)
+#   unit                                        Name of the counted items in the printed lines (default->'turns')
+#
+# getters :
+#
+#   nb_total()                                  Total number of turns (or games) of the run
+#   last_record()                               Last ProgressRecord emitted, None before the first sample
+#
+# public methods :
+#
+#   start(progress_function)                    Start sampling progress_function() --> (nb done, mean turn score or
+#                                                   None) from a daemon timer thread
+#   stop()                                      Stop the timer thread and emit a final record
+#   sample()                                    Emit a record now --> ProgressRecord
+#
+# static methods :
+#
+#   print_progress(progress_record, unit)       Print a progress line
+#
+# The run itself is never instrumented : the reporter only reads counters the run already maintains, so the cost is
+# one progress_function() call by interval.
+# ----------------------------------------------------------------------------------------------------------------------
+ProgressRecord = namedtuple('ProgressRecord', ['nb_done', 'nb_total', 'elapsed_time', 'rate', 'percent_done', 'eta',
+                                               'mean_turn_score'])
+
+
+class DiceGameProgressReporter:
+    def __init__(self, nb_total, interval=PROGRESS_INTERVAL, callback=None, unit='turns'):
+        self._nb_total = nb_total
+        self._interval = interval
+        self._callback = callback if callback is not None else \
+            lambda progress_record: self.print_progress(progress_record, unit)
+
+        self._progress_function = None
+        self._start_time = 0.0
+        self._previous_sample_time = 0.0
+        self._previous_nb_done = 0
+        self._last_record = None
+
+        self._timer_thread = None
+        self._stop_event = None
+
+    def __str__(self):
+        return str(self._last_record)
+
+    @property
+    def nb_total(self):
+        return self._nb_total
+
+    @property
+    def last_record(self):
+        return self._last_record
+
+    @staticmethod
+    def print_progress(progress_record, unit='turns'):
+        output_str = '{:.1f}'.format(progress_record.percent_done) + '% '
+        output_str += '(' + str(progress_record.nb_done) + '/' + str(progress_record.nb_total) + ' ' + unit + ')'
+        output_str += ', ' + '{:.0f}'.format(progress_record.rate) + ' ' + unit + '/s'
+        output_str += ', ETA ' + '{:.0f}'.format(progress_record.eta) + ' s'
+        if progress_record.mean_turn_score is not None:
+            output_str += ', mean turn score ' + '{:.2f}'.format(progress_record.mean_turn_score)
+        print(output_str)
+
+    def sample(self):
+        nb_done, mean_turn_score = self._progress_function()
+        sample_time = time.monotonic()
+
+        # Rate over the last interval, ETA from the mean rate since the start
+        elapsed_time = sample_time - self._start_time
+        sample_duration = sample_time - self._previous_sample_time
+        rate = (nb_done - self._previous_nb_done) / sample_duration if sample_duration > 0 else 0.0
+        mean_rate = nb_done / elapsed_time if elapsed_time > 0 else 0.0
+        eta = (self._nb_total - nb_done) / mean_rate if mean_rate > 0 else float('inf')
+        percent_done = 100.0 * nb_done / self._nb_total if self._nb_total > 0 else 100.0
+
+        self._previous_sample_time = sample_time
+        self._previous_nb_done = nb_done
+        self._last_record = ProgressRecord(nb_done, self._nb_total, elapsed_time, rate, percent_done, eta,
+                                           mean_turn_score)
+        self._callback(self._last_record)
+        return self._last_record
+
+    def start(self, progress_function):
+        def timer_loop():
+            while not stop_event.wait(self._interval):
+                self.sample()
+
+        self._progress_function = progress_function
+        self._start_time = time.monotonic()
+        self._previous_sample_time = self._start_time
+        self._previous_nb_done = 0
+
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+        self._timer_thread = threading.Thread(target=timer_loop, name='dice-progress', daemon=True)
+        self._timer_thread.start()
+
+    def stop(self):
+        if self._timer_thread is None:
+            return self._last_record
+
+        self._stop_event.set()
+        self._timer_thread.join()
+        self._timer_thread = None
+        self._stop_event = None
+
+        return self.sample()
+
+
+# ----------------------< Class handling the parallel executors >-------------------------------------------------------
+# constructor parameters :
+#   backend                                     'serial', 'thread' or 'process' (default->'process')
+#   nb_worker                                   Number of worker threads or processes (default->os.cpu_count())
+#
+# getters :
+#
+#   backend()                                   Backend name
+#   nb_worker()                                 Number of workers, 1 for the serial backend
+#
+# public methods :
+#
+#   submit(function, *args)                     Schedule function(*args) --> concurrent.futures.Future
+#   map(function, argument_list)                function(*arguments) for each arguments tuple --> results list, in
+#                                                   the arguments order whatever the completion order
+#   shutdown(wait=True, cancel_futures=False)   Release the workers, after the pending work if wait, cancelling
+#                                                   the work not started yet if cancel_futures (as
+#                                                   concurrent.futures.Executor.shutdown). Used as a context manager,
+#                                                   the work not started is cancelled when the block raises
+#
+# static methods :
+#
+#   work_unit_rng(seed, work_unit_index)        Random generator of a work unit, the same stream on every backend
+#   split(nb_total, nb_work_unit)               Split nb_total items between work units, the first ones taking the
+#                                                   remainder --> list of nb items
+#
+# The work functions must be module level functions (picklable) for the process backend. A work unit never shares a
+# DiceGameTurn, a statistics object or a random generator with another one, so the thread backend is safe without
+# the global random state, and free-threaded builds run the units in parallel.
+# ----------------------------------------------------------------------------------------------------------------------
+class SerialExecutor(concurrent.futures.Executor):
+    # Executor running each task when submitted, in the calling thread
+    def submit(self, function, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except BaseException as exception:
+            future.set_exception(exception)
+        return future
+
+
+class DiceGameExecutor:
+    backend_names = ('serial', 'thread', 'process')
+
+    def __init__(self, backend='process', nb_worker=None):
+        # Checked against the names of the class, so subclasses can bring their own backend
+        if backend not in self.backend_names:
+            raise ValueError('unknown executor backend : ' + str(backend))
+
+        self._backend = backend
+        self._nb_worker = 1 if backend == 'serial' else nb_worker if nb_worker is not None else os.cpu_count()
+        self._pool = None
+
+    def __str__(self):
+        return self._backend + ' executor, ' + str(self._nb_worker) + ' workers'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        # On error (Ctrl+C included) the queued work is dropped instead of waited for
+        self.shutdown(cancel_futures=exception_type is not None)
+
+    @property
+    def backend(self):
+        return self._backend
+
+    @property
+    def nb_worker(self):
+        return self._nb_worker
+
+    @staticmethod
+    def work_unit_rng(seed, work_unit_index):
+        return random.Random(None if seed is None else str(seed) + '/' + str(work_unit_index))
+
+    @staticmethod
+    def split(nb_total, nb_work_unit):
+        return [nb_total // nb_work_unit + (1 if work_unit_index < nb_total % nb_work_unit else 0)
+                for work_unit_index in range(nb_work_unit)]
+
+    def _get_pool(self):
+        # The pool is created on first use
+        if self._pool is None:
+            if self._backend == 'serial':
+                self._pool = SerialExecutor()
+            elif self._backend == 'thread':
+                self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._nb_worker)
+            else:
+                self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self._nb_worker)
+        return self._pool
+
+    def submit(self, function, *args):
+        return self._get_pool().submit(function, *args)
+
+    def map(self, function, argument_list):
+        future_list = [self.submit(function, *arguments) for arguments in argument_list]
+        return [future.result() for future in future_list]
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self._pool = None
+
+
+def _send_payload(connection, payload):
+    # Write a length prefixed message
+    connection.sendall(struct.pack('>Q', len(payload)) + payload)
+
+
+def _receive_payload(connection):
+    # Read a length prefixed message --> payload, None if the peer closed the connection
+    def receive_exactly(size):
+        data = bytearray()
+        while len(data) < size:
+            chunk = connection.recv(min(size - len(data), 1 << 20))
+            if not chunk:
+                return None
+            data += chunk
+        return bytes(data)
+
+    header = receive_exactly(struct.calcsize('>Q'))
+    if header is None:
+        return None
+    return receive_exactly(struct.unpack('>Q', header)[0])
+
+
+# ----------------------< Class handling the distributed coordinator >--------------------------------------------------
+# constructor parameters :
+#   host                                        Listening address (default->DISTRIBUTED_HOST)
+#   port                                        Listening port, 0 for any free port (default->DISTRIBUTED_PORT)
+#   nb_worker                                   Expected number of workers, default number of work units of the
+#                                                   parallel analyses (default->1)
+#   worker_timeout                              Silence in seconds before a busy worker is considered lost
+#                                                   (default->DISTRIBUTED_WORKER_TIMEOUT)
+#
+# getters :
+#
+#   backend()                                   'socket'
+#   nb_worker()                                 Expected number of workers
+#   address()                                   (host, port) the workers connect to
+#   nb_connected_worker()                       Number of workers currently connected
+#   nb_reissued()                               Number of work units reissued after a worker loss
+#
+# public methods :
+#
+#   submit(function, *args)                     Queue function(*args) for the next free worker
+#                                                   --> concurrent.futures.Future
+#   map(function, argument_list)                function(*arguments) for each arguments tuple --> results list, in
+#                                                   the arguments order whatever the worker
+#   shutdown(wait=True, cancel_futures=False)   Stop the workers once the queue is empty : cancel the queued work
+#                                                   units not started if cancel_futures, wait for the pending ones if
+#                                                   wait (a running unit lost after the cancel is still reissued)
+#
+# The coordinator is a DiceGameExecutor, so it can be given as executor to launch_parallel_analyse(), run_parallel()
+# or DiceGameLeague. It listens as soon as it is created and hands the queued work units to the DiceGameWorker
+# connected to it, one at a time by worker. A work unit whose worker closes the connection or stays silent for
+# worker_timeout seconds is put back at the head of the queue. Since a work unit only depends on its arguments
+# (see DiceGameExecutor.work_unit_rng()), a reissued unit gives the same result and the merged results stay
+# reproducible. The messages are pickled : only run it on a trusted network.
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameCoordinator(DiceGameExecutor):
+    backend_names = ('socket',)
+
+    def __init__(self, host=DISTRIBUTED_HOST, port=DISTRIBUTED_PORT, nb_worker=1,
+                 worker_timeout=DISTRIBUTED_WORKER_TIMEOUT):
+        # No local pool : submit() queues the work units for the connected workers
+        super().__init__('socket', nb_worker)
+        self._worker_timeout = worker_timeout
+
+        self._condition = threading.Condition()
+        self._work_unit_queue = deque()
+        self._pending_future_set = set()
+        self._handler_thread_list = []
+        self._nb_connected_worker = 0
+        self._nb_reissued = 0
+        self._is_shutdown = False
+
+        self._server_socket = socket.create_server((host, port))
+        self._server_socket.settimeout(DISTRIBUTED_ACCEPT_INTERVAL)
+        self._address = self._server_socket.getsockname()[:2]
+        self._accept_thread = threading.Thread(target=self._accept_loop, name='dice-coordinator', daemon=True)
+        self._accept_thread.start()
+
+    def __str__(self):
+        return 'socket coordinator on ' + ':'.join(str(item) for item in self.address) + ', ' + \
+            str(self.nb_connected_worker) + ' workers connected'
+
+    @property
+    def address(self):
+        return self._address
+
+    @property
+    def nb_connected_worker(self):
+        with self._condition:
+            return self._nb_connected_worker
+
+    @property
+    def nb_reissued(self):
+        with self._condition:
+            return self._nb_reissued
+
+    def _accept_loop(self):
+        try:
+            self._accept_workers()
+        finally:
+            # Closed by the accept thread itself, so shutdown(wait=False) never closes a socket in use
+            self._server_socket.close()
+
+    def _accept_workers(self):
+        while not self._is_shutdown:
+            try:
+                connection, _ = self._server_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+
+            connection.settimeout(self._worker_timeout)
+            handler_thread = threading.Thread(target=self._handle_worker, args=(connection,),
+                                              name='dice-coordinator-worker', daemon=True)
+            with self._condition:
+                self._handler_thread_list.append(handler_thread)
+            handler_thread.start()
+
+    def _next_work_unit(self):
+        # Block until a work unit is queued --> (future, payload), None once shut down
+        with self._condition:
+            while True:
+                while not self._work_unit_queue and not self._is_shutdown:
+                    self._condition.wait()
+                if not self._work_unit_queue:
+                    return None
+
+                work_unit = self._work_unit_queue.popleft()
+                # A reissued work unit is already running, a cancelled one is dropped
+                if work_unit[0].running() or work_unit[0].set_running_or_notify_cancel():
+                    return work_unit
+
+    def _reissue(self, work_unit):
+        with self._condition:
+            self._work_unit_queue.appendleft(work_unit)
+            self._nb_reissued += 1
+            self._condition.notify()
+
+    def _work_unit_done(self, future):
+        with self._condition:
+            self._pending_future_set.discard(future)
+            self._condition.notify_all()
+
+    def _handle_worker(self, connection):
+        with self._condition:
+            self._nb_connected_worker += 1
+
+        work_unit = None
+        try:
+            while True:
+                work_unit = self._next_work_unit()
+                if work_unit is None:
+                    _send_payload(connection, pickle.dumps(('stop',)))
+                    return
+
+                future, payload = work_unit
+                _send_payload(connection, payload)
+                # Empty messages are the heartbeats of the worker
+                reply = _receive_payload(connection)
+                while reply == b'':
+                    reply = _receive_payload(connection)
+                if reply is None:
+                    return
+
+                # The work unit is answered, even if its result can not be read here
+                work_unit = None
+                try:
+                    status, value = pickle.loads(reply)
+                except Exception as exception:
+                    future.set_exception(exception)
+                    continue
+                if status == 'result':
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        except OSError:
+            pass
+        finally:
+            connection.close()
+            with self._condition:
+                self._nb_connected_worker -= 1
+            if work_unit is not None:
+                self._reissue(work_unit)
+
+    def submit(self, function, *args):
+        # Pickled now, so that an unpicklable work unit fails here instead of in a worker
+        payload = pickle.dumps(('run', function, args))
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._is_shutdown:
+                raise RuntimeError('cannot submit a work unit after the coordinator shutdown')
+            self._pending_future_set.add(future)
+            self._work_unit_queue.append((future, payload))
+            self._condition.notify()
+        future.add_done_callback(self._work_unit_done)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        with self._condition:
+            if cancel_futures:
+                # Reissued units are already running and stay queued, the condition lock is reentrant for the
+                # done callbacks of the cancelled futures
+                for future, _ in list(self._work_unit_queue):
+                    future.cancel()
+                self._work_unit_queue = deque(work_unit for work_unit in self._work_unit_queue
+                                              if not work_unit[0].cancelled())
+            while wait and self._pending_future_set:
+                self._condition.wait()
+            self._is_shutdown = True
+            self._condition.notify_all()
+            handler_thread_list = self._handler_thread_list
+            self._handler_thread_list = []
+
+        if wait:
+            self._accept_thread.join()
+            for handler_thread in handler_thread_list:
+                handler_thread.join()
+
+
+# ----------------------< Class handling the distributed workers >------------------------------------------------------
+# constructor parameters :
+#   host                                        Address of the coordinator (default->DISTRIBUTED_HOST)
+#   port                                        Port of the coordinator (default->DISTRIBUTED_PORT)
+#   connect_timeout                             Time in seconds to keep retrying to reach the coordinator
+#                                                   (default->DISTRIBUTED_CONNECT_TIMEOUT)
+#   heartbeat_interval                          Period in seconds of the heartbeats sent while running a work unit
+#                                                   (default->DISTRIBUTED_HEARTBEAT_INTERVAL)
+#
+# getters :
+#
+#   nb_work_unit_done()                         Number of work units run by the worker
+#
+# public methods :
+#
+#   run()                                       Run the work units sent by the coordinator until it stops or drops
+#                                                   the worker --> number of work units run
+#
+# A worker runs in its own process, on the coordinator machine or on another one with the same dice_mvc module, e.g.
+# python -c "import dice_mvc; dice_mvc.DiceGameWorker('coordinator-host').run()". The heartbeat_interval must stay
+# well below the worker_timeout of the coordinator.
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameWorker:
+    def __init__(self, host=DISTRIBUTED_HOST, port=DISTRIBUTED_PORT, connect_timeout=DISTRIBUTED_CONNECT_TIMEOUT,
+                 heartbeat_interval=DISTRIBUTED_HEARTBEAT_INTERVAL):
+        self._address = (host, port)
+        self._connect_timeout = connect_timeout
+        self._heartbeat_interval = heartbeat_interval
+        self._nb_work_unit_done = 0
+
+    def __str__(self):
+        return 'worker of ' + ':'.join(str(item) for item in self._address) + ', ' + \
+            str(self._nb_work_unit_done) + ' work units done'
+
+    @property
+    def nb_work_unit_done(self):
+        return self._nb_work_unit_done
+
+    def _connect(self):
+        # The coordinator may not be listening yet
+        deadline = time.monotonic() + self._connect_timeout
+        while True:
+            try:
+                return socket.create_connection(self._address)
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(DISTRIBUTED_CONNECT_RETRY_DELAY)
+
+    def _run_work_unit(self, connection, send_lock, function, args):
+        # Run function(*args) while a daemon thread keeps the coordinator informed that the worker is alive
+        def heartbeat_loop():
+            while not stop_event.wait(self._heartbeat_interval):
+                try:
+                    with send_lock:
+                        _send_payload(connection, b'')
+                except OSError:
+                    return
+
+        stop_event = threading.Event()
+        heartbeat_thread = threading.Thread(target=heartbeat_loop, name='dice-worker-heartbeat', daemon=True)
+        heartbeat_thread.start()
+        try:
+            reply = ('result', function(*args))
+        except Exception as exception:
+            reply = ('error', exception)
+        finally:
+            stop_event.set()
+            heartbeat_thread.join()
+
+        try:
+            return pickle.dumps(reply)
+        except Exception as exception:
+            return pickle.dumps(('error', RuntimeError('unpicklable work unit reply : ' + repr(exception))))
+
+    def run(self):
+        connection = self._connect()
+        send_lock = threading.Lock()
+        try:
+            while True:
+                payload = _receive_payload(connection)
+                if payload is None:
+                    break
+                message = pickle.loads(payload)
+                if message[0] == 'stop':
+                    break
+
+                reply = self._run_work_unit(connection, send_lock, message[1], message[2])
+                with send_lock:
+                    _send_payload(connection, reply)
+                self._nb_work_unit_done += 1
+        except ConnectionError:
+            # Dropped by the coordinator, which has already reissued the work unit
+            pass
+        finally:
+            connection.close()
+
+        return self._nb_work_unit_done
+
+
+# ----------------------< Class handling game stats >---------------------------------------------------------------
+# constructor parameters :
+#   nb_dice                                     List of players name
+#   nb_turn                                     Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   interval                                    Target score to win (default->DEFAULT_TARGET_SCORE)
+#   metrics                                     DiceGameMetrics also counting the simulated turns (default->None)
+#   rng                                         Random generator of the dices (default->random module)
+#
+# public methods :
+#
+#   merge(other)                                 Add the results of another analyse of same interval --> self
+#   launch_analyse(progress_reporter=None)       Launch nb_turn turn and update the stats, reporting the progress to
+#                                                   a DiceGameProgressReporter if given
+#   register_collectors(turn_simulation)         Register the analyse collectors on a shared DiceTurnSimulation
+#   print_occurrence_distribution()              Print the occurrence dict
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameStatisticsAnalyse:
+    def __init__(self, nb_turn, interval, nb_dice=DEFAULT_DICES_NB, metrics=None, rng=None):
+        self._nb_dice = nb_dice
+        self._nb_turn = nb_turn
+        self._interval = interval
+        self._metrics = metrics
+        self._rng = rng
+
+        self._max_turn_scoring = MaxCollector('turn_score')
+        self._mean_scoring = MomentsCollector('turn_score')
+        self._max_nb_roll = MaxCollector('nb_roll')
+        self._max_bonus = MaxCollector('nb_bonus')
+        self._score_distribution = OccurrenceDistribution(interval)
+
+    def __str__(self):
+        output_str = 'Score max : ' + str(self._max_turn_scoring.value)
+        output_str += '\nScore moyen : ' + str(self._mean_scoring.mean)
+        output_str += '\nPlus grand nombre de lancer : ' + str(self._max_nb_roll.value)
+        output_str += '\nPlus grand nombre de bonus : ' + str(self._max_bonus.value)
+        self.pretty_print_occurrence_distribution()
+        return output_str
+
+    def register_collectors(self, turn_simulation):
+        turn_simulation.register_collector(self._max_turn_scoring)
+        turn_simulation.register_collector(self._mean_scoring)
+        turn_simulation.register_collector(self._max_nb_roll)
+        turn_simulation.register_collector(self._max_bonus)
+        turn_simulation.register_collector(HistogramCollector('turn_score', self._score_distribution))
+
+        if self._metrics is not None:
+            turn_simulation.register_collector(self._metrics)
+
+    def merge(self, other):
+        self._nb_turn += other._nb_turn
+        self._max_turn_scoring.merge(other._max_turn_scoring)
+        self._mean_scoring.merge(other._mean_scoring)
+        self._max_nb_roll.merge(other._max_nb_roll)
+        self._max_bonus.merge(other._max_bonus)
+        self._score_distribution.merge(other._score_distribution)
+        return self
+
+    def launch_analyse(self, progress_reporter=None):
+        turn_simulation = DiceTurnSimulation(self._nb_dice, self._rng)
+        self.register_collectors(turn_simulation)
+
+        if progress_reporter is None:
+            turn_simulation.run(self._nb_turn)
+            return
+
+        progress_reporter.start(lambda: (turn_simulation.nb_turn_done, self._mean_scoring.mean))
+        try:
+            turn_simulation.run(self._nb_turn)
+        finally:
+            progress_reporter.stop()
+
+    def pretty_print_occurrence_distribution(self):
+        pretty_occurrence_distribution = dict(sorted(self._score_distribution._occurrence_distribution.items()))
+
+        print('Tableau d\'occurences : ')
+        for key in pretty_occurrence_distribution:
+            if key == 0:
+                print('{0 :', end='')
+            else:
+                interval_from = (key - 1) * self._score_distribution.interval + 1
+                interval_to = key * self._score_distribution.interval
+                print('{', interval_from, '->', interval_to, " :", end='')
+
+            print(' ', pretty_occurrence_distribution[key] / self._nb_turn, '},', end='')
+
+        print('\n')
+
+
+# ----------------------< Class handling game stats >---------------------------------------------------------------
+# constructor parameters :
+#   nb_dice                                     List of players name
+#   nb_turn                                     Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   interval                                    Target score to win (default->DEFAULT_TARGET_SCORE)
+#   distribution_factory                        Callable (distribution name, interval) --> distribution
+#                                                   (default->OccurrenceDistribution, hdr_distribution_factory for
+#                                                   HdrOccurrenceDistribution)
+#   record_store                                DiceTurnRecordStore also filled with the raw turns (default->None)
+#   metrics                                     DiceGameMetrics also counting the simulated turns (default->None)
+#   rng                                         Random generator of the dices (default->random module)
+#
+# getters :
+#
+#   nb_turn()                                    Number of turns of the analyse
+#   nb_dice()                                    Total number of dices in the game set
+#   distributions()                              All the distributions by name --> {name: distribution}
+#   record_store()                               Raw turns record store, None if not recorded
+#
+# public methods :
+#
+#   launch_analyse(progress_reporter=None)       Launch nb_turn turn and update the stats, reporting the progress to
+#                                                   a DiceGameProgressReporter if given
+#   register_collectors(turn_simulation)         Register the analyse collectors on a shared DiceTurnSimulation
+#   print_occurrence_distribution()              Print the occurrence dict
+#   merge(other)                                 Add the distributions of another analyse of same interval --> self
+#
+# class methods :
+#
+#   distribution_interval                        Interval used for a distribution name
+#       (distribution_name, interval)
+#   launch_parallel_analyse(nb_turn, interval,   Split nb_turn in work units run by a DiceGameExecutor (default->
+#       nb_dice, executor, nb_work_unit, seed,       process backend), each with its own random stream, and merge
+#       distribution_factory)                        them in work unit order (distribution_factory must be picklable
+#                                                   for the process and socket backends) --> DiceGameDistributionAnalyse
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameDistributionAnalyse:
+    # Names of the distributions, in creation order
+    distribution_names = ('roll_score', 'turn_score', 'turn_nb_roll', 'turn_nb_full_roll', 'turn_nb_bonus',
+                          'turn_nb_dices_fail', 'turn_nb_dice_to_roll')
+
+    def __init__(self, nb_turn, interval, nb_dice=DEFAULT_DICES_NB, distribution_factory=None, record_store=None,
+                 metrics=None, rng=None):
+        self._nb_dice = nb_dice
+        self._nb_turn = nb_turn
+        self._interval = interval
+        self._record_store = record_store
+        self._metrics = metrics
+        self._rng = rng
+
+        if distribution_factory is None:
+            distribution_factory = default_distribution_factory
+
+        self._roll_score_distribution = distribution_factory('roll_score', interval)
+        self._turn_score_distribution = distribution_factory('turn_score', interval)
+        self._turn_nb_roll_distribution = distribution_factory('turn_nb_roll', 1)
+        self._turn_nb_full_roll_distribution = distribution_factory('turn_nb_full_roll', 1)
+        self._turn_nb_bonus_distribution = distribution_factory('turn_nb_bonus', 1)
+        self._turn_nb_dices_fail_distribution = distribution_factory('turn_nb_dices_fail', 1)
+        self._turn_nb_dice_to_roll_distribution = distribution_factory('turn_nb_dice_to_roll', 1)
+
+    @classmethod
+    def distribution_interval(cls, distribution_name, interval):
+        # Score distributions use the analyse interval, counter distributions use a unit interval
+        return interval if distribution_name in ('roll_score', 'turn_score') else 1
+
+    @classmethod
+    def launch_parallel_analyse(cls, nb_turn, interval, nb_dice=DEFAULT_DICES_NB, executor=None, nb_work_unit=None,
+                                seed=None, distribution_factory=None):
+        own_executor = executor is None
+        if own_executor:
+            executor = DiceGameExecutor()
+        if nb_work_unit is None:
+            nb_work_unit = executor.nb_worker
+
+        try:
+            analyse_list = executor.map(_distribution_analyse_work_unit,
+                                        [(work_unit_nb_turn, interval, nb_dice, seed, work_unit_index,
+                                          distribution_factory)
+                                         for work_unit_index, work_unit_nb_turn
+                                         in enumerate(DiceGameExecutor.split(nb_turn, nb_work_unit))])
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        merged_analyse = analyse_list[0]
+        for analyse in analyse_list[1:]:
+            merged_analyse.merge(analyse)
+        return merged_analyse
+
+    @property
+    def nb_turn(self):
+        return self._nb_turn
+
+    @property
+    def nb_dice(self):
+        return self._nb_dice
+
+    @property
+    def distributions(self):
+        return {'roll_score': self._roll_score_distribution,
+                'turn_score': self._turn_score_distribution,
+                'turn_nb_roll': self._turn_nb_roll_distribution,
+                'turn_nb_full_roll': self._turn_nb_full_roll_distribution,
+                'turn_nb_bonus': self._turn_nb_bonus_distribution,
+                'turn_nb_dices_fail': self._turn_nb_dices_fail_distribution,
+                'turn_nb_dice_to_roll': self._turn_nb_dice_to_roll_distribution}
+
+    @property
+    def record_store(self):
+        return self._record_store
+
+    @property
+    def roll_score_distribution(self):
+        return self._roll_score_distribution
+
+    @property
+    def turn_score_distribution(self):
+        return self._turn_score_distribution
+
+    @property
+    def turn_nb_roll_distribution(self):
+        return self._turn_nb_roll_distribution
+
+    @property
+    def turn_nb_full_roll_distribution(self):
+        return self._turn_nb_full_roll_distribution
+
+    @property
+    def turn_nb_bonus_distribution(self):
+        return self._turn_nb_bonus_distribution
+
+    @property
+    def turn_nb_dices_fail_distribution(self):
+        return self._turn_nb_dices_fail_distribution
+
+    @property
+    def turn_nb_dice_to_roll_distribution(self):
+        return self._turn_nb_dice_to_roll_distribution
+
+    def register_collectors(self, turn_simulation):
+        turn_simulation.register_collector(HistogramCollector('roll_score', self._roll_score_distribution))
+        turn_simulation.register_collector(HistogramCollector('nb_dices_to_roll',
+                                                              self._turn_nb_dice_to_roll_distribution))
+
+        turn_simulation.register_collector(HistogramCollector('turn_score', self._turn_score_distribution))
+        turn_simulation.register_collector(HistogramCollector('nb_roll', self._turn_nb_roll_distribution))
+        turn_simulation.register_collector(HistogramCollector('nb_full_roll', self._turn_nb_full_roll_distribution))
+        turn_simulation.register_collector(HistogramCollector('nb_bonus', self._turn_nb_bonus_distribution))
+        turn_simulation.register_collector(HistogramCollector('nb_dices_fail', self._turn_nb_dices_fail_distribution))
+
+        if self._record_store is not None:
+            turn_simulation.register_collector(self._record_store)
+
+        if self._metrics is not None:
+            turn_simulation.register_collector(self._metrics)
+
+    def merge(self, other):
+        self._nb_turn += other.nb_turn
+        other_distributions = other.distributions
+        for distribution_name, distribution in self.distributions.items():
+            distribution.merge(other_distributions[distribution_name])
+        return self
+
+    def launch_analyse(self, progress_reporter=None):
+        def progress():
+            # The occurrences are copied in one step, as the simulation thread keeps on pushing values
+            distribution = self._turn_score_distribution
+            occurrence_distribution = getattr(distribution, 'occurrence_distribution', None)
+            if occurrence_distribution is None:
+                return turn_simulation.nb_turn_done, None
+            return turn_simulation.nb_turn_done, \
+                OccurrenceDistribution.from_occurrence_dict(distribution.interval, occurrence_distribution).get_mean()
+
+        # ----<Run the turns, sampled by the progress reporter timer if any>--------------------------------------------
+        turn_simulation = DiceTurnSimulation(self._nb_dice, self._rng)
+        self.register_collectors(turn_simulation)
+
+        if progress_reporter is None:
+            turn_simulation.run(self._nb_turn)
+            return
+
+        progress_reporter.start(progress)
+        try:
+            turn_simulation.run(self._nb_turn)
+        finally:
+            progress_reporter.stop()
+
+
+def _distribution_analyse_work_unit(nb_turn, interval, nb_dice, seed, work_unit_index, distribution_factory=None):
+    # Executor work unit : a distribution analyse with the work unit random stream
+    distribution_statistics = DiceGameDistributionAnalyse(
+        nb_turn, interval, nb_dice, distribution_factory=distribution_factory,
+        rng=DiceGameExecutor.work_unit_rng(seed, work_unit_index))
+    distribution_statistics.launch_analyse()
+    return distribution_statistics
+
+
+# ----------------------< Class handling exact threshold strategies analyse >-------------------------------------------
+# constructor parameters :
+#   choice_critter_value_list                   Strategy of each seat, same meaning as DiceGameController
+#                                                   choice_critter_value (0 -> random, > 0 -> score, < 0 -> dices)
+#   nb_dices                                    Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   target_score                                Target score to win (default->DEFAULT_TARGET_SCORE)
+#   tolerance                                   Stop when the probability of a non finished game is below (default->1e-9)
+#   max_nb_turn                                 Maximum number of turns computed (default->10000)
+#
+# getters :
+#
+#   score_granularity()                         Score step of the game rules (gcd of all the roll scores)
+#   nb_turn_distribution()                      For each seat, list of P(target reached at turn t), t = 1, 2 ...
+#   expected_nb_turn()                          For each seat, expected number of turns to reach the target
+#   game_nb_turn_distribution()                 List of P(game finished at turn t), t = 1, 2 ...
+#   expected_game_nb_turn()                     Expected number of turns of the game
+#   win_rate()                                  For each seat, probability to win the game
+#
+# public methods :
+#
+#   launch_analyse()                            Compute all the distributions without simulating any game
+#   turn_gain_distribution                      Exact turn gain distribution {gain: probability} of a strategy
+#       (choice_critter_value, player_score)        for a player having player_score points
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameExactAnalyse:
+    # Class reference to the dice turn rules used for the exact roll outcomes
+    _dice_game_turn_class = DiceGameTurn
+
+    def __init__(self, choice_critter_value_list, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE,
+                 tolerance=1e-9, max_nb_turn=10000):
+        self._choice_critter_value_list = list(choice_critter_value_list)
+        self._nb_dices = nb_dices
+        self._target_score = target_score
+        self._tolerance = tolerance
+        self._max_nb_turn = max_nb_turn
+
+        self._score_granularity = self._dice_game_turn_class.roll_score_granularity()
+        # Player score states : 0, granularity, 2 * granularity ... below target score, + 1 absorbing winning state
+        self._nb_score_state = -(-target_score // self._score_granularity)
+
+        self._roll_outcome_cache = dict()
+        self._turn_gain_cache = dict()
+
+        self._nb_turn_distribution = []
+        self._game_nb_turn_distribution = []
+        self._win_rate = []
+
+    def __str__(self):
+        output_str = 'target score : ' + str(self._target_score)
+        output_str += ', expected game nb turn : ' + '{:.2f}'.format(self.expected_game_nb_turn) + '\n'
+        for seat_index, choice_critter_value in enumerate(self._choice_critter_value_list):
+            output_str += 'seat #' + str(seat_index) + ' (' + str(choice_critter_value) + ')'
+            output_str += ' win rate : ' + '{:.4f}'.format(self._win_rate[seat_index])
+            output_str += ', expected nb turn : ' + '{:.2f}'.format(self.expected_nb_turn[seat_index]) + '\n'
+        return output_str
+
+    @property
+    def score_granularity(self):
+        return self._score_granularity
+
+    @property
+    def nb_turn_distribution(self):
+        return self._nb_turn_distribution
+
+    @property
+    def expected_nb_turn(self):
+        return [sum((turn_index + 1) * probability for turn_index, probability in enumerate(distribution))
+                for distribution in self._nb_turn_distribution]
+
+    @property
+    def game_nb_turn_distribution(self):
+        return self._game_nb_turn_distribution
+
+    @property
+    def expected_game_nb_turn(self):
+        return sum((turn_index + 1) * probability
+                   for turn_index, probability in enumerate(self._game_nb_turn_distribution))
+
+    @property
+    def win_rate(self):
+        return self._win_rate
+
+    def _roll_outcome_list(self, nb_dices_to_roll):
+        # List of (probability, roll score, nb dices to roll next) for a roll of nb_dices_to_roll
+        if nb_dices_to_roll not in self._roll_outcome_cache:
+            next_state_distribution = self._dice_game_turn_class.roll_odds(self._nb_dices, nb_dices_to_roll)[2]
+            self._roll_outcome_cache[nb_dices_to_roll] = [
+                (probability, roll_score, nb_next_dices)
+                for (roll_score, nb_next_dices), probability in next_state_distribution.items()]
+
+        return self._roll_outcome_cache[nb_dices_to_roll]
+
+    def turn_gain_distribution(self, choice_critter_value, player_score):
+        def mark_probability(turn_score, nb_next_dices):
+            # Same choice algorithms as DiceGameController for non interactive games
+            if choice_critter_value == 0:
+                return 0.5
+            elif choice_critter_value > 0:
+                return 1.0 if turn_score >= choice_critter_value else 0.0
+            else:
+                return 1.0 if nb_next_dices < abs(choice_critter_value) else 0.0
+
+        # ----<Forward propagation of the turn states (turn score, nb dices to roll) by increasing turn score>---------
+        cache_key = (choice_critter_value, player_score)
+        if cache_key in self._turn_gain_cache:
+            return self._turn_gain_cache[cache_key]
+
+        # The turn stops as soon as the player total score reaches the target score
+        winning_turn_score = self._target_score - player_score
+
+        turn_gain_distribution = {0: 0.0}
+        turn_state_distribution = {0: {self._nb_dices: 1.0}}
+        for turn_score in range(0, winning_turn_score, self._score_granularity):
+            for nb_dices_to_roll, state_probability in turn_state_distribution.pop(turn_score, {}).items():
+                for probability, roll_score, nb_next_dices in self._roll_outcome_list(nb_dices_to_roll):
+                    probability *= state_probability
+
+                    if roll_score == 0:
+                        # Lost roll -> no gain
+                        turn_gain_distribution[0] += probability
+                        continue
+
+                    next_turn_score = turn_score + roll_score
+                    if next_turn_score >= winning_turn_score:
+                        # Game winning roll -> the turn is finished
+                        turn_gain_distribution[next_turn_score] = \
+                            turn_gain_distribution.get(next_turn_score, 0.0) + probability
+                        continue
+
+                    probability_to_mark = mark_probability(next_turn_score, nb_next_dices)
+                    if probability_to_mark > 0:
+                        turn_gain_distribution[next_turn_score] = \
+                            turn_gain_distribution.get(next_turn_score, 0.0) + probability * probability_to_mark
+                    if probability_to_mark < 1:
+                        next_state_distribution = turn_state_distribution.setdefault(next_turn_score, {})
+                        next_state_distribution[nb_next_dices] = \
+                            next_state_distribution.get(nb_next_dices, 0.0) + probability * (1 - probability_to_mark)
+
+        self._turn_gain_cache[cache_key] = turn_gain_distribution
+        return turn_gain_distribution
+
+    def _score_transition_matrix(self, choice_critter_value):
+        # Absorbing chain over the player score states, the last state is the winning one
+        transition_matrix = np.zeros((self._nb_score_state + 1, self._nb_score_state + 1))
+        transition_matrix[self._nb_score_state, self._nb_score_state] = 1.0
+
+        for score_state in range(self._nb_score_state):
+            player_score = score_state * self._score_granularity
+            for turn_gain, probability in self.turn_gain_distribution(choice_critter_value, player_score).items():
+                next_score_state = min((player_score + turn_gain) // self._score_granularity, self._nb_score_state)
+                transition_matrix[score_state, next_score_state] += probability
+
+        return transition_matrix
+
+    def launch_analyse(self):
+        def compute_nb_turn_distribution(choice_critter_value):
+            # P(target reached at turn t) from the absorbing state probability after t turns
+            transition_matrix = self._score_transition_matrix(choice_critter_value)
+            state_distribution = np.zeros(self._nb_score_state + 1)
+            state_distribution[0] = 1.0
+
+            nb_turn_distribution = []
+            previous_finished_probability = 0.0
+            while len(nb_turn_distribution) < self._max_nb_turn and \
+                    1.0 - previous_finished_probability > self._tolerance:
+                state_distribution = state_distribution @ transition_matrix
+                finished_probability = state_distribution[self._nb_score_state]
+                nb_turn_distribution.append(finished_probability - previous_finished_probability)
+                previous_finished_probability = finished_probability
+
+            return nb_turn_distribution
+
+        def survival(nb_turn_distribution, nb_turn):
+            # P(target not reached after nb_turn turns)
+            return 1.0 - sum(nb_turn_distribution[:nb_turn])
+
+        # ----<Turn distribution for each strategy, then seat order gives the game level results>-----------------------
+        strategy_nb_turn_distribution = dict()
+        for choice_critter_value in self._choice_critter_value_list:
+            if choice_critter_value not in strategy_nb_turn_distribution:
+                strategy_nb_turn_distribution[choice_critter_value] = \
+                    compute_nb_turn_distribution(choice_critter_value)
+
+        self._nb_turn_distribution = [strategy_nb_turn_distribution[choice_critter_value]
+                                      for choice_critter_value in self._choice_critter_value_list]
+        nb_turn_max = max(len(distribution) for distribution in self._nb_turn_distribution)
+
+        # survival_table[seat][t] = P(seat did not reach the target during its t first turns)
+        survival_table = [[survival(distribution, nb_turn) for nb_turn in range(nb_turn_max + 1)]
+                          for distribution in self._nb_turn_distribution]
+
+        # Seat i wins at turn t if seats before did not finish at turn t and seats after did not finish at turn t - 1
+        self._win_rate = [0.0] * len(self._choice_critter_value_list)
+        for seat_index, distribution in enumerate(self._nb_turn_distribution):
+            for turn_index, probability in enumerate(distribution):
+                nb_turn = turn_index + 1
+                for other_seat_index, other_survival_list in enumerate(survival_table):
+                    if other_seat_index < seat_index:
+                        probability *= other_survival_list[nb_turn]
+                    elif other_seat_index > seat_index:
+                        probability *= other_survival_list[nb_turn - 1]
+                self._win_rate[seat_index] += probability
+
+        # The game is finished at turn t if at least one seat reached the target during this turn
+        self._game_nb_turn_distribution = []
+        for nb_turn in range(1, nb_turn_max + 1):
+            not_finished_before = 1.0
+            not_finished_after = 1.0
+            for survival_list in survival_table:
+                not_finished_before *= survival_list[nb_turn - 1]
+                not_finished_after *= survival_list[nb_turn]
+            self._game_nb_turn_distribution.append(not_finished_before - not_finished_after)
+
+
+# ----------------------< Class handling vectorized batches of full dice games >----------------------------------------
+# constructor parameters :
+#   choice_critter_value_list                   Strategy of each seat, same meaning as DiceGameController
+#                                                   choice_critter_value (0 -> random, > 0 -> score, < 0 -> dices)
+#   nb_game                                     Number of games played in lockstep (default->BATCH_NB_GAME)
+#   nb_dices                                    Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   target_score                                Target score to win (default->DEFAULT_TARGET_SCORE)
+#   seed                                        Seed of the NumPy random generator (default->None)
+#
+# Each row is an independent game equivalent to a DiceGameModel with fixed seat order : scores and totals are
+# (games x players) matrices, turn state, current seat and turn index are vectors. A finished game is retired into the
+# seat totals and its row is reset in place for the next game. As in DiceGameTurn, a roll of more than
+# LARGE_POOL_NB_DICES dices draws its occurrences with Generator.multinomial instead of one value by dice, the
+# smaller rolls of the same step are rolled dice by dice.
+#
+# getters :
+#
+#   nb_players()                                Number of seats
+#   choice_critter_value_list()                 Strategy of each seat
+#   nb_dices()                                  Total number of dices in the game set
+#   seed()                                      Seed of the NumPy random generator
+#   nb_game_done()                              Number of finished games
+#   nb_win()                                    Number of games won by each seat
+#   win_rate()                                  Win rate of each seat
+#   mean_game_nb_turn()                         Mean number of turns of the finished games
+#
+# public methods :
+#
+#   run(nb_game_total,                          Play nb_game_total games --> self, reporting the progress to a
+#       progress_reporter=None)                     DiceGameProgressReporter if given
+#   player_status(seat_index)                   Seat totals over all the finished games, same keys as
+#                                                   DiceGamePlayers.player_status :
+#                                                   { 'nb_win': , 'score': , 'nb_roll': , 'nb_full_roll': ,
+#                                                     'total_lost_score': , 'nb_bonus': }
+#   merge(other)                                Add the finished games results of another engine --> self
+#
+# class methods :
+#
+#   score_occurrence_array(occurrence_array)    Vectorized count_occurrence_score of a (n x nb_side) occurrence array
+#                                                   --> (roll_score, nb_bonus, nb_non_scoring_dices) arrays
+#   run_parallel(choice_critter_value_list,     Split nb_game_total games in work units run by a DiceGameExecutor
+#       nb_game_total, executor, nb_work_unit,      (default->process backend), each with its own random stream,
+#       nb_game, nb_dices, target_score, seed)      and merge them in work unit order --> DiceGameBatchEngine
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameBatchEngine:
+    # Class reference to the dice turn rules
+    _dice_game_turn_class = DiceGameTurn
+
+    # Names of the per player totals, same as DiceGamePlayers.player_status keys
+    _player_total_names = ('score', 'nb_roll', 'nb_full_roll', 'total_lost_score', 'nb_bonus')
+
+    def __init__(self, choice_critter_value_list, nb_game=BATCH_NB_GAME, nb_dices=DEFAULT_DICES_NB,
+                 target_score=DEFAULT_TARGET_SCORE, seed=None):
+        self._critter_by_seat = np.array(choice_critter_value_list, dtype=np.int64)
+        self._nb_players = len(self._critter_by_seat)
+        self._nb_game = nb_game
+        self._nb_dices = nb_dices
+        self._target_score = target_score
+        self._seed = seed
+        self._rng = np.random.default_rng(seed)
+
+        self._game_index = np.arange(nb_game)
+        # Only the rolls up to LARGE_POOL_NB_DICES dices are rolled dice by dice
+        self._dice_index = np.arange(min(nb_dices, LARGE_POOL_NB_DICES))
+
+        # Game state : players totals are flat (games x players) arrays, indexed by game * nb_players + seat
+        self._player_total = {total_name: np.zeros(nb_game * self._nb_players, dtype=np.int64)
+                              for total_name in self._player_total_names}
+        self._turn_score = np.zeros(nb_game, dtype=np.int64)
+        self._nb_dices_to_roll = np.full(nb_game, nb_dices, dtype=np.int64)
+        self._current_seat = np.zeros(nb_game, dtype=np.int64)
+        self._turn_index = np.ones(nb_game, dtype=np.int64)
+        self._active = np.zeros(nb_game, dtype=bool)
+
+        # Results of the finished games
+        self._nb_game_started = 0
+        self._nb_game_done = 0
+        self._sigma_game_nb_turn = 0
+        self._nb_win = np.zeros(self._nb_players, dtype=np.int64)
+        self._seat_total = {total_name: np.zeros(self._nb_players, dtype=np.int64)
+                            for total_name in self._player_total_names}
+
+    def __str__(self):
+        output_str = str(self._nb_game_done) + ' games, mean game nb turn : '
+        output_str += '{:.2f}'.format(self.mean_game_nb_turn) + '\n'
+        for seat_index in range(self._nb_players):
+            player_status = self.player_status(seat_index)
+            output_str += 'seat #' + str(seat_index) + ' (' + str(self._critter_by_seat[seat_index]) + ')'
+            output_str += ' win ' + str(player_status['nb_win'])
+            output_str += ' scoring ' + str(player_status['score'])
+            output_str += ' in ' + str(player_status['nb_roll']) + ' roll'
+            output_str += ' with ' + str(player_status['nb_full_roll']) + ' full roll,'
+            output_str += ' ' + str(player_status['nb_bonus']) + ' bonus'
+            output_str += ' and ' + str(player_status['total_lost_score']) + ' potential points lost\n'
+        return output_str
+
+    @property
+    def nb_players(self):
+        return self._nb_players
+
+    @property
+    def choice_critter_value_list(self):
+        return self._critter_by_seat.tolist()
 
-            turn_score = self._dice_game_turn.turn_lost_score
-            turn_nb_roll = self._dice_game_turn.turn_statistics.turn_nb_roll
-            turn_nb_full_roll = 0
-            turn_nb_bonus = self._dice_game_turn.turn_statistics.turn_nb_bonus
+    @property
+    def nb_dices(self):
+        return self._nb_dices
 
-            self._turn_score_distribution.push(turn_score)
-            self._turn_nb_roll_distribution.push(turn_nb_roll)
-            self._turn_nb_full_roll_distribution.push(turn_nb_full_roll)
-            self._turn_nb_bonus_distribution.push(turn_nb_bonus)
+    @property
+    def seed(self):
+        return self._seed
 
-            turn_index += 1
+    @property
+    def nb_game_done(self):
+        return self._nb_game_done
 
-            # Reset all the turn's parameters to 0
-            self._dice_game_turn.prepare_for_next_turn()
+    @property
+    def nb_win(self):
+        return self._nb_win.tolist()
+
+    @property
+    def win_rate(self):
+        if self._nb_game_done == 0:
+            return [0] * self._nb_players
+        return (self._nb_win / self._nb_game_done).tolist()
+
+    @property
+    def mean_game_nb_turn(self):
+        if self._nb_game_done == 0:
+            return 0
+        return self._sigma_game_nb_turn / self._nb_game_done
+
+    def merge(self, other):
+        self._nb_game_started += other._nb_game_done
+        self._nb_game_done += other._nb_game_done
+        self._sigma_game_nb_turn += other._sigma_game_nb_turn
+        self._nb_win += other._nb_win
+        for total_name in self._player_total_names:
+            self._seat_total[total_name] += other._seat_total[total_name]
+        return self
+
+    @classmethod
+    def run_parallel(cls, choice_critter_value_list, nb_game_total, executor=None, nb_work_unit=None,
+                     nb_game=BATCH_NB_GAME, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE, seed=None):
+        own_executor = executor is None
+        if own_executor:
+            executor = DiceGameExecutor()
+        if nb_work_unit is None:
+            nb_work_unit = executor.nb_worker
+
+        try:
+            engine_list = executor.map(_batch_engine_work_unit,
+                                       [(list(choice_critter_value_list), work_unit_nb_game, nb_game, nb_dices,
+                                         target_score, seed, work_unit_index)
+                                        for work_unit_index, work_unit_nb_game
+                                        in enumerate(DiceGameExecutor.split(nb_game_total, nb_work_unit))])
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        merged_engine = engine_list[0]
+        for engine in engine_list[1:]:
+            merged_engine.merge(engine)
+        merged_engine._seed = seed
+        return merged_engine
+
+    def player_status(self, seat_index):
+        player_status = {'nb_win': int(self._nb_win[seat_index])}
+        for total_name in self._player_total_names:
+            player_status[total_name] = int(self._seat_total[total_name][seat_index])
+        return player_status
+
+    @classmethod
+    def score_occurrence_array(cls, occurrence_array):
+        dice_turn_class = cls._dice_game_turn_class
+        nb_side = dice_turn_class._nb_side
+        trigger = dice_turn_class._trigger_occurrence_for_bonus
+
+        # Bonus for multiple dices value
+        side_nb_bonus = occurrence_array // trigger
+        bonus_value = np.array([(dice_turn_class._bonus_value_for_ace_bonus if side_index == 0
+                                 else dice_turn_class._bonus_value_for_normal_bonus) * (side_index + 1)
+                                for side_index in range(nb_side)], dtype=np.int64)
+        roll_score = side_nb_bonus @ bonus_value
+
+        # Without bonus the occurrence is already below the trigger, so the remainder is the occurrence itself
+        remaining_occurrence_array = occurrence_array % trigger
+
+        # Remaining scoring dices value
+        for scoring_dice_value, scoring_multiplier in zip(dice_turn_class._list_scoring_dice_value,
+                                                          dice_turn_class._list_scoring_multiplier):
+            roll_score = roll_score + remaining_occurrence_array[:, scoring_dice_value - 1] * scoring_multiplier
+            remaining_occurrence_array[:, scoring_dice_value - 1] = 0
+
+        return roll_score, side_nb_bonus.sum(axis=1), remaining_occurrence_array.sum(axis=1)
+
+    def _start_games(self, game_index_array):
+        for total_name in self._player_total_names:
+            self._player_total[total_name].reshape(self._nb_game, self._nb_players)[game_index_array] = 0
+        self._turn_score[game_index_array] = 0
+        self._nb_dices_to_roll[game_index_array] = self._nb_dices
+        self._current_seat[game_index_array] = 0
+        self._turn_index[game_index_array] = 1
+        self._active[game_index_array] = True
+
+    def _retire_games(self, game_index_array, nb_game_total):
+        # Fold the finished games into the seat totals
+        np.add.at(self._nb_win, self._current_seat[game_index_array], 1)
+        for total_name in self._player_total_names:
+            self._seat_total[total_name] += \
+                self._player_total[total_name].reshape(self._nb_game, self._nb_players)[game_index_array].sum(axis=0)
+        self._sigma_game_nb_turn += int(self._turn_index[game_index_array].sum())
+        self._nb_game_done += len(game_index_array)
+
+        # Replace them in place while games remain to be played
+        nb_game_to_start = min(len(game_index_array), nb_game_total - self._nb_game_started)
+        self._start_games(game_index_array[:nb_game_to_start])
+        self._nb_game_started += nb_game_to_start
+        self._active[game_index_array[nb_game_to_start:]] = False
+
+    def _play_roll(self, nb_game_total):
+        nb_side = self._dice_game_turn_class._nb_side
+        active = self._active
+
+        # Same switch as DiceGameTurn : on the number of dices of the roll, not on the size of the set
+        nb_dices_to_roll = self._nb_dices_to_roll
+        large_pool = None
+        if self._nb_dices > LARGE_POOL_NB_DICES:
+            large_pool = nb_dices_to_roll > LARGE_POOL_NB_DICES
+            nb_dices_to_roll = np.where(large_pool, 0, nb_dices_to_roll)
+
+        # ----<Roll the dices of every game, the dices not to roll get the extra side value nb_side>-------------------
+        dice_array = self._rng.integers(0, nb_side, size=(self._nb_game, len(self._dice_index)))
+        dice_array = np.where(self._dice_index < nb_dices_to_roll[:, None], dice_array, nb_side)
+        occurrence_array = np.bincount((self._game_index[:, None] * (nb_side + 1) + dice_array).ravel(),
+                                       minlength=self._nb_game * (nb_side + 1))
+        occurrence_array = occurrence_array.reshape(self._nb_game, nb_side + 1)[:, :nb_side]
+
+        if large_pool is not None and large_pool.any():
+            # ----<Large pools : sample the occurrences from the multinomial distribution>------------------------------
+            occurrence_array[large_pool] = self._rng.multinomial(self._nb_dices_to_roll[large_pool],
+                                                                 [1 / nb_side] * nb_side)
+
+        roll_score, nb_bonus, nb_non_scoring_dices = self.score_occurrence_array(occurrence_array)
+
+        # ----<Roll status, same rules as DiceGameTurn and DiceGameModel>-----------------------------------------------
+        player_index = self._game_index * self._nb_players + self._current_seat
+        its_lost_roll = active & (roll_score == 0)
+        its_scoring_roll = active & (roll_score != 0)
+
+        turn_score = np.where(its_scoring_roll, self._turn_score + roll_score, 0)
+        nb_next_dices = np.where(nb_non_scoring_dices == 0, self._nb_dices, nb_non_scoring_dices)
+
+        self._player_total['nb_roll'][player_index] += active
+        self._player_total['nb_bonus'][player_index] += np.where(active, nb_bonus, 0)
+        self._player_total['nb_full_roll'][player_index] += its_scoring_roll & (nb_non_scoring_dices == 0)
+        self._player_total['total_lost_score'][player_index] += np.where(its_lost_roll, self._turn_score, 0)
+
+        there_is_a_winner = its_scoring_roll & \
+            (self._player_total['score'][player_index] + turn_score >= self._target_score)
+
+        # ----<Choice to mark, same algorithms as DiceGameController>---------------------------------------------------
+        choice_critter_value = self._critter_by_seat[self._current_seat]
+        player_choose_to_mark = np.where(choice_critter_value == 0,
+                                         self._rng.random(self._nb_game) < 0.5,
+                                         np.where(choice_critter_value > 0,
+                                                  turn_score >= choice_critter_value,
+                                                  nb_next_dices < -choice_critter_value))
+
+        mark = there_is_a_winner | (its_scoring_roll & player_choose_to_mark)
+        self._player_total['score'][player_index] += np.where(mark, turn_score, 0)
+
+        # ----<Prepare next roll or next player turn>--------------------------------------------------------------------
+        end_of_turn = its_lost_roll | mark
+        self._turn_score = np.where(end_of_turn, 0, turn_score)
+        self._nb_dices_to_roll = np.where(end_of_turn, self._nb_dices, nb_next_dices)
+
+        next_player = end_of_turn & ~there_is_a_winner
+        self._current_seat = np.where(next_player, (self._current_seat + 1) % self._nb_players, self._current_seat)
+        self._turn_index += next_player & (self._current_seat == 0)
+
+        if there_is_a_winner.any():
+            self._retire_games(np.flatnonzero(there_is_a_winner), nb_game_total)
+
+    def run(self, nb_game_total, progress_reporter=None):
+        nb_game_run_start = self._nb_game_done
+        nb_game_total += self._nb_game_done
+        nb_game_to_start = min(self._nb_game, nb_game_total - self._nb_game_started)
+        self._start_games(np.flatnonzero(~self._active)[:nb_game_to_start])
+        self._nb_game_started += nb_game_to_start
+
+        if progress_reporter is not None:
+            progress_reporter.start(lambda: (self._nb_game_done - nb_game_run_start, None))
+        try:
+            while self._nb_game_done < nb_game_total:
+                self._play_roll(nb_game_total)
+        finally:
+            if progress_reporter is not None:
+                progress_reporter.stop()
+
+        return self
+
+
+def _batch_engine_work_unit(choice_critter_value_list, nb_game_total, nb_game, nb_dices, target_score, seed,
+                            work_unit_index):
+    # Executor work unit : a batch engine seeded with the work unit entropy (NumPy SeedSequence of seed and index)
+    batch_engine = DiceGameBatchEngine(choice_critter_value_list, min(nb_game, max(nb_game_total, 1)), nb_dices,
+                                       target_score, None if seed is None else [seed, work_unit_index])
+    return batch_engine.run(nb_game_total)
+
+
+# ----------------------< Class defining an antithetic random generator >-----------------------------------------------
+# Same stream as random.Random(seed) but randint(a, b) returns a + b - value, so each dice value v becomes
+# NB_DICE_SIDE + 1 - v and each 50/50 random choice is inverted.
+# ----------------------------------------------------------------------------------------------------------------------
+class AntitheticRandom(random.Random):
+    def randint(self, a, b):
+        return a + b - super().randint(a, b)
+
+
+# ----------------------< Class handling common random numbers strategy comparison >------------------------------------
+# constructor parameters :
+#   players_names_list                          List of players name
+#   challenger_name                             Name of the player whose strategy is compared
+#   choice_critter_value_a                      First challenger strategy (see DiceGameController)
+#   choice_critter_value_b                      Second challenger strategy (see DiceGameController)
+#   opponent_choice_critter_value               Strategy of all the other players (default->0)
+#   nb_dices                                    Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   target_score                                Target score to win (default->DEFAULT_TARGET_SCORE)
+#   antithetic                                  Also replay each game with antithetic dices if True (default->False)
+#   seed                                        Seed of the games seeds (default->None)
+#
+# Both strategies replay exactly the same games : same players order, same dices stream for each player (so the
+# opponents dices do not depend on the challenger choices) and same random choices.
+#
+# getters :
+#
+#   nb_game()                                   Number of paired games
+#   win_rate_a()                                Challenger win rate with strategy a
+#   win_rate_b()                                Challenger win rate with strategy b
+#   mean_difference()                           Mean paired win difference a - b
+#   standard_error()                            Standard error of the mean paired difference
+#   variance_reduction()                        Variance of independent games / variance of the paired games
+#
+# public methods :
+#
+#   launch_comparison(nb_game)                  Play nb_game more paired games
+#   confidence_interval(z=1.96)                 (low, high) confidence interval of the mean paired difference
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameStrategyComparison:
+    def __init__(self, players_names_list, challenger_name, choice_critter_value_a, choice_critter_value_b,
+                 opponent_choice_critter_value=0, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE,
+                 antithetic=False, seed=None):
+        self._players_names_list = list(players_names_list)
+        self._challenger_name = challenger_name
+        self._choice_critter_value_a = choice_critter_value_a
+        self._choice_critter_value_b = choice_critter_value_b
+        self._opponent_choice_critter_value = opponent_choice_critter_value
+        self._nb_dices = nb_dices
+        self._target_score = target_score
+        self._antithetic = antithetic
+        self._seed_rng = random.Random(seed)
+
+        self._nb_game = 0
+        self._sigma_win_a = 0
+        self._sigma_win_b = 0
+        self._sigma_win_square_a = 0
+        self._sigma_win_square_b = 0
+        self._sigma_difference = 0
+        self._sigma_difference_square = 0
+
+    def __str__(self):
+        low, high = self.confidence_interval()
+        output_str = str(self._nb_game) + ' paired games'
+        output_str += ', win rate a : ' + '{:.4f}'.format(self.win_rate_a)
+        output_str += ', win rate b : ' + '{:.4f}'.format(self.win_rate_b)
+        output_str += '\ndifference : ' + '{:.4f}'.format(self.mean_difference)
+        output_str += ' [' + '{:.4f}'.format(low) + ', ' + '{:.4f}'.format(high) + ']'
+        output_str += ', variance reduction : ' + '{:.1f}'.format(self.variance_reduction)
+        return output_str
+
+    @property
+    def nb_game(self):
+        return self._nb_game
+
+    @property
+    def win_rate_a(self):
+        return self._sigma_win_a / self._nb_game if self._nb_game > 0 else 0
+
+    @property
+    def win_rate_b(self):
+        return self._sigma_win_b / self._nb_game if self._nb_game > 0 else 0
+
+    @property
+    def mean_difference(self):
+        return self._sigma_difference / self._nb_game if self._nb_game > 0 else 0
+
+    @staticmethod
+    def _variance(sigma, sigma_square, nb_value):
+        if nb_value < 2:
+            return 0
+        return (sigma_square - sigma * sigma / nb_value) / (nb_value - 1)
+
+    @property
+    def standard_error(self):
+        if self._nb_game == 0:
+            return 0
+        return math.sqrt(self._variance(self._sigma_difference, self._sigma_difference_square, self._nb_game) /
+                         self._nb_game)
+
+    @property
+    def variance_reduction(self):
+        paired_variance = self._variance(self._sigma_difference, self._sigma_difference_square, self._nb_game)
+        independent_variance = self._variance(self._sigma_win_a, self._sigma_win_square_a, self._nb_game) + \
+            self._variance(self._sigma_win_b, self._sigma_win_square_b, self._nb_game)
+        if paired_variance == 0:
+            return math.inf if independent_variance > 0 else 1
+        return independent_variance / paired_variance
+
+    def confidence_interval(self, z=1.96):
+        return self.mean_difference - z * self.standard_error, self.mean_difference + z * self.standard_error
+
+    def _play_game(self, game_seed, choice_critter_value, random_class):
+        # Every stream is derived from the game seed, so the same game can be replayed for each strategy
+        players_dice_rng = {player_name: random_class(str(game_seed) + '/' + player_name)
+                            for player_name in self._players_names_list}
+        choice_critter_value_by_player = {player_name: self._opponent_choice_critter_value
+                                          for player_name in self._players_names_list}
+        choice_critter_value_by_player[self._challenger_name] = choice_critter_value
+
+        dice_controller = DiceGameController(list(self._players_names_list), self._nb_dices, self._target_score,
+                                             verbose=False, interactive=False,
+                                             choice_critter_value=choice_critter_value_by_player,
+                                             rng=random_class(game_seed), players_dice_rng=players_dice_rng)
+        dice_controller.run_full_game()
+
+        return 1 if dice_controller.get_model.players.leader_status == self._challenger_name else 0
+
+    def launch_comparison(self, nb_game):
+        random_class_list = [random.Random, AntitheticRandom] if self._antithetic else [random.Random]
+
+        for _ in range(nb_game):
+            game_seed = self._seed_rng.getrandbits(64)
+
+            # With antithetic games, each strategy result is the mean of the game and of its antithetic game
+            win_a = sum(self._play_game(game_seed, self._choice_critter_value_a, random_class)
+                        for random_class in random_class_list) / len(random_class_list)
+            win_b = sum(self._play_game(game_seed, self._choice_critter_value_b, random_class)
+                        for random_class in random_class_list) / len(random_class_list)
+
+            self._nb_game += 1
+            self._sigma_win_a += win_a
+            self._sigma_win_b += win_b
+            self._sigma_win_square_a += win_a * win_a
+            self._sigma_win_square_b += win_b * win_b
+            self._sigma_difference += win_a - win_b
+            self._sigma_difference_square += (win_a - win_b) ** 2
+
+
+def _play_league_games(strategy_name_a, strategy_a, strategy_name_b, strategy_b, nb_dices, target_score, nb_game,
+                       seed):
+    # League task : play nb_game head to head games, the players order is shuffled at each game
+    dice_controller = DiceGameController([strategy_name_a, strategy_name_b], nb_dices, target_score, verbose=False,
+                                         interactive=False,
+                                         choice_critter_value={strategy_name_a: strategy_a,
+                                                               strategy_name_b: strategy_b},
+                                         rng=random.Random(seed))
+    nb_win_a = 0
+    for _ in range(nb_game):
+        dice_controller.run_full_game()
+        if dice_controller.get_model.players.leader_status == strategy_name_a:
+            nb_win_a += 1
+
+    return nb_win_a
+
+
+# ----------------------< Class handling strategy league with sequential testing >--------------------------------------
+# constructor parameters :
+#   strategy_dict                               {strategy name: choice_critter_value} (see DiceGameController), the
+#                                                   callable strategies must be picklable
+#   nb_dices                                    Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   target_score                                Target score to win (default->DEFAULT_TARGET_SCORE)
+#   batch_nb_game                               Number of games by task (default->LEAGUE_BATCH_NB_GAME)
+#   max_game_by_matchup                         Games before declaring a matchup undecided
+#                                                   (default->LEAGUE_MAX_GAME_BY_MATCHUP)
+#   sprt_margin                                 SPRT hypotheses : win rate 0.5 - margin against 0.5 + margin
+#                                                   (default->0.02)
+#   alpha, beta                                 SPRT error rates (default->0.05)
+#   nb_worker                                   Number of worker processes (default->os.cpu_count())
+#   seed                                        Seed of the tasks seeds (default->None)
+#   executor                                    DiceGameExecutor running the batches (default->process backend with
+#                                                   nb_worker workers)
+#
+# Each matchup plays batches of games until its SPRT log likelihood ratio leaves the decision interval, so the
+# workers only keep playing the close matchups. The seed of a batch only depends on its matchup and its rank in the
+# matchup, so the league results do not depend on the backend nor on the batches completion order.
+#
+# getters :
+#
+#   matchup_list()                              List of {'strategy_a': , 'strategy_b': , 'nb_game': , 'nb_win_a': ,
+#                                                   'llr': , 'winner': } (winner is None while undecided)
+#
+# public methods :
+#
+#   launch_league()                             Play all the matchups
+#   ratings()                                   Bradley-Terry ratings on the Elo scale, best first
+#                                                   --> [(strategy name, elo), ...]
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameLeague:
+    def __init__(self, strategy_dict, nb_dices=DEFAULT_DICES_NB, target_score=DEFAULT_TARGET_SCORE,
+                 batch_nb_game=LEAGUE_BATCH_NB_GAME, max_game_by_matchup=LEAGUE_MAX_GAME_BY_MATCHUP,
+                 sprt_margin=0.02, alpha=0.05, beta=0.05, nb_worker=None, seed=None, executor=None):
+        self._strategy_dict = dict(strategy_dict)
+        self._nb_dices = nb_dices
+        self._target_score = target_score
+        self._batch_nb_game = batch_nb_game
+        self._max_game_by_matchup = max_game_by_matchup
+        self._nb_worker = nb_worker if nb_worker is not None else os.cpu_count()
+        self._seed = seed
+        self._executor = executor
+
+        # SPRT log likelihood ratio increments and decision bounds
+        self._llr_win = math.log((0.5 + sprt_margin) / (0.5 - sprt_margin))
+        self._llr_loss = math.log((0.5 - sprt_margin) / (0.5 + sprt_margin))
+        self._llr_lower_bound = math.log(beta / (1 - alpha))
+        self._llr_upper_bound = math.log((1 - beta) / alpha)
+
+        strategy_name_list = list(self._strategy_dict)
+        self._matchup_list = [{'strategy_a': strategy_name_a, 'strategy_b': strategy_name_b,
+                               'nb_game': 0, 'nb_win_a': 0, 'llr': 0.0, 'winner': None}
+                              for index_a, strategy_name_a in enumerate(strategy_name_list)
+                              for strategy_name_b in strategy_name_list[index_a + 1:]]
+
+    def __str__(self):
+        output_str = ''
+        for rank, (strategy_name, elo) in enumerate(self.ratings()):
+            output_str += '#' + str(rank + 1) + ' ' + str(strategy_name) + ' : ' + '{:.0f}'.format(elo) + '\n'
+        return output_str
+
+    @property
+    def matchup_list(self):
+        return self._matchup_list
+
+    def _matchup_is_running(self, matchup):
+        return matchup['winner'] is None and matchup['nb_game'] < self._max_game_by_matchup
+
+    def _update_matchup(self, matchup, nb_game, nb_win_a):
+        matchup['nb_game'] += nb_game
+        matchup['nb_win_a'] += nb_win_a
+        matchup['llr'] += nb_win_a * self._llr_win + (nb_game - nb_win_a) * self._llr_loss
+
+        if matchup['llr'] >= self._llr_upper_bound:
+            matchup['winner'] = matchup['strategy_a']
+        elif matchup['llr'] <= self._llr_lower_bound:
+            matchup['winner'] = matchup['strategy_b']
+
+    def launch_league(self):
+        def submit_batch(executor, matchup):
+            # Batch seed from the matchup index and the batch rank in the matchup
+            batch_seed = DiceGameExecutor.work_unit_rng(self._seed, str(self._matchup_list.index(matchup)) + '/' +
+                                                        str(matchup['nb_game'] // self._batch_nb_game))
+            return executor.submit(_play_league_games,
+                                   matchup['strategy_a'], self._strategy_dict[matchup['strategy_a']],
+                                   matchup['strategy_b'], self._strategy_dict[matchup['strategy_b']],
+                                   self._nb_dices, self._target_score, self._batch_nb_game,
+                                   batch_seed.getrandbits(64))
+
+        # ----<Keep one batch by running matchup in the pool, a decided matchup stops asking for batches>--------------
+        executor = self._executor if self._executor is not None else DiceGameExecutor('process', self._nb_worker)
+        try:
+            pending_matchup_dict = {submit_batch(executor, matchup): matchup
+                                    for matchup in self._matchup_list if self._matchup_is_running(matchup)}
+
+            while pending_matchup_dict:
+                done_future_set, _ = concurrent.futures.wait(pending_matchup_dict,
+                                                             return_when=concurrent.futures.FIRST_COMPLETED)
+                for done_future in done_future_set:
+                    matchup = pending_matchup_dict.pop(done_future)
+                    self._update_matchup(matchup, self._batch_nb_game, done_future.result())
+
+                    if self._matchup_is_running(matchup):
+                        pending_matchup_dict[submit_batch(executor, matchup)] = matchup
+        finally:
+            if self._executor is None:
+                executor.shutdown()
+
+    def ratings(self, nb_iteration=1000, tolerance=1e-9):
+        strategy_name_list = list(self._strategy_dict)
+        strategy_index = {strategy_name: index for index, strategy_name in enumerate(strategy_name_list)}
+        nb_strategy = len(strategy_name_list)
+
+        # Win matrix with half a win of prior on each side of every played matchup, so no strength goes to 0
+        nb_win_matrix = [[0.0] * nb_strategy for _ in range(nb_strategy)]
+        for matchup in self._matchup_list:
+            if matchup['nb_game'] > 0:
+                index_a = strategy_index[matchup['strategy_a']]
+                index_b = strategy_index[matchup['strategy_b']]
+                nb_win_matrix[index_a][index_b] += matchup['nb_win_a'] + 0.5
+                nb_win_matrix[index_b][index_a] += matchup['nb_game'] - matchup['nb_win_a'] + 0.5
+
+        # Bradley-Terry strengths by minorization-maximization iterations
+        strength_list = [1.0] * nb_strategy
+        for _ in range(nb_iteration):
+            next_strength_list = []
+            for index_i in range(nb_strategy):
+                nb_win = sum(nb_win_matrix[index_i])
+                denominator = sum((nb_win_matrix[index_i][index_j] + nb_win_matrix[index_j][index_i]) /
+                                  (strength_list[index_i] + strength_list[index_j])
+                                  for index_j in range(nb_strategy) if index_j != index_i)
+                next_strength_list.append(nb_win / denominator if denominator > 0 else strength_list[index_i])
+
+            geometric_mean = math.exp(sum(math.log(strength) for strength in next_strength_list) / nb_strategy)
+            next_strength_list = [strength / geometric_mean for strength in next_strength_list]
+
+            converged = max(abs(next_strength - strength)
+                            for next_strength, strength in zip(next_strength_list, strength_list)) < tolerance
+            strength_list = next_strength_list
+            if converged:
+                break
+
+        elo_list = [400 * math.log10(strength) for strength in strength_list]
+        return sorted(zip(strategy_name_list, elo_list), key=lambda rating: rating[1], reverse=True)
+
+
+# ----------------------< Class scripting the dices of engines with different random APIs >-----------------------------
+# constructor parameters :
+#   seed                                        Seed of the dices and choices streams (default->None)
+#   dice_list                                   Explicit dice side indexes (0 for 1 ...) to play instead of the seeded
+#                                                   stream (default->None)
+#   nb_side                                     Number of sides of the dices (default->NB_DICE_SIDE)
+#
+# getters :
+#
+#   nb_dice_drawn()                             Number of values drawn so far from the dices stream : one by dice,
+#                                                   one by binomial draw of a large pool roll
+#   nb_dices_to_roll_function()                 Callable --> array of the number of dices each game rolls, needed by
+#                                                   integers() (also a setter)
+#
+# public methods :
+#
+#   randint(a, b)                               random.Random API : next dice of the stream for (0, nb_side - 1),
+#                                                   next value of the choices stream otherwise
+#   shuffle(x)                                  Keeps the order : the seats are fixed, as in DiceGameBatchEngine
+#   integers(low, high, size)                   NumPy Generator API : a (games x dices) array whose dices to roll are
+#                                                   the next dices of the stream, the others 0
+#   random(size=None)                           random.Random API without size : next uniform value of the dices
+#                                                   stream (the large pool rolls of DiceGameTurn), NumPy Generator API
+#                                                   with size : array of the next values of the choices stream
+#   multinomial(n, pvals)                       NumPy Generator API for uniform pvals : occurrences of each n dices,
+#                                                   the same sequential binomial draws of the dices stream as
+#                                                   DiceGameTurn.sample_occurrence_list()
+#
+# Engines fed with the same scripted stream roll the same dices in the same order, whatever random API they use.
+# The uniform values of the large pools always come from the seeded dices stream, even with a dice_list.
+# ----------------------------------------------------------------------------------------------------------------------
+class ScriptedDiceRandom:
+    def __init__(self, seed=None, dice_list=None, nb_side=NB_DICE_SIDE):
+        self._nb_side = nb_side
+        self._dice_rng = random.Random(seed)
+        self._choice_rng = random.Random(None if seed is None else str(seed) + '/choice')
+        self._dice_iterator = iter(dice_list) if dice_list is not None else None
+        self._nb_dice_drawn = 0
+        self._nb_dices_to_roll_function = None
+
+    @property
+    def nb_dice_drawn(self):
+        return self._nb_dice_drawn
+
+    @property
+    def nb_dices_to_roll_function(self):
+        return self._nb_dices_to_roll_function
+
+    @nb_dices_to_roll_function.setter
+    def nb_dices_to_roll_function(self, nb_dices_to_roll_function):
+        self._nb_dices_to_roll_function = nb_dices_to_roll_function
+
+    def randint(self, a, b):
+        if (a, b) != (0, self._nb_side - 1):
+            return self._choice_rng.randint(a, b)
+
+        self._nb_dice_drawn += 1
+        if self._dice_iterator is not None:
+            return next(self._dice_iterator)
+        return self._dice_rng.randrange(self._nb_side)
+
+    def shuffle(self, x):
+        pass
+
+    def integers(self, low, high, size):
+        nb_game, nb_dices = size
+        nb_dices_to_roll = self._nb_dices_to_roll_function()
+
+        dice_array = np.zeros(size, dtype=np.int64)
+        for game_index in range(nb_game):
+            for dice_index in range(min(int(nb_dices_to_roll[game_index]), nb_dices)):
+                dice_array[game_index, dice_index] = self.randint(low, high - 1)
+        return dice_array
+
+    def random(self, size=None):
+        if size is None:
+            self._nb_dice_drawn += 1
+            return self._dice_rng.random()
+        return np.array([self._choice_rng.random() for _ in range(size)])
+
+    def multinomial(self, n, pvals):
+        nb_side = len(pvals)
+        occurrence_array = np.zeros((len(n), nb_side), dtype=np.int64)
+        for row_index, nb_dices in enumerate(n.tolist()):
+            nb_remaining_dices = nb_dices
+            for side_index in range(nb_side - 1):
+                occurrence_array[row_index, side_index] = DiceGameTurn._binomial_variate(
+                    nb_remaining_dices, 1 / (nb_side - side_index), self.random)
+                nb_remaining_dices -= occurrence_array[row_index, side_index]
+            occurrence_array[row_index, -1] = nb_remaining_dices
+        return occurrence_array
+
+
+# ----------------------< Class checking alternative engines against the reference rules >------------------------------
+# constructor parameters :
+#   dice_game_turn_class                        Reference rules class (default->DiceGameTurn)
+#   alpha                                       Significance level of the statistical tests (default->HARNESS_ALPHA)
+#
+# getters :
+#
+#   dice_game_turn_class()                      Reference rules class
+#   alpha()                                     Significance level of the statistical tests
+#
+# public methods :
+#
+#   differential_turns(turn_engine_factory,     Play the same scripted dices on the reference dice turn and on
+#       nb_turn, nb_dices, seed)                    turn_engine_factory(nb_dices, rng) (DiceGameTurn interface), each
+#                                                   turn rolled until lost or a scripted number of rolls, and compare
+#                                                   export_state() and nb_dices_to_roll after every roll
+#                                                   --> [first mismatch], empty if equivalent
+#   differential_games(choice_critter_value_    Play the same scripted dices on DiceGameController games and on one
+#       list, nb_game, nb_dices, target_score,      game DiceGameBatchEngine runs (strategies by seat, no random
+#       seed, batch_engine_class)                   choice strategy) and compare the seats totals, the winner, the
+#                                                   number of turns and the number of dices drawn
+#                                                   --> [first mismatch], empty if equivalent
+#   exhaustive_occurrences(max_nb_dices,        Score every occurrence vector of 1 to max_nb_dices dices with
+#       score_function_dict, rules_class_list)      count_occurrence_score(), check its invariants and compare the
+#                                                   packed roll table of a dice turn, the vectorized scoring of the
+#                                                   batch engine and each score_function_dict {name: function
+#                                                   (occurrence list) --> (roll_score, nb_bonus,
+#                                                   nb_non_scoring_dices)}, for each rules class
+#                                                   --> list of mismatches, empty if equivalent
+#   roll_goodness_of_fit(roll_sampler,          Chi-square test of roll_sampler(nb_dices, nb_roll) --> {(roll_score,
+#       nb_dices, nb_roll)                          nb_non_scoring_dices): count} against the exact roll outcome
+#                                                   distribution --> {'statistic': , 'dof': , 'p_value': ,
+#                                                   'passed': }
+#   histogram_homogeneity(histogram_a,          Two sample chi-square test of {value: count} histograms or
+#       histogram_b)                                distributions produced by engines of different random consumption
+#                                                   --> {'statistic': , 'dof': , 'p_value': , 'passed': }
+#
+# static methods :
+#
+#   turn_roll_sampler(seed)                     Roll sampler of DiceGameTurn with random.Random(seed)
+#   batch_roll_sampler(seed)                    Roll sampler of the batch engine scoring with a NumPy generator
+#   chi_square_survival(statistic, dof)         P(chi-square of dof degrees >= statistic), without scipy
+#
+# The cells expecting less than HARNESS_MIN_EXPECTED counts are pooled before the chi-square tests. A test passes
+# when its p-value is at least alpha, so about alpha of the tests of equivalent engines fail by chance.
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameEngineHarness:
+    def __init__(self, dice_game_turn_class=DiceGameTurn, alpha=HARNESS_ALPHA):
+        self._dice_game_turn_class = dice_game_turn_class
+        self._alpha = alpha
+
+    @property
+    def dice_game_turn_class(self):
+        return self._dice_game_turn_class
+
+    @property
+    def alpha(self):
+        return self._alpha
+
+    def differential_turns(self, turn_engine_factory, nb_turn=1000, nb_dices=DEFAULT_DICES_NB, seed=None):
+        nb_side = self._dice_game_turn_class._nb_side
+        reference_turn = self._dice_game_turn_class(nb_dices, ScriptedDiceRandom(seed, nb_side=nb_side))
+        engine_turn = turn_engine_factory(nb_dices, ScriptedDiceRandom(seed, nb_side=nb_side))
+        nb_roll_rng = random.Random(None if seed is None else str(seed) + '/nb_roll')
+
+        for turn_index in range(nb_turn):
+            reference_turn.prepare_for_next_turn()
+            engine_turn.prepare_for_next_turn()
+
+            max_nb_roll = nb_roll_rng.randint(1, 2 * nb_dices)
+            for roll_index in range(max_nb_roll):
+                reference_turn.roll_dices_and_count_roll_score()
+                engine_turn.roll_dices_and_count_roll_score()
+
+                reference_state = (reference_turn.export_state(), reference_turn.nb_dices_to_roll)
+                engine_state = (engine_turn.export_state(), engine_turn.nb_dices_to_roll)
+                if engine_state != reference_state:
+                    # The streams are no longer aligned, the next rolls would all differ
+                    return [{'check': 'turn', 'turn_index': turn_index, 'roll_index': roll_index,
+                             'expected': reference_state, 'found': engine_state}]
+
+                if reference_turn.its_lost_roll:
+                    break
+
+        return []
+
+    def differential_games(self, choice_critter_value_list, nb_game=100, nb_dices=DEFAULT_DICES_NB,
+                           target_score=DEFAULT_TARGET_SCORE, seed=None, batch_engine_class=DiceGameBatchEngine):
+        if 0 in choice_critter_value_list:
+            raise ValueError('random choice strategies consume the random generators differently')
+
+        players_names_list = ['seat #' + str(seat_index) for seat_index in range(len(choice_critter_value_list))]
+        nb_side = batch_engine_class._dice_game_turn_class._nb_side
+        reference_rng = ScriptedDiceRandom(seed, nb_side=nb_side)
+        engine_rng = ScriptedDiceRandom(seed, nb_side=nb_side)
+        dice_controller = DiceGameController(players_names_list, nb_dices, target_score, verbose=False,
+                                             interactive=False,
+                                             choice_critter_value=dict(zip(players_names_list,
+                                                                           choice_critter_value_list)),
+                                             rng=reference_rng)
+        model = dice_controller.get_model
+        players = model.players
+
+        for game_index in range(nb_game):
+            dice_controller.run_full_game()
+
+            batch_engine = batch_engine_class(choice_critter_value_list, 1, nb_dices, target_score)
+            batch_engine._rng = engine_rng
+            # The large pool rolls are drawn by multinomial(), not by integers()
+            engine_rng.nb_dices_to_roll_function = lambda: np.where(
+                batch_engine._nb_dices_to_roll > LARGE_POOL_NB_DICES, 0, batch_engine._nb_dices_to_roll)
+            batch_engine.run(1)
+
+            reference_result = {'winner': players.index_of_player_with_best_score,
+                                'nb_turn': model.turn_index,
+                                'nb_dice_drawn': reference_rng.nb_dice_drawn,
+                                'seats': [{total_name: players.player_status(seat_index)[total_name]
+                                           for total_name in batch_engine_class._player_total_names}
+                                          for seat_index in range(len(players))]}
+            engine_result = {'winner': batch_engine.nb_win.index(1),
+                             'nb_turn': batch_engine.mean_game_nb_turn,
+                             'nb_dice_drawn': engine_rng.nb_dice_drawn,
+                             'seats': [{total_name: batch_engine.player_status(seat_index)[total_name]
+                                        for total_name in batch_engine_class._player_total_names}
+                                       for seat_index in range(len(players))]}
+            if engine_result != reference_result:
+                # The streams are no longer aligned, the next games would all differ
+                return [{'check': 'game', 'game_index': game_index, 'expected': reference_result,
+                         'found': engine_result}]
+
+        return []
+
+    def exhaustive_occurrences(self, max_nb_dices=DEFAULT_DICES_NB, score_function_dict=None, rules_class_list=None):
+        def check(rules_class, check_name, occurrence_list, expected, found):
+            if found != expected:
+                mismatch_list.append({'check': check_name, 'rules': rules_class.__name__,
+                                      'occurrences': occurrence_list, 'expected': expected, 'found': found})
+
+        if rules_class_list is None:
+            rules_class_list = [self._dice_game_turn_class]
+        if score_function_dict is None:
+            score_function_dict = dict()
+
+        mismatch_list = []
+        for rules_class in rules_class_list:
+            nb_side = rules_class._nb_side
+            score_granularity = rules_class.roll_score_granularity()
+            batch_engine_class = type(rules_class.__name__ + 'BatchEngine', (DiceGameBatchEngine,),
+                                      {'_dice_game_turn_class': rules_class})
+
+            for nb_dices in range(1, max_nb_dices + 1):
+                # ----<Every occurrence vector of nb_dices, from the multisets of dice sides>---------------------------
+                occurrence_list_list = []
+                dice_list_list = []
+                for dice_list in itertools.combinations_with_replacement(range(nb_side), nb_dices):
+                    occurrence_list = [0] * nb_side
+                    for side_index in dice_list:
+                        occurrence_list[side_index] += 1
+                    occurrence_list_list.append(occurrence_list)
+                    dice_list_list.append(dice_list)
+
+                batch_score = batch_engine_class.score_occurrence_array(np.array(occurrence_list_list, dtype=np.int64))
+
+                for vector_index, occurrence_list in enumerate(occurrence_list_list):
+                    roll_score, nb_bonus, scoring_occurrence_list, non_scoring_occurrence_list = \
+                        rules_class.count_occurrence_score(occurrence_list)
+                    expected = (roll_score, nb_bonus, sum(non_scoring_occurrence_list))
+
+                    # ----<Invariants of the reference rules>-----------------------------------------------------------
+                    check(rules_class, 'dices conservation', occurrence_list, occurrence_list,
+                          [scoring + non_scoring for scoring, non_scoring
+                           in zip(scoring_occurrence_list, non_scoring_occurrence_list)])
+                    check(rules_class, 'lost roll', occurrence_list, roll_score == 0, sum(scoring_occurrence_list) == 0)
+                    check(rules_class, 'score granularity', occurrence_list, 0, roll_score % score_granularity)
+
+                    # ----<Packed roll table of a dice turn fed with these dices>---------------------------------------
+                    dice_turn = rules_class(nb_dices, ScriptedDiceRandom(dice_list=dice_list_list[vector_index],
+                                                                         nb_side=nb_side))
+                    dice_turn.roll_dices_and_count_roll_score()
+                    check(rules_class, 'dice turn', occurrence_list,
+                          (roll_score, nb_bonus, sum(non_scoring_occurrence_list),
+                           [(occurrence, side_index + 1) for side_index, occurrence
+                            in enumerate(scoring_occurrence_list) if occurrence > 0]),
+                          (dice_turn.roll_score, dice_turn.turn_statistics.turn_nb_bonus,
+                           dice_turn.nb_non_scoring_dices, dice_turn.scoring_dices_list))
+
+                    check(rules_class, 'batch engine', occurrence_list, expected,
+                          tuple(int(score_array[vector_index]) for score_array in batch_score))
+
+                    for score_function_name, score_function in score_function_dict.items():
+                        check(rules_class, score_function_name, occurrence_list, expected,
+                              tuple(score_function(occurrence_list)))
+
+                probability_sum = sum(rules_class.roll_outcome_distribution(nb_dices).values())
+                if abs(probability_sum - 1) > 1e-9:
+                    mismatch_list.append({'check': 'outcome probabilities', 'rules': rules_class.__name__,
+                                          'nb_dices': nb_dices, 'expected': 1, 'found': probability_sum})
+
+        return mismatch_list
+
+    def _chi_square_result(self, statistic, dof):
+        p_value = self.chi_square_survival(statistic, dof)
+        return {'statistic': statistic, 'dof': dof, 'p_value': p_value, 'passed': p_value >= self._alpha}
+
+    def roll_goodness_of_fit(self, roll_sampler, nb_dices=DEFAULT_DICES_NB, nb_roll=100000):
+        observed_dict = roll_sampler(nb_dices, nb_roll)
+        probability_dict = self._dice_game_turn_class.roll_outcome_distribution(nb_dices)
+        if any(outcome_key not in probability_dict for outcome_key in observed_dict):
+            # An impossible outcome was sampled
+            return {'statistic': math.inf, 'dof': len(probability_dict) - 1, 'p_value': 0, 'passed': False}
+
+        # ----<Pool the least expected outcomes until every cell expects enough counts>---------------------------------
+        cell_list = sorted(((nb_roll * probability, observed_dict.get(outcome_key, 0))
+                            for outcome_key, probability in probability_dict.items()), reverse=True)
+        while len(cell_list) > 1 and cell_list[-1][0] < HARNESS_MIN_EXPECTED:
+            expected, observed = cell_list.pop()
+            cell_list[-1] = (cell_list[-1][0] + expected, cell_list[-1][1] + observed)
+            cell_list.sort(reverse=True)
+
+        statistic = sum((observed - expected) ** 2 / expected for expected, observed in cell_list)
+        return self._chi_square_result(statistic, len(cell_list) - 1)
+
+    def histogram_homogeneity(self, histogram_a, histogram_b):
+        if isinstance(histogram_a, OccurrenceDistribution):
+            histogram_a = histogram_a.occurrence_distribution
+        if isinstance(histogram_b, OccurrenceDistribution):
+            histogram_b = histogram_b.occurrence_distribution
+
+        count_a = sum(histogram_a.values())
+        count_b = sum(histogram_b.values())
+        share_a = count_a / (count_a + count_b)
+
+        # ----<Pool the least populated values until every cell expects enough counts in both samples>------------------
+        cell_list = sorted(((histogram_a.get(value, 0) + histogram_b.get(value, 0), histogram_a.get(value, 0))
+                            for value in set(histogram_a) | set(histogram_b)), reverse=True)
+        min_share = min(share_a, 1 - share_a)
+        while len(cell_list) > 1 and cell_list[-1][0] * min_share < HARNESS_MIN_EXPECTED:
+            total, observed_a = cell_list.pop()
+            cell_list[-1] = (cell_list[-1][0] + total, cell_list[-1][1] + observed_a)
+            cell_list.sort(reverse=True)
+
+        statistic = 0
+        for total, observed_a in cell_list:
+            expected_a = total * share_a
+            expected_b = total - expected_a
+            statistic += (observed_a - expected_a) ** 2 / expected_a + \
+                (total - observed_a - expected_b) ** 2 / expected_b
+        return self._chi_square_result(statistic, len(cell_list) - 1)
+
+    @staticmethod
+    def turn_roll_sampler(seed=None):
+        def roll_sampler(nb_dices, nb_roll):
+            dice_turn = DiceGameTurn(nb_dices, random.Random(seed))
+            observed_dict = dict()
+            for _ in range(nb_roll):
+                dice_turn.prepare_for_next_turn()
+                dice_turn.roll_dices_and_count_roll_score()
+                outcome_key = (dice_turn.roll_score, dice_turn.nb_non_scoring_dices)
+                observed_dict[outcome_key] = observed_dict.get(outcome_key, 0) + 1
+            return observed_dict
+
+        return roll_sampler
+
+    @staticmethod
+    def batch_roll_sampler(seed=None):
+        def roll_sampler(nb_dices, nb_roll):
+            nb_side = DiceGameBatchEngine._dice_game_turn_class._nb_side
+            dice_array = np.random.default_rng(seed).integers(0, nb_side, size=(nb_roll, nb_dices))
+            occurrence_array = np.stack([(dice_array == side_index).sum(axis=1) for side_index in range(nb_side)],
+                                        axis=1)
+            roll_score, _, nb_non_scoring_dices = DiceGameBatchEngine.score_occurrence_array(occurrence_array)
+            outcome_array, count_array = np.unique(np.stack([roll_score, nb_non_scoring_dices], axis=1), axis=0,
+                                                   return_counts=True)
+            return {(int(outcome[0]), int(outcome[1])): int(count) for outcome, count in zip(outcome_array, count_array)}
+
+        return roll_sampler
+
+    @staticmethod
+    def chi_square_survival(statistic, dof):
+        # Regularized upper incomplete gamma Q(dof / 2, statistic / 2) : series below a + 1, continued fraction above
+        a = dof / 2
+        x = statistic / 2
+        if dof <= 0 or x <= 0:
+            return 1.0
+        if math.isinf(x):
+            return 0.0
+
+        log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+        if x < a + 1:
+            term = 1 / a
+            total = term
+            n = a
+            while abs(term) > abs(total) * 1e-15:
+                n += 1
+                term *= x / n
+                total += term
+            return max(0.0, 1 - total * math.exp(log_prefactor))
+
+        # Modified Lentz continued fraction
+        tiny = 1e-300
+        b = x + 1 - a
+        c = 1 / tiny
+        d = 1 / b
+        h = d
+        for i in range(1, 10000):
+            an = -i * (i - a)
+            b += 2
+            d = an * d + b
+            d = d if abs(d) > tiny else tiny
+            c = b + an / c
+            c = c if abs(c) > tiny else tiny
+            d = 1 / d
+            delta = d * c
+            h *= delta
+            if abs(delta - 1) < 1e-15:
+                break
+        return math.exp(log_prefactor) * h
+
+
+# ----------------------< Class handling the results archive >----------------------------------------------------------
+# constructor parameters :
+#   path                                        Path of the archive without extension : path.dat holds the runs
+#                                                   data, path.idx the fixed size index records
+#
+# getters :
+#
+#   index()                                     Memory mapped index, a ARCHIVE_INDEX_DTYPE array (one record by run)
+#
+# public methods :
+#
+#   store(nb_dice, nb_turn, interval, seed,     Append a run --> run index
+#       engine, distributions, summary)             distributions : {name: OccurrenceDistribution}
+#                                                   summary : {name: number} summary statistics
+#   store_distribution_analyse                  Append a DiceGameDistributionAnalyse run --> run index
+#       (analyse, seed=None, engine='distribution')
+#   store_batch_engine(batch_engine)            Append a DiceGameBatchEngine run --> run index, keyed with the
+#                                                   number of games as nb_turn, interval 0 and engine 'batch'
+#                                                   (a batch run has no distribution)
+#   query(ruleset, nb_dice, nb_turn, interval,  Index of the runs matching all the given keys (None matches all)
+#       seed, engine)                               --> numpy array of run index
+#   load(run_index)                             Stored run --> { 'key': {key name: value}, 'summary': {name: value},
+#                                                   'distributions': {name: OccurrenceDistribution} }
+#   load_histograms(run_index)                  Stored run without building the distributions, 'distributions' is
+#                                                   {name: (interval, bucket_array, occurrence_array)} of read only
+#                                                   arrays mapped on the archive
+#
+# class methods :
+#
+#   ruleset_hash(dice_game_turn_class)          Stable 64 bits hash of the game rules (default->DiceGameTurn)
+#   archive_seed(seed)                          Seed key of the index : the seed itself when it fits in 64 bits
+#                                                   unsigned, else a stable 64 bits hash of it (ARCHIVE_NO_SEED
+#                                                   for None)
+#
+# Runs are keyed by (ruleset, nb_dice, nb_turn, interval, seed, engine), a run without seed is stored with
+# ARCHIVE_NO_SEED. The index record is built before anything is written, so an invalid key leaves both files
+# untouched. The data of a run is appended before its index record, so the index never points past the data
+# and readers can map both files while a single writer appends.
+#
+# Run data layout (little endian) : header length ('<I'), json header, then the buckets and occurrences of each
+# distribution as int64 arrays, in the header order.
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameResultsArchive:
+    _file_header = struct.Struct('<4sI')
+    _data_header_length = struct.Struct('<I')
+
+    def __init__(self, path):
+        self._index_path = path + '.idx'
+        self._data_path = path + '.dat'
+
+        # ----<Create the files on first use, check the index header otherwise>----------------------------------------
+        if not os.path.exists(self._index_path):
+            with open(self._index_path, 'wb') as index_file:
+                index_file.write(self._file_header.pack(ARCHIVE_INDEX_MAGIC, ARCHIVE_VERSION))
+            open(self._data_path, 'ab').close()
+        else:
+            with open(self._index_path, 'rb') as index_file:
+                magic, version = self._file_header.unpack(index_file.read(self._file_header.size))
+            if magic != ARCHIVE_INDEX_MAGIC:
+                raise ValueError('not a results archive index : ' + self._index_path)
+            if version != ARCHIVE_VERSION:
+                raise ValueError('unsupported results archive version : ' + str(version))
+
+        self._index = None
+        self._index_size = -1
+        self._data = None
+        self._data_size = -1
+
+    def __len__(self):
+        return len(self.index)
+
+    def __str__(self):
+        output_str = str(len(self)) + ' runs archived in ' + self._data_path + '\n'
+        for index_record in self.index:
+            output_str += str(index_record['engine'].decode('ascii')) + ' : nb dice ' + str(index_record['nb_dice'])
+            output_str += ', nb turn ' + str(index_record['nb_turn']) + ', interval ' + str(index_record['interval'])
+            output_str += ', seed ' + str(index_record['seed'])
+            output_str += ', mean turn score ' + '{:.2f}'.format(index_record['mean_turn_score']) + '\n'
+        return output_str
+
+    @property
+    def index(self):
+        # The mapping is renewed only when the index file grew
+        index_size = os.path.getsize(self._index_path)
+        if index_size != self._index_size:
+            nb_record = (index_size - self._file_header.size) // ARCHIVE_INDEX_DTYPE.itemsize
+            if nb_record == 0:
+                self._index = np.zeros(0, dtype=ARCHIVE_INDEX_DTYPE)
+            else:
+                self._index = np.memmap(self._index_path, dtype=ARCHIVE_INDEX_DTYPE, mode='r',
+                                        offset=self._file_header.size, shape=(nb_record,))
+            self._index_size = index_size
+        return self._index
+
+    def _data_view(self):
+        data_size = os.path.getsize(self._data_path)
+        if data_size != self._data_size:
+            self._data = np.memmap(self._data_path, dtype=np.uint8, mode='r') if data_size > 0 else None
+            self._data_size = data_size
+        return self._data
+
+    @classmethod
+    def ruleset_hash(cls, dice_game_turn_class=DiceGameTurn):
+        ruleset_digest = hashlib.blake2b(repr(dice_game_turn_class.rules_key()).encode('utf-8'), digest_size=8)
+        return int.from_bytes(ruleset_digest.digest(), 'little')
+
+    @classmethod
+    def archive_seed(cls, seed):
+        if seed is None:
+            return ARCHIVE_NO_SEED
+        if isinstance(seed, (int, np.integer)) and 0 <= seed < ARCHIVE_NO_SEED:
+            return int(seed)
+        # Negative, too large or not integer seeds (python random accepts any hashable)
+        seed_digest = hashlib.blake2b(repr(seed).encode('utf-8'), digest_size=8)
+        return int.from_bytes(seed_digest.digest(), 'little')
+
+    def store(self, nb_dice, nb_turn, interval, seed, engine, distributions, summary,
+              dice_game_turn_class=DiceGameTurn):
+        # ----<Index record checked and filled first, offset and length once the data is written>-------------------
+        turn_score_distribution = distributions.get('turn_score')
+        index_record = np.zeros(1, dtype=ARCHIVE_INDEX_DTYPE)
+        index_record['ruleset'] = self.ruleset_hash(dice_game_turn_class)
+        index_record['nb_dice'] = nb_dice
+        index_record['nb_turn'] = nb_turn
+        index_record['interval'] = interval
+        index_record['seed'] = self.archive_seed(seed)
+        index_record['engine'] = engine.encode('ascii')
+        index_record['created'] = time.time()
+        index_record['mean_turn_score'] = summary.get('mean_turn_score', turn_score_distribution.get_mean()
+                                                      if turn_score_distribution is not None else 0.0)
+        index_record['max_turn_score'] = summary.get('max_turn_score', turn_score_distribution.get_max()
+                                                     if turn_score_distribution is not None else 0.0)
+
+        # ----<Run data : json header then the int64 arrays of the distributions>-------------------------------------
+        header = {'ruleset': dice_game_turn_class.rules_key(), 'summary': summary, 'distributions': []}
+        array_list = []
+        for distribution_name, distribution in distributions.items():
+            bucket_list = sorted(distribution.occurrence_distribution.items())
+            header['distributions'].append({'name': distribution_name, 'interval': distribution.interval,
+                                            'nb_buckets': len(bucket_list)})
+            array_list.append(np.array([bucket for bucket, _ in bucket_list], dtype='<i8'))
+            array_list.append(np.array([occurrence for _, occurrence in bucket_list], dtype='<i8'))
+
+        encoded_header = json.dumps(header).encode('utf-8')
+        run_data = b''.join([self._data_header_length.pack(len(encoded_header)), encoded_header] +
+                            [array.tobytes() for array in array_list])
+
+        # ----<Append the data, then the index record pointing to it>--------------------------------------------------
+        with open(self._data_path, 'ab') as data_file:
+            data_offset = data_file.tell()
+            data_file.write(run_data)
+            data_file.flush()
+            os.fsync(data_file.fileno())
+
+        index_record['offset'] = data_offset
+        index_record['length'] = len(run_data)
+
+        with open(self._index_path, 'ab') as index_file:
+            run_index = (index_file.tell() - self._file_header.size) // ARCHIVE_INDEX_DTYPE.itemsize
+            index_file.write(index_record.tobytes())
+
+        return run_index
+
+    def store_distribution_analyse(self, analyse, seed=None, engine='distribution'):
+        distributions = analyse.distributions
+        summary = {distribution_name + '_mean': distribution.get_mean()
+                   for distribution_name, distribution in distributions.items()}
+        return self.store(analyse.nb_dice, analyse.nb_turn, distributions['turn_score'].interval, seed, engine,
+                          distributions, summary)
+
+    def store_batch_engine(self, batch_engine):
+        summary = {'nb_game': batch_engine.nb_game_done, 'mean_game_nb_turn': batch_engine.mean_game_nb_turn}
+        for seat_index, choice_critter_value in enumerate(batch_engine.choice_critter_value_list):
+            summary['seat_' + str(seat_index) + '_choice_critter_value'] = choice_critter_value
+            summary['seat_' + str(seat_index) + '_win_rate'] = batch_engine.win_rate[seat_index]
+        return self.store(batch_engine.nb_dices, batch_engine.nb_game_done, 0, batch_engine.seed, 'batch', dict(),
+                          summary)
+
+    def query(self, ruleset=None, nb_dice=None, nb_turn=None, interval=None, seed=None, engine=None):
+        index = self.index
+        match = np.ones(len(index), dtype=bool)
+        for key_name, key_value in (('ruleset', ruleset), ('nb_dice', nb_dice), ('nb_turn', nb_turn),
+                                    ('interval', interval), ('seed', seed)):
+            if key_value is not None:
+                match &= index[key_name] == (self.archive_seed(key_value) if key_name == 'seed' else key_value)
+        if engine is not None:
+            match &= index['engine'] == engine.encode('ascii')
+        return np.flatnonzero(match)
+
+    def load(self, run_index):
+        run = self.load_histograms(run_index)
+        run['distributions'] = {distribution_name: OccurrenceDistribution.from_occurrence_dict(
+            interval, dict(zip(bucket_array.tolist(), occurrence_array.tolist())))
+            for distribution_name, (interval, bucket_array, occurrence_array) in run['distributions'].items()}
+        return run
+
+    def load_histograms(self, run_index):
+        index_record = self.index[run_index]
+        data = self._data_view()
+        data_offset = int(index_record['offset'])
+
+        # ----<Json header>---------------------------------------------------------------------------------------------
+        header_length, = self._data_header_length.unpack_from(data, data_offset)
+        data_offset += self._data_header_length.size
+        header = json.loads(bytes(data[data_offset:data_offset + header_length]).decode('utf-8'))
+        data_offset += header_length
+
+        # ----<Distributions read from the mapped file>-----------------------------------------------------------------
+        distributions = dict()
+        for distribution_header in header['distributions']:
+            nb_buckets = distribution_header['nb_buckets']
+            bucket_array = np.frombuffer(data, dtype='<i8', count=nb_buckets, offset=data_offset)
+            data_offset += 8 * nb_buckets
+            occurrence_array = np.frombuffer(data, dtype='<i8', count=nb_buckets, offset=data_offset)
+            data_offset += 8 * nb_buckets
+            distributions[distribution_header['name']] = (distribution_header['interval'], bucket_array,
+                                                          occurrence_array)
+
+        run_key = {key_name: index_record[key_name].item() for key_name in ('ruleset', 'nb_dice', 'nb_turn',
+                                                                              'interval', 'seed')}
+        run_key['engine'] = index_record['engine'].decode('ascii')
+        return {'key': run_key, 'summary': header['summary'], 'distributions': distributions}
 
 
 # ----------------------< Class generating excel file >---------------------------------------------------------------
@@ -1178,6 +5351,227 @@ class ExcelStatsGenerator:
         df.to_excel(r'C:\Users\thoma\Desktop\export_dataframe.xlsx', index=False, header=True)
 
 
+# ----------------------< Class generating html and markdown reports >--------------------------------------------------
+# constructor parameters :
+#   histograms                                   Histograms by name --> {name: (interval, bucket_array,
+#                                                   occurrence_array)}, buckets sorted in increasing order
+#   title                                        Title of the report (default->'Dice game report')
+#   run_info                                     Description of the run --> {name: value} (default->None)
+#
+# getters :
+#
+#   histograms()                                 Histograms by name
+#
+# public methods :
+#
+#   iter_report(report_format='html')            Report chunk by chunk, report_format 'html' or 'markdown'
+#   render(report_format='html')                 Whole report --> str
+#   export_report(path, report_format=None)      Write the report, format deduced from the extension when not
+#                                                   given (.md or .markdown --> markdown, else html)
+#
+# class methods :
+#
+#   from_distributions(distributions, title,     Report of OccurrenceDistribution by name (dict items sorted once)
+#       run_info)
+#   from_distribution_analyse(analyse, title)    Report of every distribution of a DiceGameDistributionAnalyse
+#   from_archive(archive, run_index, title)      Report of a DiceGameResultsArchive run, read from its mapped arrays
+#
+# static methods :
+#
+#   histogram_summary(interval, bucket_array,    Count, mean, max and REPORT_QUANTILES --> OrderedDict
+#       occurrence_array)
+#   bin_histogram(bucket_array,                  Merge the buckets in at most nb_bins bins of same value range
+#       occurrence_array, nb_bins)                   --> (bin_array, first_bucket_array, last_bucket_array,
+#                                                   occurrence_array) of the non empty bins
+#
+# The report is self-contained : a summary table, then for each distribution an inline SVG histogram and a table of
+# at most REPORT_TABLE_NB_ROWS rows (exact buckets when they fit, value ranges otherwise). Every step is a numpy pass
+# over the sorted bucket arrays and the output size is bounded by REPORT_TABLE_NB_ROWS and REPORT_SVG_WIDTH, so
+# rendering is linear in the number of buckets and the chunks are written without building the whole document.
+# ----------------------------------------------------------------------------------------------------------------------
+class ReportStatsGenerator:
+    _format_by_extension = {'.md': 'markdown', '.markdown': 'markdown', '.html': 'html', '.htm': 'html'}
+
+    def __init__(self, histograms, title='Dice game report', run_info=None):
+        self._histograms = histograms
+        self._title = title
+        self._run_info = run_info if run_info is not None else dict()
+
+    @property
+    def histograms(self):
+        return self._histograms
+
+    @classmethod
+    def from_distributions(cls, distributions, title='Dice game report', run_info=None):
+        histograms = dict()
+        for distribution_name, distribution in distributions.items():
+            occurrence_distribution = distribution.occurrence_distribution
+            bucket_array = np.fromiter(occurrence_distribution.keys(), dtype=np.int64,
+                                       count=len(occurrence_distribution))
+            occurrence_array = np.fromiter(occurrence_distribution.values(), dtype=np.int64,
+                                           count=len(occurrence_distribution))
+            order = np.argsort(bucket_array, kind='stable')
+            histograms[distribution_name] = (distribution.interval, bucket_array[order], occurrence_array[order])
+        return cls(histograms, title, run_info)
+
+    @classmethod
+    def from_distribution_analyse(cls, analyse, title='Dice game report'):
+        return cls.from_distributions(analyse.distributions, title, {'Nb Turns': analyse.nb_turn,
+                                                                     'Nb Dices': analyse.nb_dice})
+
+    @classmethod
+    def from_archive(cls, archive, run_index, title='Dice game report'):
+        run = archive.load_histograms(run_index)
+        run_info = dict(run['key'])
+        run_info.update(run['summary'])
+        return cls(run['distributions'], title, run_info)
+
+    @staticmethod
+    def histogram_summary(interval, bucket_array, occurrence_array):
+        summary = OrderedDict()
+        count = int(occurrence_array.sum())
+        summary['Count'] = count
+        summary['Mean'] = float(np.dot(bucket_array, occurrence_array)) * interval / count if count > 0 else 0
+        summary['Max'] = int(bucket_array[-1]) * interval if count > 0 else 0
+
+        # Same definition as OccurrenceDistribution.quantile : first bucket whose cumulative count reaches q
+        cumulative_array = np.cumsum(occurrence_array)
+        for q in REPORT_QUANTILES:
+            if count > 0:
+                position = int(np.searchsorted(cumulative_array, max(q * count, 1), side='left'))
+                summary['P' + format(q * 100, 'g')] = int(bucket_array[min(position, len(bucket_array) - 1)]) * interval
+            else:
+                summary['P' + format(q * 100, 'g')] = 0
+        return summary
+
+    @staticmethod
+    def bin_histogram(bucket_array, occurrence_array, nb_bins):
+        if len(bucket_array) == 0:
+            empty_array = np.zeros(0, dtype=np.int64)
+            return empty_array, empty_array, empty_array, empty_array
+
+        # Integer bin of each bucket, bins never narrower than one bucket
+        nb_positions = int(bucket_array[-1] - bucket_array[0]) + 1
+        nb_bins = min(nb_bins, nb_positions)
+        bin_array = (bucket_array - bucket_array[0]) * nb_bins // nb_positions
+
+        # Buckets are sorted, so each non empty bin is a run of consecutive buckets
+        bin_end_array = np.flatnonzero(np.diff(bin_array)) + 1
+        bin_start_array = np.concatenate(([0], bin_end_array))
+        return (bin_array[bin_start_array], bucket_array[bin_start_array],
+                bucket_array[np.append(bin_end_array - 1, len(bucket_array) - 1)],
+                np.add.reduceat(occurrence_array, bin_start_array))
+
+    def _table_rows(self, interval, bucket_array, occurrence_array):
+        # (value label, occurrence, share) of at most REPORT_TABLE_NB_ROWS rows
+        count = int(occurrence_array.sum())
+        if len(bucket_array) <= REPORT_TABLE_NB_ROWS:
+            label_list = [str(bucket * interval) for bucket in bucket_array.tolist()]
+            row_occurrence_array = occurrence_array
+        else:
+            _, first_bucket_array, last_bucket_array, row_occurrence_array = \
+                self.bin_histogram(bucket_array, occurrence_array, REPORT_TABLE_NB_ROWS)
+            label_list = [str(first_bucket * interval) if first_bucket == last_bucket else
+                          str(first_bucket * interval) + ' - ' + str(last_bucket * interval)
+                          for first_bucket, last_bucket in zip(first_bucket_array.tolist(),
+                                                               last_bucket_array.tolist())]
+        return [(label, occurrence, '{:.4%}'.format(occurrence / count))
+                for label, occurrence in zip(label_list, row_occurrence_array.tolist())]
+
+    def _svg_histogram(self, interval, bucket_array, occurrence_array):
+        if len(bucket_array) == 0:
+            return '<svg xmlns="http://www.w3.org/2000/svg" width="' + str(REPORT_SVG_WIDTH) + '" height="' + \
+                str(REPORT_SVG_HEIGHT) + '"><text x="4" y="16" font-size="12">No data</text></svg>'
+
+        bin_array, _, _, bin_occurrence_array = self.bin_histogram(bucket_array, occurrence_array,
+                                                                   REPORT_SVG_WIDTH)
+        nb_bins = min(REPORT_SVG_WIDTH, int(bucket_array[-1] - bucket_array[0]) + 1)
+        bar_width = REPORT_SVG_WIDTH / nb_bins
+        bar_height_array = bin_occurrence_array * (REPORT_SVG_HEIGHT / int(bin_occurrence_array.max()))
+
+        # A single path, one closed rectangle by non empty bin
+        path = ''.join('M{:.2f} {}v-{:.2f}h{:.2f}v{:.2f}z'.format(bin_index * bar_width, REPORT_SVG_HEIGHT,
+                                                                 bar_height, bar_width, bar_height)
+                       for bin_index, bar_height in zip(bin_array.tolist(), bar_height_array.tolist()))
+        total_height = REPORT_SVG_HEIGHT + 16
+        return ('<svg xmlns="http://www.w3.org/2000/svg" width="' + str(REPORT_SVG_WIDTH) + '" height="' +
+                str(total_height) + '" viewBox="0 0 ' + str(REPORT_SVG_WIDTH) + ' ' + str(total_height) + '">' +
+                '<path fill="#4472c4" d="' + path + '"/>' +
+                '<text x="0" y="' + str(total_height - 2) + '" font-size="12">' + str(int(bucket_array[0]) * interval)
+                + '</text><text x="' + str(REPORT_SVG_WIDTH) + '" y="' + str(total_height - 2) +
+                '" font-size="12" text-anchor="end">' + str(int(bucket_array[-1]) * interval) + '</text>' +
+                '<text x="' + str(REPORT_SVG_WIDTH) + '" y="12" font-size="12" text-anchor="end">max ' +
+                str(int(bin_occurrence_array.max())) + '</text></svg>')
+
+    def _iter_html(self):
+        def html_table(header_list, row_list):
+            return '<table>\n<tr>' + ''.join('<th>' + html.escape(str(header)) + '</th>' for header in header_list) + \
+                '</tr>\n' + ''.join('<tr>' + ''.join('<td>' + html.escape(str(cell)) + '</td>' for cell in row) +
+                                    '</tr>\n' for row in row_list) + '</table>\n'
+
+        yield ('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>' + html.escape(self._title) +
+               '</title>\n<style>body{font-family:sans-serif}table{border-collapse:collapse;margin:8px 0}'
+               'td,th{border:1px solid #bbb;padding:2px 8px;text-align:right}</style>\n</head>\n<body>\n<h1>' +
+               html.escape(self._title) + '</h1>\n')
+
+        if self._run_info:
+            yield html_table(['', 'Value'], self._run_info.items())
+
+        summary_list = [(distribution_name, self.histogram_summary(*histogram))
+                        for distribution_name, histogram in self._histograms.items()]
+        if summary_list:
+            yield html_table([''] + list(summary_list[0][1]),
+                             [[distribution_name] + ['{:g}'.format(value) for value in summary.values()]
+                              for distribution_name, summary in summary_list])
+
+        for distribution_name, histogram in self._histograms.items():
+            yield '<h2>' + html.escape(distribution_name) + '</h2>\n' + self._svg_histogram(*histogram) + '\n'
+            yield html_table(['Value', 'Occurrence', 'Share'], self._table_rows(*histogram))
+
+        yield '</body>\n</html>\n'
+
+    def _iter_markdown(self):
+        def markdown_table(header_list, row_list):
+            return '| ' + ' | '.join(str(header) for header in header_list) + ' |\n|' + \
+                '---:|' * len(header_list) + '\n' + ''.join('| ' + ' | '.join(str(cell) for cell in row) + ' |\n'
+                                                            for row in row_list) + '\n'
+
+        yield '# ' + self._title + '\n\n'
+
+        if self._run_info:
+            yield markdown_table(['', 'Value'], self._run_info.items())
+
+        summary_list = [(distribution_name, self.histogram_summary(*histogram))
+                        for distribution_name, histogram in self._histograms.items()]
+        if summary_list:
+            yield markdown_table([''] + list(summary_list[0][1]),
+                                 [[distribution_name] + ['{:g}'.format(value) for value in summary.values()]
+                                  for distribution_name, summary in summary_list])
+
+        for distribution_name, histogram in self._histograms.items():
+            yield '## ' + distribution_name + '\n\n' + self._svg_histogram(*histogram) + '\n\n'
+            yield markdown_table(['Value', 'Occurrence', 'Share'], self._table_rows(*histogram))
+
+    def iter_report(self, report_format='html'):
+        if report_format == 'html':
+            return self._iter_html()
+        elif report_format == 'markdown':
+            return self._iter_markdown()
+        else:
+            raise ValueError('unknown report format : ' + str(report_format))
+
+    def render(self, report_format='html'):
+        return ''.join(self.iter_report(report_format))
+
+    def export_report(self, path, report_format=None):
+        if report_format is None:
+            report_format = self._format_by_extension.get(os.path.splitext(path)[1].lower(), 'html')
+
+        with open(path, 'w', encoding='utf-8') as report_file:
+            for chunk in self.iter_report(report_format):
+                report_file.write(chunk)
+
+
 # ----------------------< Class defining a new struct  >---------------------------------------------------------------
 # constructor parameters :
 #   interval                                     Interval of the distribution
@@ -1191,11 +5585,29 @@ class ExcelStatsGenerator:
 # public methods :
 #
 #   push()                                      Push a new element in the dict
+#   merge(other)                                Add the occurrences of another distribution of same interval
+#                                                   --> self
+#   get_count()                                 Number of pushed elements
+#   cdf(value)                                  Share of the elements lower or equal to value
+#   survival(value)                             Share of the elements greater or equal to value
+#   range_count(low_value, high_value)          Number of elements between low_value and high_value included
+#   quantile(q)                                 Lowest bucket value whose cdf reaches q (0 <= q <= 1)
+#
+# class methods :
+#
+#   from_occurrence_dict                        New distribution from an existing {bucket index: occurrence} dict
+#       (interval, occurrence_distribution)
+#
+# An element counts for the upper bound of its bucket (bucket index * interval), as in get_max(). The queries use a
+# prefix sum index over the sorted buckets, rebuilt on the first query following a push() or a merge(), so each
+# query on a finished distribution costs O(log buckets). The occurrence_distribution dict must not be modified
+# directly once queried.
 # ----------------------------------------------------------------------------------------------------------------------
 class OccurrenceDistribution:
     def __init__(self, interval):
         self._interval = interval
         self._occurrence_distribution = dict()
+        self._prefix_index = None
 
     def __str__(self):
         return str(self._occurrence_distribution)
@@ -1210,21 +5622,75 @@ class OccurrenceDistribution:
 
     def push(self, value):
         value_occurrence_index = math.ceil(value / self._interval)
+        self._prefix_index = None
 
         if value_occurrence_index in self._occurrence_distribution:
             self._occurrence_distribution[value_occurrence_index] += 1
         else:
             self._occurrence_distribution[value_occurrence_index] = 1
 
+    def merge(self, other):
+        if other.interval != self._interval:
+            raise ValueError('cannot merge distributions of interval ' + str(self._interval) + ' and ' +
+                             str(other.interval))
+
+        for value_occurrence_index, occurrence in other.occurrence_distribution.items():
+            self._occurrence_distribution[value_occurrence_index] = \
+                self._occurrence_distribution.get(value_occurrence_index, 0) + occurrence
+        self._prefix_index = None
+        return self
+
+    def _get_prefix_index(self):
+        # (sorted bucket indexes, number of elements up to each of them included)
+        if self._prefix_index is None:
+            sorted_index_list = sorted(self._occurrence_distribution)
+            self._prefix_index = (sorted_index_list,
+                                  list(itertools.accumulate(self._occurrence_distribution[value_occurrence_index]
+                                                            for value_occurrence_index in sorted_index_list)))
+        return self._prefix_index
+
+    def _count_up_to_index(self, value_occurrence_index):
+        # Number of elements whose bucket index is lower or equal to value_occurrence_index
+        sorted_index_list, cumulative_count_list = self._get_prefix_index()
+        position = bisect.bisect_right(sorted_index_list, value_occurrence_index)
+        return cumulative_count_list[position - 1] if position > 0 else 0
+
+    def get_count(self):
+        cumulative_count_list = self._get_prefix_index()[1]
+        return cumulative_count_list[-1] if cumulative_count_list else 0
+
     def get_max(self):
-        sorted_occurrence_distribution = dict(sorted(self._occurrence_distribution.items()))
-        if len(sorted_occurrence_distribution.keys()) > 0:
-            max_key = list(sorted_occurrence_distribution.keys())[-1]
-            max_key_occurrence = sorted_occurrence_distribution.get(max_key)
-            return max_key * self._interval
+        sorted_index_list = self._get_prefix_index()[0]
+        if len(sorted_index_list) > 0:
+            return sorted_index_list[-1] * self._interval
         else:
             return 0
 
+    def cdf(self, value):
+        count = self.get_count()
+        return self._count_up_to_index(math.floor(value / self._interval)) / count if count > 0 else 0
+
+    def survival(self, value):
+        count = self.get_count()
+        return (count - self._count_up_to_index(math.ceil(value / self._interval) - 1)) / count if count > 0 else 0
+
+    def range_count(self, low_value, high_value):
+        if high_value < low_value:
+            return 0
+        return self._count_up_to_index(math.floor(high_value / self._interval)) - \
+            self._count_up_to_index(math.ceil(low_value / self._interval) - 1)
+
+    def quantile(self, q):
+        if not 0 <= q <= 1:
+            raise ValueError('quantile order must be between 0 and 1 : ' + str(q))
+
+        sorted_index_list, cumulative_count_list = self._get_prefix_index()
+        if not sorted_index_list:
+            return 0
+        # First bucket whose cumulative count reaches q of the elements, at least the first one
+        position = bisect.bisect_left(cumulative_count_list, max(q * cumulative_count_list[-1], 1))
+        return sorted_index_list[min(position, len(sorted_index_list) - 1)] * self._interval
+
     def get_mean(self):
         occurrence_value_sum = 0
         occurrence_count = 0
@@ -1237,28 +5703,420 @@ class OccurrenceDistribution:
         else:
             return 0
 
+    @classmethod
+    def from_occurrence_dict(cls, interval, occurrence_distribution):
+        distribution = cls(interval)
+        distribution._occurrence_distribution = dict(occurrence_distribution)
+        return distribution
+
+
+def default_distribution_factory(distribution_name, interval):
+    # Distribution factory used by the analyses when none is given
+    return OccurrenceDistribution(interval)
+
+
+# ----------------------< Class defining a high dynamic range distribution >--------------------------------------------
+# constructor parameters :
+#   interval                                     Resolution of the lowest values
+#   significant_digits                           Decimal digits kept on every value (default->HDR_SIGNIFICANT_DIGITS)
+#
+# getters :
+#
+#   significant_digits()                         Significant digits
+#   nb_exact_buckets()                           Number of values, in interval units, counted without rounding
+#
+# public methods :
+#
+#   push()                                      Push a new element, rounded up to its HDR bucket
+#   merge(other)                                Add the occurrences of another distribution of same interval,
+#                                                   rounded up to the buckets of this one --> self
+#
+# HDR style buckets : below nb_exact_buckets intervals the distribution is the same as an OccurrenceDistribution,
+# above the values are rounded up to a multiple of a power of two intervals keeping significant_digits, so the
+# number of buckets grows with the log of the values range instead of the range itself. The keys of the
+# occurrence_distribution dict stay values divided by interval, so every OccurrenceDistribution query, the archive
+# and the Excel export work unchanged.
+# ----------------------------------------------------------------------------------------------------------------------
+class HdrOccurrenceDistribution(OccurrenceDistribution):
+    def __init__(self, interval, significant_digits=HDR_SIGNIFICANT_DIGITS):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError('significant digits must be between 1 and 5 : ' + str(significant_digits))
+
+        super().__init__(interval)
+        self._significant_digits = significant_digits
+        # Smallest power of two of sub buckets giving a relative rounding error lower than 10^-significant_digits
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+
+    @property
+    def significant_digits(self):
+        return self._significant_digits
+
+    @property
+    def nb_exact_buckets(self):
+        return 1 << self._sub_bucket_bits
+
+    def _bucket_index(self, value_occurrence_index):
+        # Round up to a multiple of 2^shift, shift keeping sub_bucket_bits significant bits
+        shift = value_occurrence_index.bit_length() - self._sub_bucket_bits
+        if shift <= 0:
+            return value_occurrence_index
+        return -(-value_occurrence_index >> shift) << shift
+
+    def push(self, value):
+        value_occurrence_index = self._bucket_index(math.ceil(value / self._interval))
+        self._prefix_index = None
+
+        if value_occurrence_index in self._occurrence_distribution:
+            self._occurrence_distribution[value_occurrence_index] += 1
+        else:
+            self._occurrence_distribution[value_occurrence_index] = 1
+
+    def merge(self, other):
+        if other.interval != self._interval:
+            raise ValueError('cannot merge distributions of interval ' + str(self._interval) + ' and ' +
+                             str(other.interval))
+
+        for value_occurrence_index, occurrence in other.occurrence_distribution.items():
+            value_occurrence_index = self._bucket_index(value_occurrence_index)
+            self._occurrence_distribution[value_occurrence_index] = \
+                self._occurrence_distribution.get(value_occurrence_index, 0) + occurrence
+        self._prefix_index = None
+        return self
+
+
+def hdr_distribution_factory(distribution_name, interval, significant_digits=HDR_SIGNIFICANT_DIGITS):
+    # Distribution factory of HDR distributions, functools.partial() sets other significant digits
+    return HdrOccurrenceDistribution(interval, significant_digits)
+
+
+# ----------------------< Class defining a distribution written in shared memory >--------------------------------------
+# constructor parameters :
+#   interval                                     Interval of the distribution
+#   bucket_view                                  Fixed size view of int64 buckets (index 0 for value 0 ...)
+#   overflow_view                                One int64 view counting the values above the buckets range
+#
+# getters :
+#
+#   interval()                                   Interval
+#   nb_buckets()                                 Number of buckets
+#   nb_overflow()                                Number of values pushed above the buckets range
+#
+# public methods :
+#
+#   push()                                      Push a new element in the buckets, or in the overflow counter when
+#                                                   its bucket is out of range
+# ----------------------------------------------------------------------------------------------------------------------
+class SharedOccurrenceDistribution:
+    def __init__(self, interval, bucket_view, overflow_view):
+        self._interval = interval
+        self._bucket_view = bucket_view
+        self._overflow_view = overflow_view
+        self._nb_buckets = len(bucket_view)
+
+    @property
+    def interval(self):
+        return self._interval
+
+    @property
+    def nb_buckets(self):
+        return self._nb_buckets
+
+    @property
+    def nb_overflow(self):
+        return self._overflow_view[0]
+
+    def push(self, value):
+        value_occurrence_index = math.ceil(value / self._interval)
+
+        # Values above the buckets range are only counted, they would bias the max, mean and quantiles of a bucket
+        if value_occurrence_index >= self._nb_buckets:
+            self._overflow_view[0] += 1
+        else:
+            self._bucket_view[value_occurrence_index] += 1
+
+
+# ----------------------< Class handling shared memory distributions of a worker pool >---------------------------------
+# constructor parameters :
+#   nb_worker                                    Number of workers writing in the block
+#   interval                                     Interval of the score distributions
+#   nb_buckets                                   Number of buckets by distribution (default->SHARED_NB_BUCKETS)
+#   name                                         Name of an existing block to attach, a new block is created if None
+#
+# The block is a (nb_worker, nb distributions, nb_buckets + 1) int64 array, the last item of a slot counting the
+# values above the buckets range. Each worker only writes in its own slot so the parent can reduce the slots at any
+# time without lock.
+#
+# getters :
+#
+#   name()                                       Shared memory block name, used by the workers to attach the block
+#   nb_worker()                                  Number of workers
+#   interval()                                   Interval of the score distributions
+#   nb_buckets()                                 Number of buckets by distribution
+#
+# public methods :
+#
+#   worker_distribution_factory(worker_index)    Distribution factory writing in the worker slot
+#                                                   (distribution_factory of DiceGameDistributionAnalyse)
+#   snapshot()                                   Reduce all the worker slots --> {name: OccurrenceDistribution}
+#                                                   (without the values above the buckets range)
+#   overflow()                                   Number of values above the buckets range --> {name: number}
+#   nb_turn_done()                               Number of turns already pushed by all the workers
+#
+#   close()                                      Release the block for this process
+#   unlink()                                     Destroy the block (creator only, after close)
+# ----------------------------------------------------------------------------------------------------------------------
+class SharedDistributionBlock:
+    _distribution_names = DiceGameDistributionAnalyse.distribution_names
+
+    def __init__(self, nb_worker, interval, nb_buckets=SHARED_NB_BUCKETS, name=None):
+        self._nb_worker = nb_worker
+        self._interval = interval
+        self._nb_buckets = nb_buckets
+
+        nb_item = nb_worker * len(self._distribution_names) * (nb_buckets + 1)
+        if name is None:
+            self._shared_memory = shared_memory.SharedMemory(create=True, size=nb_item * SHARED_BUCKET_SIZE)
+            self._shared_memory.buf[:nb_item * SHARED_BUCKET_SIZE] = bytes(nb_item * SHARED_BUCKET_SIZE)
+        else:
+            self._shared_memory = shared_memory.SharedMemory(name=name)
 
-game_target_score = 5000
-game_players_names_list = ['Stéphane', 'Romain', 'François', 'Isabelle', 'Christophe', 'Laurent', "Sylvie"]
+        self._bucket_view = self._shared_memory.buf[:nb_item * SHARED_BUCKET_SIZE].cast('q')
+        self._worker_bucket_view_list = []
 
-#       - Random (50/50) choice             (_choice_critter_value == 0)
-#       - Turn score threshold              (_choice_critter_value > 0)
-#       - Remaining dice to roll threshold  (_choice_critter_value < 0)
-game_choice_critter_value = 0
+    @property
+    def name(self):
+        return self._shared_memory.name
+
+    @property
+    def nb_worker(self):
+        return self._nb_worker
+
+    @property
+    def interval(self):
+        return self._interval
 
-# dice_controller = DiceGameController(
-#   game_players_names_list,
-#   nb_dices=5,
-#   target_score=game_target_score,
-#   verbose=True, interactive=False,
-#   choice_critter_value=game_choice_critter_value)
+    @property
+    def nb_buckets(self):
+        return self._nb_buckets
+
+    def _bucket_array(self):
+        return np.frombuffer(self._bucket_view, dtype=np.int64).reshape(
+            (self._nb_worker, len(self._distribution_names), self._nb_buckets + 1))
+
+    def worker_distribution_factory(self, worker_index):
+        def distribution_factory(distribution_name, interval):
+            distribution_index = self._distribution_names.index(distribution_name)
+            bucket_from = (worker_index * len(self._distribution_names) + distribution_index) * (self._nb_buckets + 1)
+            overflow_from = bucket_from + self._nb_buckets
+
+            worker_bucket_view = self._bucket_view[bucket_from:overflow_from]
+            worker_overflow_view = self._bucket_view[overflow_from:overflow_from + 1]
+            self._worker_bucket_view_list += [worker_bucket_view, worker_overflow_view]
+            return SharedOccurrenceDistribution(interval, worker_bucket_view, worker_overflow_view)
+
+        return distribution_factory
+
+    def snapshot(self):
+        # Sum of a copy of all the worker slots, the workers can still be running
+        bucket_sum_array = self._bucket_array()[:, :, :self._nb_buckets].sum(axis=0)
+
+        distribution_dict = dict()
+        for distribution_index, distribution_name in enumerate(self._distribution_names):
+            bucket_sum = bucket_sum_array[distribution_index]
+            non_empty_index_array = np.flatnonzero(bucket_sum)
+            distribution_dict[distribution_name] = OccurrenceDistribution.from_occurrence_dict(
+                DiceGameDistributionAnalyse.distribution_interval(distribution_name, self._interval),
+                zip(non_empty_index_array.tolist(), bucket_sum[non_empty_index_array].tolist()))
+
+        return distribution_dict
+
+    def overflow(self):
+        overflow_sum_array = self._bucket_array()[:, :, self._nb_buckets].sum(axis=0)
+        return dict(zip(self._distribution_names, overflow_sum_array.tolist()))
+
+    def nb_turn_done(self):
+        # Each turn pushes exactly one turn score, in the buckets or in the overflow counter
+        turn_score_index = self._distribution_names.index('turn_score')
+        return int(self._bucket_array()[:, turn_score_index, :].sum())
+
+    def close(self):
+        for worker_bucket_view in self._worker_bucket_view_list:
+            worker_bucket_view.release()
+        self._worker_bucket_view_list = []
+        self._bucket_view.release()
+        self._shared_memory.close()
+
+    def unlink(self):
+        self._shared_memory.unlink()
+
+
+def _shared_distribution_worker(block_name, nb_worker, interval, nb_buckets, worker_index, nb_turn, nb_dice, seed):
+    # Executor work unit : run a distribution analyse writing directly in its slot of the shared block
+    block = SharedDistributionBlock(nb_worker, interval, nb_buckets, name=block_name)
+    try:
+        distribution_statistics = DiceGameDistributionAnalyse(
+            nb_turn, interval, nb_dice, distribution_factory=block.worker_distribution_factory(worker_index),
+            rng=DiceGameExecutor.work_unit_rng(seed, worker_index))
+        distribution_statistics.launch_analyse()
+    finally:
+        # Releases the bucket views of the worker distributions before closing, even when the analyse failed
+        block.close()
+
+
+# ----------------------< Class handling multi-process distribution analyse >-------------------------------------------
+# constructor parameters :
+#   nb_turn                                      Total number of turns, split between the workers
+#   interval                                     Interval of the score distributions
+#   nb_dice                                      Total number of dices in the game set (default->DEFAULT_DICES_NB)
+#   nb_worker                                    Number of worker processes (default->os.cpu_count())
+#   nb_buckets                                   Number of buckets by distribution (default->SHARED_NB_BUCKETS)
+#   seed                                         Seed of the workers random generators (default->None)
+#   executor                                     DiceGameExecutor running the workers (default->process backend with
+#                                                   nb_worker workers)
+#
+# getters :
+#
+#   nb_turn()                                    Total number of turns
+#   nb_turn_done()                               Number of turns done by all the workers up to now
+#   overflow()                                   Number of values above the buckets range up to now
+#                                                   --> {name: number}
+#
+# public methods :
+#
+#   start()                                      Start the workers
+#   snapshot()                                   Live reduce of the workers distributions
+#                                                   --> {name: OccurrenceDistribution}
+#   join()                                       Wait for the workers, reduce and release the shared block (also
+#                                                   released when a worker fails)
+#                                                   --> DiceGameDistributionAnalyse with the reduced distributions
+#                                                   Raise ValueError when values were above the buckets range
+#   launch_analyse(progress_reporter=None)       start() then join(), reporting the progress to a
+#                                                   DiceGameProgressReporter if given
+# ----------------------------------------------------------------------------------------------------------------------
+class DiceGameSharedDistributionAnalyse:
+    def __init__(self, nb_turn, interval, nb_dice=DEFAULT_DICES_NB, nb_worker=None, nb_buckets=SHARED_NB_BUCKETS,
+                 seed=None, executor=None):
+        self._nb_turn = nb_turn
+        self._interval = interval
+        self._nb_dice = nb_dice
+        self._nb_worker = nb_worker if nb_worker is not None else os.cpu_count()
+        self._nb_buckets = nb_buckets
+        self._seed = seed
+        self._executor = executor
 
-# dice_controller.run_full_game()
+        self._block = None
+        self._overflow = dict()
+        self._running_executor = None
+        self._worker_future_list = []
 
-nb_turn = 10000000
-dice_distribution_statistics = DiceGameDistributionAnalyse(nb_turn, 50, 5)
+    @property
+    def nb_turn(self):
+        return self._nb_turn
 
-dice_distribution_statistics.launch_analyse()
+    @property
+    def nb_turn_done(self):
+        return self._block.nb_turn_done() if self._block is not None else 0
 
-excel = ExcelStatsGenerator(dice_distribution_statistics)
-excel.export_excel()
+    @property
+    def overflow(self):
+        return self._block.overflow() if self._block is not None else self._overflow
+
+    def start(self):
+        self._block = SharedDistributionBlock(self._nb_worker, self._interval, self._nb_buckets)
+
+        try:
+            self._running_executor = self._executor if self._executor is not None else \
+                DiceGameExecutor('process', self._nb_worker)
+
+            # Split the turns between the workers, the first ones taking the remainder
+            for worker_index, worker_nb_turn in enumerate(DiceGameExecutor.split(self._nb_turn, self._nb_worker)):
+                self._worker_future_list.append(self._running_executor.submit(
+                    _shared_distribution_worker, self._block.name, self._nb_worker, self._interval,
+                    self._nb_buckets, worker_index, worker_nb_turn, self._nb_dice, self._seed))
+        except BaseException:
+            self._release()
+            raise
+
+    def snapshot(self):
+        return self._block.snapshot()
+
+    def _wait_workers(self):
+        # Raise the first worker error if any
+        for worker_future in self._worker_future_list:
+            worker_future.result()
+
+    def _release(self):
+        # Stop the owned executor and destroy the shared block, whatever the workers outcome
+        try:
+            self._worker_future_list = []
+            if self._executor is None and self._running_executor is not None:
+                self._running_executor.shutdown()
+            self._running_executor = None
+        finally:
+            if self._block is not None:
+                self._block.close()
+                self._block.unlink()
+                self._block = None
+
+    def join(self):
+        try:
+            self._wait_workers()
+            distribution_dict = self._block.snapshot()
+            self._overflow = self._block.overflow()
+        finally:
+            self._release()
+
+        overflow_list = [distribution_name + ' ' + str(nb_overflow)
+                         for distribution_name, nb_overflow in self._overflow.items() if nb_overflow > 0]
+        if overflow_list:
+            raise ValueError('values above the ' + str(self._nb_buckets) + ' buckets range (' +
+                             ', '.join(overflow_list) + '), use more buckets or a larger interval')
+
+        return DiceGameDistributionAnalyse(
+            self._nb_turn, self._interval, self._nb_dice,
+            distribution_factory=lambda distribution_name, interval: distribution_dict[distribution_name])
+
+    def launch_analyse(self, progress_reporter=None):
+        self.start()
+        if progress_reporter is None:
+            return self.join()
+
+        # The reporter is stopped once the workers are done, before join() releases the shared memory
+        progress_reporter.start(lambda: (self.nb_turn_done, self.snapshot()['turn_score'].get_mean()))
+        try:
+            try:
+                self._wait_workers()
+            finally:
+                progress_reporter.stop()
+        except BaseException:
+            self._release()
+            raise
+
+        return self.join()
+
+
+if __name__ == '__main__':
+    game_target_score = 5000
+    game_players_names_list = ['Stéphane', 'Romain', 'François', 'Isabelle', 'Christophe', 'Laurent', "Sylvie"]
+
+    #       - Random (50/50) choice             (_choice_critter_value == 0)
+    #       - Turn score threshold              (_choice_critter_value > 0)
+    #       - Remaining dice to roll threshold  (_choice_critter_value < 0)
+    game_choice_critter_value = 0
+
+    # dice_controller = DiceGameController(
+    #   game_players_names_list,
+    #   nb_dices=5,
+    #   target_score=game_target_score,
+    #   verbose=True, interactive=False,
+    #   choice_critter_value=game_choice_critter_value)
+
+    # dice_controller.run_full_game()
+
+    nb_turn = 10000000
+    dice_distribution_statistics = DiceGameDistributionAnalyse(nb_turn, 50, 5)
+
+    dice_distribution_statistics.launch_analyse()
+
+    excel = ExcelStatsGenerator(dice_distribution_statistics)
+    excel.export_excel()